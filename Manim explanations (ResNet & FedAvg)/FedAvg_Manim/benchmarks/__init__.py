@@ -0,0 +1 @@
+"""Benchmarks for the FedAvg engine; run each with ``python -m benchmarks.<name>``."""
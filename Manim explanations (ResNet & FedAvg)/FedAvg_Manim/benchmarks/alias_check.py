@@ -0,0 +1,58 @@
+# alias_check.py
+"""Check that ``AliasTable`` draws every client with probability w_k / sum(w).
+
+    python -m benchmarks.alias_check --trials 50 --tolerance 1e-12
+
+For each trial the table is built from several kinds of random weights:
+small integers (like n_k), uniform floats, heavy-tailed Pareto weights and
+weights with many zeros. The draw probabilities implied by the table,
+prob / K plus (1 - prob) / K at every alias, are compared with
+w / sum(w). The largest absolute difference is printed for each kind of
+weights and K. The script exits with status 1 if any difference is above
+``--tolerance``.
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from fedavg_engine import AliasTable
+
+KINDS = {
+    "integers": lambda rng, k: rng.integers(1, 100, k).astype(np.float64),
+    "uniform": lambda rng, k: rng.random(k),
+    "pareto": lambda rng, k: rng.pareto(1.0, k),
+    "sparse": lambda rng, k: np.where(rng.random(k) < 0.3, 0.0, rng.random(k)),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[50, 1000, 100_000])
+    parser.add_argument("--trials", type=int, default=50)
+    parser.add_argument("--tolerance", type=float, default=1e-12)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    failed = False
+    print(f"{'weights':>10s}{'K':>9s}{'max error':>12s}")
+    for name, make in KINDS.items():
+        for k in args.clients:
+            worst = 0.0
+            for _ in range(args.trials):
+                weights = make(rng, k)
+                if not weights.sum() > 0:
+                    continue
+                target = weights / weights.sum()
+                implied = AliasTable(weights).probabilities()
+                worst = max(worst, np.abs(implied - target).max())
+            failed |= worst > args.tolerance
+            print(f"{name:>10s}{k:>9d}{worst:>12.1e}")
+    print("FAILED" if failed else f"all errors below {args.tolerance:g}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
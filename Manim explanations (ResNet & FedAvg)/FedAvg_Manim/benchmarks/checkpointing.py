@@ -0,0 +1,77 @@
+# checkpointing.py
+"""Checkpoint write time as a fraction of round time, and a resume check.
+
+Runs T rounds straight, then the same run interrupted halfway and resumed
+from its last checkpoint, and verifies the final weights are bit-identical.
+
+    python -m benchmarks.checkpointing --features 512 --rounds 20
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from fedavg_engine import (
+    Checkpointer,
+    ClientDatasetStore,
+    FedAvg,
+    LocalSGD,
+    ServerAdam,
+    SoftmaxRegression,
+    dirichlet_partition,
+    synthetic_classification,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--features", type=int, default=512)
+    parser.add_argument("--classes", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--every", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    features, labels = synthetic_classification(
+        50 * args.clients, args.features, args.classes, seed=args.seed
+    )
+    assignment = dirichlet_partition(labels, args.clients, 0.5, seed=args.seed)
+    model = SoftmaxRegression(args.features, args.classes)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ClientDatasetStore.create(
+            root + "/data", features, labels, assignment, num_clients=args.clients
+        )
+
+        def make_engine():
+            return FedAvg(
+                model, store, fraction=0.1, trainer=LocalSGD(model, epochs=2),
+                server_optimizer=ServerAdam(), seed=args.seed,
+            )
+
+        reference = make_engine()
+        start = time.perf_counter()
+        reference.run(args.rounds)
+        round_seconds = (time.perf_counter() - start) / args.rounds
+
+        checkpointer = Checkpointer(root + "/ckpt", every=args.every)
+        interrupted = make_engine()
+        interrupted.run(args.rounds // 2, checkpointer=checkpointer)
+        resumed = make_engine()
+        restored = checkpointer.restore(resumed)
+        resumed.run(args.rounds, checkpointer=checkpointer)
+
+    write = np.mean(checkpointer.write_seconds)
+    print(f"parameters:        {model.num_params}")
+    print(f"round time:        {round_seconds * 1e3:.2f} ms")
+    print(f"checkpoint write:  {write * 1e3:.2f} ms "
+          f"({write / (args.every * round_seconds):.1%} of {args.every} rounds)")
+    print(f"resumed at round:  {restored}")
+    print(f"bit-exact resume:  {np.array_equal(reference.weights, resumed.weights)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# coordinator_load.py
+"""Upload latency and aggregation throughput of the localhost FedAvg coordinator.
+
+    python -m benchmarks.coordinator_load --per-round 2000 --params 100000 --connections 64
+
+The coordinator runs in its own process. An asyncio load generator then
+plays every selected client of ``--rounds`` rounds concurrently: thousands
+of client coroutines share ``--connections`` pooled keep-alive connections.
+Each client downloads w^t (unless ``--no-download``) and uploads a binary
+update frame. Upload latency is measured from the moment a client starts
+its upload request, including any wait for a pooled connection, until the
+coordinator's reply.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+import numpy as np
+
+from fedavg_engine import ConnectionPool, Coordinator, serve, wire
+from fedavg_engine.coordinator import ROUND
+
+
+def run_coordinator(args, ready):
+    coordinator = Coordinator(np.zeros(args.params, dtype=np.float32), args.clients,
+                              args.per_round, seed=args.seed)
+
+    async def main():
+        server = await serve(coordinator, args.host, args.port)
+        ready.set()
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def generate_load(args):
+    pool = ConnectionPool(args.host, args.port, size=args.connections)
+    rng = np.random.default_rng(args.seed)
+    delta = rng.normal(0.0, 0.01, args.params).astype(np.float32)
+    latencies = []
+
+    async def client(round_, k):
+        if not args.no_download:
+            await pool.request("GET", "/model")
+        frame = wire.encode(round_, delta, client=k, num_samples=int(rng.integers(50, 500)))
+        start = time.perf_counter()
+        status, body = await pool.request("POST", "/update", frame)
+        latencies.append(time.perf_counter() - start)
+        if status != 200:
+            raise RuntimeError(f"client {k}: {status} {body.decode()}")
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        _, body = await pool.request("GET", "/round")
+        round_, m = ROUND.unpack_from(body)
+        selected = np.frombuffer(body, dtype="<u8", count=m, offset=ROUND.size)
+        await asyncio.gather(*(client(round_, k) for k in selected.tolist()))
+    elapsed = time.perf_counter() - start
+    _, body = await pool.request("GET", "/stats")
+    await pool.close()
+    return np.array(latencies), elapsed, json.loads(body), pool.opened
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--params", type=int, default=100_000)
+    parser.add_argument("--clients", type=int, default=100_000, help="client population K")
+    parser.add_argument("--per-round", type=int, default=2000, help="clients per round m")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--no-download", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=run_coordinator, args=(args, ready), daemon=True)
+    server.start()
+    try:
+        if not ready.wait(30):
+            raise RuntimeError("coordinator did not start")
+        latencies, elapsed, stats, opened = asyncio.run(generate_load(args))
+    finally:
+        server.terminate()
+        server.join()
+
+    updates = stats["updates"]
+    mb = stats["bytes_received"] / 1e6
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    print(f"{args.rounds} rounds x {args.per_round} concurrent clients, P = {args.params} "
+          f"float32, {opened} pooled connections")
+    print(f"upload latency   p50 {p50:8.2f} ms   p99 {p99:8.2f} ms")
+    print(f"end to end       {updates / elapsed:8.0f} updates/s   {mb / elapsed:8.1f} MB/s")
+    print(f"aggregation      {updates / stats['aggregate_seconds']:8.0f} updates/s   "
+          f"{stats['aggregate_seconds'] / stats['rounds'] * 1e3:8.1f} ms per round")
+    print(f"rounds completed {stats['rounds']}, rejected {stats['rejected']}")
+
+
+if __name__ == "__main__":
+    main()
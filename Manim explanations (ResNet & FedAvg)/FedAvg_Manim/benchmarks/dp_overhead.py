@@ -0,0 +1,72 @@
+# dp_overhead.py
+"""Per-round cost of the DP-FedAvg stage at large client counts.
+
+For each (clients per round m, model size P) the same update matrix is
+aggregated once with the plain weighted average and once through
+``DPAggregation``. The DP time is split into clipping, averaging, noise
+and accounting. The accountant's first round computes the RDP curve;
+later rounds reuse the cached curve and pay only for one vector add and
+the epsilon conversion. Both costs are reported.
+
+    python -m benchmarks.dp_overhead --clients 1000 10000 --params 1000 10000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from fedavg_engine import DPAggregation, WeightedAverage
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--params", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--population", type=int, default=1_000_000)
+    parser.add_argument("--clip", type=float, default=1.0)
+    parser.add_argument("--noise", type=float, default=1.0)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(
+        f"{'m':>7}{'P':>8}{'plain ms':>10}{'clip ms':>9}{'noise ms':>10}"
+        f"{'acct first':>12}{'acct ms':>9}{'vs plain':>10}{'eps':>8}"
+    )
+    for m in args.clients:
+        for p in args.params:
+            source = rng.normal(0.0, 0.02, (m, p)).astype(np.float32)
+            weights = rng.integers(50, 500, m).astype(np.float64)
+            updates = np.empty_like(source)
+
+            plain = []
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                WeightedAverage().aggregate(source, weights)
+                plain.append(time.perf_counter() - start)
+
+            dp = DPAggregation(args.clip, args.noise, args.population, seed=args.seed)
+            rows = []
+            for _ in range(args.rounds):
+                updates[:] = source  # the engine refills its buffer every round
+                dp.aggregate(updates, weights)
+                rows.append(dp.last_round)
+
+            plain_s = np.median(plain)
+            later = rows[1:] or rows
+            clip = np.median([r["clip_seconds"] for r in later])
+            noise = np.median([r["noise_seconds"] for r in later])
+            accounting = np.median([r["accounting_seconds"] for r in later])
+            average = np.median([r["aggregate_seconds"] for r in later])
+            overhead = (clip + average + noise + accounting) / plain_s - 1
+            print(
+                f"{m:>7}{p:>8}{plain_s * 1e3:>10.2f}{clip * 1e3:>9.2f}{noise * 1e3:>10.3f}"
+                f"{rows[0]['accounting_seconds'] * 1e3:>12.2f}{accounting * 1e3:>9.3f}"
+                f"{overhead:>+10.0%}{rows[-1]['epsilon']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
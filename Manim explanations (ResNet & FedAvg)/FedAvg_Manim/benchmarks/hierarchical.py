@@ -0,0 +1,68 @@
+# hierarchical.py
+"""Server CPU and bytes received: flat FedAvg vs edge-aggregator topologies.
+
+For each number of clients per round m, the same update matrix is first
+aggregated by flat FedAvg, the engine's ``WeightedAverage`` on a single
+server (row ``flat``), and then with every topology in ``--topologies``.
+Topologies are given as fanouts, e.g. ``32`` (32 edges) or ``64x8`` (64
+edges under 8 regions); ``direct`` is the fixed-point stage with every
+client reporting to the server. Each topology's server CPU is reported
+relative to flat FedAvg. Every result is checked to be bit-identical to
+the direct fixed-point sum, and its distance to ``WeightedAverage`` is
+reported.
+
+    python -m benchmarks.hierarchical --clients 1000 5000 --params 10000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from fedavg_engine import HierarchicalAggregation, WeightedAverage
+
+
+def parse_fanout(text):
+    return () if text == "direct" else tuple(int(f) for f in text.split("x"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--params", type=int, default=10_000)
+    parser.add_argument("--topologies", nargs="+", default=["32", "128", "64x8"])
+    parser.add_argument("--population", type=int, default=1_000_000,
+                        help="client ids are drawn from this many clients")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"P = {args.params} float32 parameters")
+    print(f"{'m':>6}{'topology':>10}{'fan-in':>8}{'server ms':>11}{'server MB':>11}"
+          f"{'vs flat':>9}{'edge ms/node':>14}{'exact':>7}{'error':>10}")
+    for m in args.clients:
+        updates = rng.normal(0.0, 0.01, (m, args.params)).astype(np.float32)
+        weights = rng.integers(50, 500, m).astype(np.float64)
+        clients = rng.choice(args.population, m, replace=False)
+        start = time.perf_counter()
+        reference = WeightedAverage().aggregate(updates, weights)
+        flat_seconds = time.perf_counter() - start
+        print(f"{m:>6}{'flat':>10}{m:>8}{flat_seconds * 1e3:>11.2f}"
+              f"{m * (args.params * 4 + 8) / 1e6:>11.1f}{1:>9.2f}{'':>14}{'-':>7}{'-':>10}")
+        direct = HierarchicalAggregation(()).aggregate(updates, weights, clients)
+        for name in args.topologies:
+            fanout = parse_fanout(name)
+            aggregator = HierarchicalAggregation(fanout)
+            delta = aggregator.aggregate(updates, weights, clients)
+            report = aggregator.last_round
+            edge = (report["tier_cpu_seconds"][0] / fanout[0] * 1e3) if fanout else 0.0
+            exact = "yes" if np.array_equal(delta, direct) else "NO"
+            print(f"{m:>6}{name:>10}{report['server_fan_in']:>8}"
+                  f"{report['server_cpu_seconds'] * 1e3:>11.2f}"
+                  f"{report['server_bytes_received'] / 1e6:>11.1f}"
+                  f"{report['server_cpu_seconds'] / flat_seconds:>9.2f}{edge:>14.3f}{exact:>7}"
+                  f"{np.abs(delta - reference).max():>10.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# server_optimizers.py
+"""Rounds-to-target-accuracy for FedAvg vs. server-side optimizers.
+
+Every optimizer runs on the same seeded trace: same non-IID Dirichlet split,
+same client selection each round and same local shuffling, so the only
+difference between rows is the aggregation stage.
+
+    python -m benchmarks.server_optimizers --rounds 300 --target 0.7
+"""
+
+import argparse
+import tempfile
+import time
+
+from fedavg_engine import (
+    ClientDatasetStore,
+    FedAvg,
+    LocalSGD,
+    ServerAdam,
+    ServerMomentum,
+    ServerSGD,
+    ServerYogi,
+    SoftmaxRegression,
+    dirichlet_partition,
+    synthetic_classification,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--fraction", type=float, default=0.05)
+    parser.add_argument("--alpha", type=float, default=0.1, help="Dirichlet concentration")
+    parser.add_argument("--rounds", type=int, default=300)
+    parser.add_argument("--target", type=float, default=0.7)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--lr", type=float, default=0.002, help="client learning rate")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    features, labels = synthetic_classification(24000, 32, 10, seed=args.seed, noise=2.5)
+    test = (features[20000:], labels[20000:])
+    features, labels = features[:20000], labels[:20000]
+    assignment = dirichlet_partition(labels, args.clients, args.alpha, seed=args.seed)
+    model = SoftmaxRegression(32, 10)
+
+    optimizers = {
+        "FedAvg": lambda: ServerSGD(),
+        "FedAvgM": lambda: ServerMomentum(lr=1.0, momentum=0.9),
+        "FedAdam": lambda: ServerAdam(lr=0.01),
+        "FedYogi": lambda: ServerYogi(lr=0.01),
+    }
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ClientDatasetStore.create(
+            root, features, labels, assignment, num_clients=args.clients
+        )
+        print(f"{'optimizer':<10}{'rounds to target':>18}{'final acc':>11}{'sec':>8}")
+        for name, make in optimizers.items():
+            engine = FedAvg(
+                model,
+                store,
+                fraction=args.fraction,
+                trainer=LocalSGD(model, epochs=args.epochs, lr=args.lr),
+                server_optimizer=make(),
+                seed=args.seed,
+            )
+            start = time.perf_counter()
+            history = engine.run(args.rounds, eval_data=test, target_accuracy=args.target)
+            elapsed = time.perf_counter() - start
+            final = history[-1]["accuracy"]
+            reached = str(len(history)) if final >= args.target else f">{args.rounds}"
+            print(f"{name:<10}{reached:>18}{final:>11.3f}{elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
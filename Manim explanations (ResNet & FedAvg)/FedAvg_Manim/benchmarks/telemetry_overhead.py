@@ -0,0 +1,63 @@
+# telemetry_overhead.py
+"""Telemetry cost as a fraction of round time, with every sink enabled.
+
+    python -m benchmarks.telemetry_overhead --features 256 --rounds 100
+"""
+
+import argparse
+import os
+import tempfile
+
+from fedavg_engine import (
+    ClientDatasetStore,
+    CSVSink,
+    FedAvg,
+    JSONLinesSink,
+    LocalSGD,
+    PrometheusExporter,
+    SoftmaxRegression,
+    Telemetry,
+    dirichlet_partition,
+    synthetic_classification,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--features", type=int, default=256)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    features, labels = synthetic_classification(
+        100 * args.clients, args.features, 10, seed=args.seed
+    )
+    assignment = dirichlet_partition(labels, args.clients, 0.5, seed=args.seed)
+    model = SoftmaxRegression(args.features, 10)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ClientDatasetStore.create(
+            os.path.join(root, "data"), features, labels, assignment, num_clients=args.clients
+        )
+        telemetry = Telemetry([
+            CSVSink(os.path.join(root, "metrics.csv")),
+            JSONLinesSink(os.path.join(root, "metrics.jsonl")),
+            PrometheusExporter(port=0),
+        ])
+        engine = FedAvg(
+            model, store, fraction=0.1,
+            trainer=LocalSGD(model, epochs=args.epochs), seed=args.seed,
+        )
+        engine.run(args.rounds, eval_data=(features[:5000], labels[:5000]), telemetry=telemetry)
+        telemetry.close()
+
+    rounds = len(telemetry.buffer)
+    print(f"mean round time:     {telemetry.round_seconds / rounds * 1e3:.2f} ms")
+    print(f"telemetry per round: {telemetry.seconds / rounds * 1e6:.1f} us")
+    print(f"overhead:            {telemetry.overhead():.3%}")
+
+
+if __name__ == "__main__":
+    main()
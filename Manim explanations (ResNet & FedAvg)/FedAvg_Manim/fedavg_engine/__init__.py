@@ -0,0 +1,48 @@
+"""NumPy simulation engine behind the FedAvg animation."""
+
+from .checkpoint import Checkpointer, load_weights
+from .coordinator import ConnectionPool, Coordinator, serve
+from .data import (
+    ClientDatasetStore,
+    ClientShard,
+    dirichlet_partition,
+    iid_partition,
+    synthetic_classification,
+    synthetic_images,
+)
+from .engine import FedAvg, LocalSGD, WeightedAverage
+from .hierarchy import HierarchicalAggregation
+from .models import SoftmaxRegression
+from .privacy import (
+    DPAggregation,
+    RDPAccountant,
+    clip_updates,
+    noise_multiplier_for,
+    sampled_gaussian_rdp,
+)
+from .resnet_client import ResNetClassifier, Workspace
+from .sampling import (
+    AliasTable,
+    FenwickTree,
+    ImportanceSampler,
+    RoundRobinSampler,
+    UniformSampler,
+    make_sampler,
+    num_selected,
+)
+from .secure_agg import SecureAggregation
+from .server_opt import (
+    ServerAdam,
+    ServerMomentum,
+    ServerSGD,
+    ServerYogi,
+    make_server_optimizer,
+)
+from .telemetry import (
+    CSVSink,
+    JSONLinesSink,
+    PrometheusExporter,
+    RingBuffer,
+    Telemetry,
+)
+from . import wire
@@ -0,0 +1,127 @@
+# checkpoint.py
+"""Round-level checkpoints for long FedAvg runs.
+
+A checkpoint is a directory ``round-000120/`` holding
+
+* ``weights.npy`` - the global model w^t, loadable with ``mmap_mode="r"``
+* ``state.pkl``   - round counter, metrics history, and the sampler,
+                    aggregator and server optimizer objects with their RNG
+                    and optimizer state
+
+It is written to a hidden temporary directory, fsynced and renamed into
+place, then the ``LATEST`` pointer is swapped with ``os.replace``. A crash at
+any point leaves the previous checkpoint intact, and resuming from one
+reproduces the uninterrupted run bit for bit.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+WEIGHTS_FILE = "weights.npy"
+STATE_FILE = "state.pkl"
+LATEST_FILE = "LATEST"
+
+
+def _fsync(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def load_weights(path, mmap=True):
+    """Global weights of the checkpoint at ``path``, memory-mapped by default."""
+    return np.load(os.path.join(path, WEIGHTS_FILE), mmap_mode="r" if mmap else None)
+
+
+class Checkpointer:
+    """Saves a ``FedAvg`` engine every ``every`` rounds, keeping the last ``keep``."""
+
+    def __init__(self, directory, every=10, keep=2, fsync=True):
+        if every < 1 or keep < 1:
+            raise ValueError("every and keep must be at least 1")
+        self.directory = directory
+        self.every = every
+        self.keep = keep
+        self.fsync = fsync
+        self.write_seconds = []
+        os.makedirs(directory, exist_ok=True)
+
+    def maybe_save(self, engine):
+        if engine.round % self.every == 0:
+            return self.save(engine)
+        return None
+
+    def save(self, engine):
+        start = time.perf_counter()
+        name = f"round-{engine.round:06d}"
+        final = os.path.join(self.directory, name)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+        try:
+            np.save(os.path.join(tmp, WEIGHTS_FILE), engine.weights)
+            with open(os.path.join(tmp, STATE_FILE), "wb") as f:
+                pickle.dump(engine.state_dict(), f, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.fsync:
+                for filename in (WEIGHTS_FILE, STATE_FILE):
+                    _fsync(os.path.join(tmp, filename))
+            if os.path.exists(final):
+                shutil.rmtree(final)
+            os.rename(tmp, final)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+        pointer = os.path.join(self.directory, LATEST_FILE)
+        with open(pointer + ".tmp", "w") as f:
+            f.write(name)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(pointer + ".tmp", pointer)
+        if self.fsync:
+            _fsync(self.directory)
+        self._prune()
+
+        elapsed = time.perf_counter() - start
+        self.write_seconds.append(elapsed)
+        if engine.history:
+            engine.history[-1]["checkpoint_seconds"] = elapsed
+        return final
+
+    def _prune(self):
+        saved = sorted(
+            entry for entry in os.listdir(self.directory) if entry.startswith("round-")
+        )
+        for entry in saved[: -self.keep]:
+            shutil.rmtree(os.path.join(self.directory, entry), ignore_errors=True)
+
+    def latest(self):
+        """Path of the newest complete checkpoint, or None."""
+        try:
+            with open(os.path.join(self.directory, LATEST_FILE)) as f:
+                name = f.read().strip()
+        except FileNotFoundError:
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isdir(path) else None
+
+    def restore(self, engine, path=None):
+        """Load the newest (or given) checkpoint into ``engine``; return its round."""
+        path = path or self.latest()
+        if path is None:
+            return None
+        weights = load_weights(path)
+        if weights.shape != engine.weights.shape:
+            raise ValueError(
+                f"checkpoint has {weights.shape[0]} parameters, model has {engine.weights.size}"
+            )
+        engine.weights[:] = weights
+        with open(os.path.join(path, STATE_FILE), "rb") as f:
+            engine.load_state_dict(pickle.load(f))
+        return engine.round
@@ -0,0 +1,318 @@
+# coordinator.py
+"""A localhost FedAvg coordinator: the arrows of the scene as real network I/O.
+
+The coordinator wraps the engine's sampler, aggregation stage and server
+optimizer behind a small HTTP/1.1 service. Bodies are ``wire`` frames and
+connections are kept alive:
+
+* ``GET /round`` - the round t and the ids of the selected clients S_t
+* ``GET /model`` - the model frame w^t ("distribute" arrows)
+* ``POST /update`` - one client's update frame ("Send Local Models to Server")
+* ``GET /stats`` - JSON counters for load tests
+
+Uploads are copied straight into the preallocated ``(m, P)`` update matrix.
+Once every selected client has reported, or ``round_timeout`` seconds have
+passed with at least one update, the round is aggregated and the next
+clients are selected. A round that times out with no updates at all leaves
+the model as it is and selects new clients, so dropped clients cannot
+stall training. ``ConnectionPool`` is the matching client: it reuses
+up to ``size`` keep-alive connections across any number of requests.
+
+Everything is the standard library plus NumPy, so it runs on one Linux box
+with no external services:
+
+    python -m fedavg_engine.coordinator --params 100000 --clients 10000 --per-round 1000
+"""
+
+import argparse
+import asyncio
+import json
+import struct
+import time
+
+import numpy as np
+
+from . import wire
+from .engine import WeightedAverage
+from .sampling import UniformSampler
+from .server_opt import ServerSGD
+
+ROUND = struct.Struct("<II")  # round t, number of selected clients; then m uint64 ids
+REASONS = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 409: "Conflict",
+           413: "Payload Too Large"}
+
+
+class Coordinator:
+    """Round state of a networked FedAvg server."""
+
+    def __init__(self, weights, num_clients, clients_per_round, sampler=None, aggregator=None,
+                 server_optimizer=None, seed=0, round_timeout=None, first_round=0):
+        self.weights = weights
+        self.num_clients = num_clients
+        self.clients_per_round = clients_per_round
+        self.sampler = sampler or UniformSampler(num_clients, seed=seed)
+        self.aggregator = aggregator or WeightedAverage()
+        self.server_optimizer = server_optimizer or ServerSGD()
+        self.round_timeout = round_timeout
+        self.round = first_round
+        self.updates = np.empty((clients_per_round, weights.size), dtype=weights.dtype)
+        self.counts = np.zeros(clients_per_round)
+        self.received = np.zeros(clients_per_round, dtype=bool)
+        # the largest update frame: P parameters in the widest wire dtype
+        widest = max(dtype.itemsize for dtype in wire.DTYPES.values())
+        self.max_body = wire.HEADER.size + weights.size * widest
+        self.stats = {"rounds": 0, "updates": 0, "rejected": 0, "bytes_received": 0,
+                      "aggregate_seconds": 0.0, "partial_rounds": 0, "empty_rounds": 0}
+        self._start_round()
+
+    @classmethod
+    def from_engine(cls, engine, round_timeout=None):
+        """Serve ``engine``'s weights with its sampler, aggregator and optimizer."""
+        return cls(engine.weights, engine.num_clients, engine.clients_per_round,
+                   engine.sampler, engine.aggregator, engine.server_optimizer,
+                   engine.seed, round_timeout, first_round=engine.round)
+
+    def _start_round(self):
+        self.selected = self.sampler.sample(self.clients_per_round)
+        self.slots = {k: i for i, k in enumerate(self.selected.tolist())}
+        self.received[:] = False
+        self.deadline = (time.monotonic() + self.round_timeout
+                         if self.round_timeout is not None else None)
+        self._model_frame = wire.encode(self.round, self.weights)
+        self._round_frame = (ROUND.pack(self.round, self.selected.size)
+                             + self.selected.astype("<u8").tobytes())
+
+    def round_frame(self):
+        return self._round_frame
+
+    def model_frame(self):
+        return self._model_frame
+
+    def submit(self, frame):
+        """Store one update frame; returns an HTTP status and a message."""
+        try:
+            round_, client, num_samples, delta = wire.decode(frame)
+        except ValueError as e:
+            return self._reject(400, str(e))
+        if round_ != self.round:
+            return self._reject(409, f"update for round {round_}, current round is {self.round}")
+        slot = self.slots.get(client)
+        if slot is None:
+            return self._reject(403, f"client {client} is not selected in round {self.round}")
+        if self.received[slot]:
+            return self._reject(409, f"client {client} already reported")
+        if delta.size != self.weights.size:
+            return self._reject(400, f"expected {self.weights.size} parameters, got {delta.size}")
+
+        self.updates[slot] = delta
+        self.counts[slot] = num_samples
+        self.received[slot] = True
+        self.stats["updates"] += 1
+        self.stats["bytes_received"] += len(frame)
+        if self.received.all():
+            self._close_round()
+        return 200, "accepted"
+
+    def _reject(self, status, message):
+        self.stats["rejected"] += 1
+        return status, message
+
+    def expire(self, now=None):
+        """Close a late round with whoever reported; True if it did.
+
+        With no updates there is nothing to aggregate, so the round is
+        skipped: w^t is kept and a fresh S_t is drawn for round t + 1.
+        """
+        now = time.monotonic() if now is None else now
+        if self.deadline is None or now < self.deadline:
+            return False
+        if not self.received.any():
+            self.stats["empty_rounds"] += 1
+            self.round += 1
+            self._start_round()
+            return True
+        self.stats["partial_rounds"] += 1
+        self._close_round()
+        return True
+
+    def _close_round(self):
+        start = time.perf_counter()
+        rows = np.flatnonzero(self.received)
+        if rows.size == self.received.size:
+            updates, counts, clients = self.updates, self.counts, self.selected
+        else:
+            updates, counts, clients = self.updates[rows], self.counts[rows], self.selected[rows]
+        delta = self.aggregator.aggregate(updates, counts, clients=clients)
+        self.server_optimizer.step(self.weights, delta)
+        self.round += 1
+        self.stats["rounds"] += 1
+        self._start_round()
+        self.stats["aggregate_seconds"] += time.perf_counter() - start
+
+
+def _response(status, body=b"", content_type="application/octet-stream", close=False):
+    """Head and body as separate buffers, so a model frame is never copied."""
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n")
+    return [head.encode("latin-1"), body]
+
+
+def _parse_head(head):
+    """Start line and lower-cased headers of a request or response head."""
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+async def _refuse(writer, status, message):
+    """Answer a request that cannot be read to the end; the connection is closed after."""
+    writer.writelines(_response(status, message.encode(), "text/plain", close=True))
+    await writer.drain()
+
+
+async def _handle(coordinator, reader, writer):
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            except asyncio.LimitOverrunError:
+                await _refuse(writer, 400, "request head too long")
+                break
+            try:
+                start_line, headers = _parse_head(head)
+                method, path, _ = start_line.split(" ", 2)
+                length = int(headers.get("content-length", 0))
+                if length < 0:
+                    raise ValueError(f"negative content length {length}")
+            except ValueError as e:
+                await _refuse(writer, 400, f"malformed request: {e}")
+                break
+            if length > coordinator.max_body:
+                # refuse before reading, so one client cannot make the server buffer gigabytes
+                await _refuse(writer, 413, f"body of {length} bytes exceeds {coordinator.max_body}")
+                break
+            body = await reader.readexactly(length)
+            close = headers.get("connection", "").lower() == "close"
+            coordinator.expire()
+
+            if method == "GET" and path == "/model":
+                reply = _response(200, coordinator.model_frame(), close=close)
+            elif method == "GET" and path == "/round":
+                reply = _response(200, coordinator.round_frame(), close=close)
+            elif method == "POST" and path == "/update":
+                status, message = coordinator.submit(body)
+                reply = _response(status, message.encode(), "text/plain", close)
+            elif method == "GET" and path == "/stats":
+                stats = dict(coordinator.stats, round=coordinator.round)
+                reply = _response(200, json.dumps(stats).encode(), "application/json", close)
+            else:
+                reply = _response(404, b"not found", "text/plain", close)
+            writer.writelines(reply)
+            await writer.drain()
+            if close:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(coordinator, host="127.0.0.1", port=8765):
+    """Start the coordinator's HTTP server; returns the ``asyncio.Server``."""
+    async def expire_late_rounds():
+        while True:
+            await asyncio.sleep(0.1)
+            coordinator.expire()
+
+    server = await asyncio.start_server(
+        lambda r, w: _handle(coordinator, r, w), host, port, backlog=4096
+    )
+    server.expiry = asyncio.ensure_future(expire_late_rounds())
+    return server
+
+
+class ConnectionPool:
+    """Up to ``size`` keep-alive HTTP/1.1 connections shared by many coroutines."""
+
+    def __init__(self, host="127.0.0.1", port=8765, size=64):
+        self.host = host
+        self.port = port
+        self.size = size
+        self.opened = 0
+        self._idle = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(size)
+
+    async def _acquire(self):
+        await self._slots.acquire()
+        if not self._idle.empty():
+            return self._idle.get_nowait()
+        self.opened += 1
+        try:
+            return await asyncio.open_connection(self.host, self.port)
+        except BaseException:
+            # a failed connect must not keep its permit, or the pool shrinks for good
+            self.opened -= 1
+            self._slots.release()
+            raise
+
+    async def request(self, method, path, body=b""):
+        """(status, body) of one request over a pooled connection."""
+        reader, writer = conn = await self._acquire()
+        try:
+            writer.writelines([(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                                f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1"), body])
+            await writer.drain()
+            status_line, headers = _parse_head(await reader.readuntil(b"\r\n\r\n"))
+            payload = await reader.readexactly(int(headers.get("content-length", 0)))
+            if headers.get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self._idle.put_nowait(conn)
+        except BaseException:
+            writer.close()
+            raise
+        finally:
+            self._slots.release()
+        return int(status_line.split(" ", 2)[1]), payload
+
+    async def close(self):
+        while not self._idle.empty():
+            _, writer = self._idle.get_nowait()
+            writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a localhost FedAvg coordinator.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--params", type=int, default=100_000)
+    parser.add_argument("--clients", type=int, default=10_000)
+    parser.add_argument("--per-round", type=int, default=1000)
+    parser.add_argument("--round-timeout", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    coordinator = Coordinator(np.zeros(args.params, dtype=np.float32), args.clients,
+                              args.per_round, seed=args.seed, round_timeout=args.round_timeout)
+
+    async def run():
+        server = await serve(coordinator, args.host, args.port)
+        print(f"FedAvg coordinator on http://{args.host}:{args.port}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+# data.py
+"""Per-client data partitions backed by memory-mapped files.
+
+Each client k owns n_k samples (the red ``data_icons`` dots in the scene).
+A store on disk is three ``.npy`` files:
+
+* ``features.npy`` - every sample, sorted so each client's shard is contiguous
+* ``labels.npy``   - the matching labels, in the same order
+* ``offsets.npy``  - K + 1 row offsets; client k owns rows offsets[k]:offsets[k+1]
+
+The arrays are opened with ``mmap``, so a shard is a zero-copy view and only
+the pages of clients that actually train in a round are ever read. Pages of
+clients that are done for the round can be dropped again with ``evict``, so
+resident memory follows the active clients rather than the population.
+"""
+
+import mmap
+import os
+
+import numpy as np
+
+FEATURES_FILE = "features.npy"
+LABELS_FILE = "labels.npy"
+OFFSETS_FILE = "offsets.npy"
+
+
+def synthetic_classification(num_samples, num_features, num_classes, seed=None, noise=1.0):
+    """Gaussian class clusters, a stand-in dataset for simulations and benchmarks."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(0.0, 1.0, (num_classes, num_features))
+    labels = rng.integers(0, num_classes, num_samples)
+    features = centers[labels] + rng.normal(0.0, noise, (num_samples, num_features))
+    return features.astype(np.float32), labels
+
+
+def synthetic_images(num_samples, image_shape=(32, 32, 3), num_classes=10, seed=None,
+                     noise=1.0, coarse=4):
+    """CIFAR-shaped stand-in data: a smooth random template per class plus noise.
+
+    Templates are ``coarse x coarse`` random patterns upsampled to the image
+    size, so classes differ in spatial structure that a conv net can pick
+    up. Images are returned flattened to (N, H*W*C) float32 rows.
+    """
+    rng = np.random.default_rng(seed)
+    h, w, c = image_shape
+    small = rng.normal(0.0, 1.0, (num_classes, coarse, coarse, c))
+    templates = small.repeat(-(-h // coarse), axis=1).repeat(-(-w // coarse), axis=2)[:, :h, :w]
+    labels = rng.integers(0, num_classes, num_samples)
+    images = templates[labels] + rng.normal(0.0, noise, (num_samples, h, w, c))
+    return images.reshape(num_samples, -1).astype(np.float32), labels
+
+
+def iid_partition(num_samples, num_clients, seed=None):
+    """Assign samples to clients uniformly at random, n_k differing by <= 1."""
+    if num_clients < 1 or num_samples < num_clients:
+        raise ValueError(f"cannot split {num_samples} samples over {num_clients} clients")
+    rng = np.random.default_rng(seed)
+    assignment = np.empty(num_samples, dtype=np.int64)
+    assignment[rng.permutation(num_samples)] = np.arange(num_samples) % num_clients
+    return assignment
+
+
+def dirichlet_partition(labels, num_clients, alpha, seed=None):
+    """Non-IID split: each class is divided over clients with Dir(alpha) shares.
+
+    Small ``alpha`` (e.g. 0.1) gives each client only a few classes; large
+    ``alpha`` approaches the IID split. Some clients may receive no samples.
+    """
+    if alpha <= 0:
+        raise ValueError(f"alpha must be positive, got {alpha}")
+    rng = np.random.default_rng(seed)
+    labels = np.asarray(labels)
+    by_class = np.argsort(labels, kind="stable")
+    classes, starts = np.unique(labels[by_class], return_index=True)
+    bounds = np.append(starts, labels.size)
+
+    assignment = np.empty(labels.size, dtype=np.int64)
+    clients = np.arange(num_clients)
+    for c in range(classes.size):
+        members = by_class[bounds[c]:bounds[c + 1]]
+        members = members[rng.permutation(members.size)]
+        shares = rng.dirichlet(np.full(num_clients, alpha))
+        cuts = np.round(np.cumsum(shares) * members.size).astype(np.int64)
+        counts = np.diff(np.concatenate(([0], cuts)))
+        counts[-1] = members.size - counts[:-1].sum()
+        assignment[members] = np.repeat(clients, counts)
+    return assignment
+
+
+def _map_npy(path):
+    """Open a ``.npy`` file as a read-only mmap and a zero-copy array view."""
+    with open(path, "rb") as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        if fortran:
+            raise ValueError(f"{path} is Fortran ordered; shards must be row-major")
+        header = f.tell()
+        count = int(np.prod(shape))
+        if count == 0:
+            return None, np.empty(shape, dtype=dtype)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    array = np.frombuffer(mm, dtype=dtype, count=count, offset=header).reshape(shape)
+    return mm, array
+
+
+class ClientShard:
+    """One client's local data: zero-copy views into the store."""
+
+    def __init__(self, client, features, labels):
+        self.client = client
+        self.features = features
+        self.labels = labels
+
+    def __len__(self):
+        return self.labels.shape[0]
+
+    @property
+    def nbytes(self):
+        return self.features.nbytes + self.labels.nbytes
+
+    def batches(self, batch_size, rng=None):
+        """Yield (x, y) mini-batches that are views, never copies.
+
+        With an ``rng`` the order of the batches is shuffled each call; the
+        samples inside a batch stay contiguous so no gather is needed.
+        """
+        starts = np.arange(0, len(self), batch_size)
+        if rng is not None:
+            starts = rng.permutation(starts)
+        for start in starts.tolist():
+            stop = start + batch_size
+            yield self.features[start:stop], self.labels[start:stop]
+
+
+class ClientDatasetStore:
+    """Memory-mapped, client-major dataset shared by every simulated client."""
+
+    def __init__(self, path):
+        self.path = path
+        self._features_mm, self.features = _map_npy(os.path.join(path, FEATURES_FILE))
+        self._labels_mm, self.labels = _map_npy(os.path.join(path, LABELS_FILE))
+        self.offsets = np.load(os.path.join(path, OFFSETS_FILE))
+        if self.offsets[-1] != self.labels.shape[0]:
+            raise ValueError(f"{path}: offsets do not match the number of samples")
+
+    @classmethod
+    def create(cls, path, features, labels, assignment, num_clients=None, chunk_size=65536):
+        """Write a store for ``assignment`` (client id per sample) and open it.
+
+        ``features`` may itself be a memmap; samples are gathered into client
+        order ``chunk_size`` rows at a time so the full dataset is never
+        copied in memory.
+        """
+        labels = np.asarray(labels)
+        assignment = np.asarray(assignment, dtype=np.int64)
+        if not (features.shape[0] == labels.shape[0] == assignment.shape[0]):
+            raise ValueError("features, labels and assignment must have the same length")
+        if num_clients is None:
+            num_clients = int(assignment.max()) + 1
+        order = np.argsort(assignment, kind="stable")
+        offsets = np.zeros(num_clients + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=num_clients), out=offsets[1:])
+
+        os.makedirs(path, exist_ok=True)
+        out_x = np.lib.format.open_memmap(
+            os.path.join(path, FEATURES_FILE), mode="w+",
+            dtype=features.dtype, shape=features.shape,
+        )
+        out_y = np.lib.format.open_memmap(
+            os.path.join(path, LABELS_FILE), mode="w+",
+            dtype=labels.dtype, shape=labels.shape,
+        )
+        for start in range(0, order.size, chunk_size):
+            rows = order[start:start + chunk_size]
+            out_x[start:start + rows.size] = features[rows]
+            out_y[start:start + rows.size] = labels[rows]
+        out_x.flush()
+        out_y.flush()
+        del out_x, out_y
+        np.save(os.path.join(path, OFFSETS_FILE), offsets)
+        return cls(path)
+
+    @property
+    def num_clients(self):
+        return self.offsets.size - 1
+
+    def sizes(self):
+        """n_k for every client, the FedAvg aggregation weights."""
+        return np.diff(self.offsets)
+
+    def shard(self, client):
+        start, stop = self.offsets[client], self.offsets[client + 1]
+        return ClientShard(client, self.features[start:stop], self.labels[start:stop])
+
+    def active_bytes(self, clients):
+        """Bytes a round touches when only ``clients`` train."""
+        clients = np.asarray(clients)
+        rows = (self.offsets[clients + 1] - self.offsets[clients]).sum()
+        row_bytes = self.features[0:1].nbytes + self.labels[0:1].nbytes
+        return int(rows) * row_bytes
+
+    def evict(self, clients):
+        """Tell the kernel the pages of ``clients`` can be dropped now."""
+        if not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        for mm, array in ((self._features_mm, self.features), (self._labels_mm, self.labels)):
+            if mm is None:
+                continue
+            row_bytes = array[0:1].nbytes
+            header = len(mm) - array.nbytes
+            for k in np.atleast_1d(clients).tolist():
+                start = header + int(self.offsets[k]) * row_bytes
+                stop = header + int(self.offsets[k + 1]) * row_bytes
+                # madvise needs page-aligned ranges; only drop whole pages
+                # that belong to this client alone.
+                start = -(-start // mmap.PAGESIZE) * mmap.PAGESIZE
+                stop = stop // mmap.PAGESIZE * mmap.PAGESIZE
+                if stop > start:
+                    mm.madvise(mmap.MADV_DONTNEED, start, stop - start)
@@ -0,0 +1,196 @@
+# engine.py
+"""The FedAvg round loop.
+
+One call to ``FedAvg.run_round`` is one pass through the animation:
+
+1. select m = max(C * K, 1) clients S_t with the sampler
+2. broadcast w^t to every selected client
+3. each client runs E epochs of local SGD on its own shard
+4. clients upload w_k^{t+1} - w^t into one ``(m, P)`` update matrix
+5. the aggregator reduces the matrix to the pseudo-gradient Delta^t
+   (plain FedAvg: weights n_k / n) and the server optimizer applies it
+
+Aggregators and server optimizers are pluggable; the defaults reproduce the
+FedAvg formula from the scene exactly. An aggregator's
+``aggregate(updates, weights, clients)`` gets the ids of the selected
+clients as well, for topologies that route by client.
+"""
+
+import time
+
+import numpy as np
+
+from .sampling import UniformSampler, num_selected
+from .server_opt import ServerSGD
+
+
+class WeightedAverage:
+    """Delta^t = sum_k n_k Delta_k / sum_k n_k over the update matrix."""
+
+    def aggregate(self, updates, weights, clients=None):
+        total = weights.sum()
+        if total <= 0:
+            return np.zeros(updates.shape[1], dtype=updates.dtype)
+        return (weights / total).astype(updates.dtype) @ updates
+
+
+class LocalSGD:
+    """E epochs of mini-batch SGD on one client's shard."""
+
+    def __init__(self, model, epochs=1, lr=0.01, batch_size=32):
+        self.model = model
+        self.epochs = epochs
+        self.lr = lr
+        self.batch_size = batch_size
+
+    def train(self, w, shard, rng):
+        """Train ``w`` in place and return the mean mini-batch loss."""
+        total, steps = 0.0, 0
+        for _ in range(self.epochs):
+            for x, y in shard.batches(self.batch_size, rng):
+                loss, grad = self.model.loss_and_grad(w, x, y)
+                grad *= self.lr
+                w -= grad
+                total += loss
+                steps += 1
+        return total / steps if steps else 0.0
+
+
+class FedAvg:
+    """Simulated FedAvg over a ``ClientDatasetStore``.
+
+    Every random choice is derived from ``seed``: the sampler gets its own
+    generator and each (round, client) pair gets an independent one for
+    local shuffling, so two runs that differ only in the aggregation stage
+    see exactly the same client trace.
+
+    Each round's record carries the wall time of every phase and the bytes
+    moved. Clients whose local training took more than ``straggler_factor``
+    times the round's median are counted as stragglers.
+    """
+
+    def __init__(
+        self,
+        model,
+        store,
+        fraction=0.1,
+        trainer=None,
+        sampler=None,
+        aggregator=None,
+        server_optimizer=None,
+        seed=0,
+        evict=True,
+        straggler_factor=2.0,
+    ):
+        self.model = model
+        self.store = store
+        self.seed = seed
+        self.trainer = trainer or LocalSGD(model)
+        self.sampler = sampler or UniformSampler(store.num_clients, seed=seed)
+        self.aggregator = aggregator or WeightedAverage()
+        self.server_optimizer = server_optimizer or ServerSGD()
+        self.evict = evict
+        self.straggler_factor = straggler_factor
+
+        self.num_clients = store.num_clients
+        self.clients_per_round = num_selected(fraction, self.num_clients)
+        self.sizes = store.sizes().astype(np.float64)
+        self.weights = model.init(np.random.default_rng(seed))
+        self.updates = np.empty(
+            (self.clients_per_round, self.weights.size), dtype=self.weights.dtype
+        )
+        self.round = 0
+        self.history = []
+
+    def client_rng(self, client):
+        return np.random.default_rng([self.seed, self.round, int(client)])
+
+    def run_round(self):
+        clock = time.perf_counter
+        t_start = clock()
+        selected = self.sampler.sample(self.clients_per_round)
+        t_sampled = clock()
+
+        w = self.weights
+        updates = self.updates
+        losses = np.zeros(selected.size)
+        train_seconds = np.zeros(selected.size)
+        broadcast = upload = 0.0
+        for i, k in enumerate(selected.tolist()):
+            t0 = clock()
+            local = updates[i]
+            local[:] = w
+            t1 = clock()
+            losses[i] = self.trainer.train(local, self.store.shard(k), self.client_rng(k))
+            t2 = clock()
+            local -= w
+            upload += clock() - t2
+            broadcast += t1 - t0
+            train_seconds[i] = t2 - t1
+        if self.evict:
+            self.store.evict(selected)
+
+        t_aggregate = clock()
+        n_k = self.sizes[selected]
+        delta = self.aggregator.aggregate(updates, n_k, clients=selected)
+        self.server_optimizer.step(w, delta)
+        self.round += 1
+        t_end = clock()
+
+        model_bytes = w.nbytes * selected.size
+        record = {
+            "round": self.round,
+            "clients": selected,
+            "train_loss": float(n_k @ losses / n_k.sum()) if n_k.sum() else 0.0,
+            "round_seconds": t_end - t_start,
+            "sample_seconds": t_sampled - t_start,
+            "broadcast_seconds": broadcast,
+            "train_seconds": float(train_seconds.sum()),
+            "upload_seconds": upload,
+            "aggregate_seconds": t_end - t_aggregate,
+            "bytes_down": model_bytes,
+            "bytes_up": model_bytes,
+            "stragglers": int(np.count_nonzero(
+                train_seconds > self.straggler_factor * np.median(train_seconds)
+            )),
+        }
+        self.history.append(record)
+        return record
+
+    def evaluate(self, x, y):
+        return self.model.evaluate(self.weights, x, y)
+
+    def state_dict(self):
+        """Everything besides ``weights`` that a bit-exact resume needs."""
+        return {
+            "round": self.round,
+            "history": self.history,
+            "sampler": self.sampler,
+            "aggregator": self.aggregator,
+            "server_optimizer": self.server_optimizer,
+        }
+
+    def load_state_dict(self, state):
+        self.round = state["round"]
+        self.history = state["history"]
+        self.sampler = state["sampler"]
+        self.aggregator = state["aggregator"]
+        self.server_optimizer = state["server_optimizer"]
+
+    def run(self, rounds, eval_data=None, target_accuracy=None, checkpointer=None, telemetry=None):
+        """Run until round T = ``rounds``; stop early once ``target_accuracy`` is hit.
+
+        A resumed engine continues from its restored round, so the same call
+        finishes an interrupted run.
+        """
+        while self.round < rounds:
+            record = self.run_round()
+            if eval_data is not None:
+                record["loss"], record["accuracy"] = self.evaluate(*eval_data)
+            if checkpointer is not None:
+                checkpointer.maybe_save(self)
+            if telemetry is not None:
+                telemetry.observe(self, record)
+            if target_accuracy is not None and record.get("accuracy", 0.0) >= target_accuracy:
+                break
+        return self.history
@@ -0,0 +1,129 @@
+# hierarchy.py
+"""Hierarchical (edge-aggregator) FedAvg topology.
+
+In the scene every client sends its model straight to the one server, so
+the server's fan-in grows with m. ``HierarchicalAggregation`` puts one or
+two tiers of aggregators in between. ``fanout=(E,)`` is a two-tier
+topology: client k reports to edge k mod E and the E edges report to the
+server. ``fanout=(E, R)`` is three tiers: edge e also reports to region
+e mod R first. Every aggregator forwards only a partial sum
+sum_k n_k Delta_k and the count sum_k n_k, so the server receives one row
+per child instead of one per client.
+
+Partial sums are 64-bit fixed point, as in ``secure_agg``. Integer
+addition is associative, so the result is bit-identical for every
+topology, including ``fanout=()``, where all clients report to the server
+directly (flat FedAvg). It also equals ``WeightedAverage`` up to the
+``2**-frac_bits`` encoding step.
+"""
+
+import time
+
+import numpy as np
+
+HEADER_BYTES = 8  # the count n that travels with every partial sum
+
+
+class HierarchicalAggregation:
+    """Aggregation stage that reduces client updates tier by tier.
+
+    After every round ``last_round`` holds the CPU seconds and bytes
+    received by the server and by each tier of aggregators, edges first.
+    """
+
+    def __init__(self, fanout=(32,), frac_bits=32, chunk_size=16384):
+        if any(f < 1 for f in fanout):
+            raise ValueError(f"fanout must be positive, got {fanout}")
+        self.fanout = tuple(fanout)
+        self.frac_bits = frac_bits
+        self.scale = float(2 ** frac_bits)
+        self.chunk_size = chunk_size
+        self.last_round = {}
+
+    def _encode(self, x):
+        # Every partial sum, at any tier, is bounded by the column sum of |x|
+        # over all m rows, so that bound must fit int64, not just each element.
+        if x.size and np.abs(x).sum(axis=0).max() * self.scale >= 2.0 ** 62:
+            raise ValueError(
+                f"the sum of n_k * Delta_k over {x.shape[0]} clients does not fit 64-bit "
+                f"fixed point with {self.frac_bits} fraction bits; lower frac_bits"
+            )
+        return np.rint(x * self.scale).astype(np.int64)
+
+    @staticmethod
+    def _reduce(rows, counts, node, groups):
+        """Sum ``rows`` and ``counts`` into one partial per node (int64 sums wrap exactly)."""
+        order = np.argsort(node, kind="stable")
+        present, starts = np.unique(node[order], return_index=True)
+        partial = np.zeros((groups, rows.shape[1]), dtype=np.int64)
+        partial[present] = np.add.reduceat(rows[order], starts, axis=0)
+        totals = np.zeros(groups)
+        np.add.at(totals, node, counts)
+        return partial, totals
+
+    def routes(self, clients):
+        """Parent node of every sender at each tier: clients -> edges, edges -> regions."""
+        route = []
+        node = np.asarray(clients, dtype=np.int64)
+        for groups in self.fanout:
+            node = node % groups
+            route.append(node)
+            node = np.arange(groups)
+        return route
+
+    def aggregate(self, updates, weights, clients=None):
+        m, p = updates.shape
+        clients = np.arange(m) if clients is None else np.asarray(clients)
+        route = self.routes(clients)
+        tier_seconds = np.zeros(len(self.fanout))
+        server_seconds = 0.0
+        total = np.empty(p, dtype=np.int64)
+        counts = weights
+
+        scaled_weights = weights[:, None].astype(np.float64)
+        for start in range(0, p, self.chunk_size):
+            stop = min(start + self.chunk_size, p)
+            # Clients upload floats; whoever they report to encodes them.
+            t0 = time.perf_counter()
+            rows = self._encode(updates[:, start:stop] * scaled_weights)
+            counts = weights
+            encode = time.perf_counter() - t0
+            if self.fanout:
+                tier_seconds[0] += encode
+            else:
+                server_seconds += encode
+            for tier, (node, groups) in enumerate(zip(route, self.fanout)):
+                t0 = time.perf_counter()
+                rows, counts = self._reduce(rows, counts, node, groups)
+                tier_seconds[tier] += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            total[start:stop] = rows.sum(axis=0)
+            server_seconds += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        n = counts.sum()
+        if n > 0:
+            delta = (total / self.scale / n).astype(updates.dtype)
+        else:
+            delta = np.zeros(p, dtype=updates.dtype)
+        server_seconds += time.perf_counter() - t0
+
+        # Senders into each tier, edges first, then into the server. An
+        # aggregator with no clients under it sends nothing.
+        active = clients
+        senders = [m]
+        for groups in self.fanout:
+            active = np.unique(active % groups)
+            senders.append(active.size)
+        sizes = [p * updates.itemsize + HEADER_BYTES] + [p * 8 + HEADER_BYTES] * len(self.fanout)
+        received = [count * size for count, size in zip(senders, sizes)]
+        self.last_round = {
+            "clients": m,
+            "fanout": self.fanout,
+            "tier_cpu_seconds": tier_seconds.tolist(),
+            "tier_bytes_received": received[:-1],
+            "server_cpu_seconds": server_seconds,
+            "server_bytes_received": received[-1],
+            "server_fan_in": senders[-1],
+        }
+        return delta
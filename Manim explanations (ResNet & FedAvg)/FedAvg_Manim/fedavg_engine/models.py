@@ -0,0 +1,70 @@
+# models.py
+"""Models the FedAvg engine can train.
+
+A model only has to work on a flat parameter vector ``w`` of length P, so
+client updates stack into an ``(m, P)`` matrix that the server can average
+in one operation:
+
+* ``init(rng)`` returns w^0
+* ``loss_and_grad(w, x, y)`` returns the mini-batch loss F_k and its gradient
+* ``evaluate(w, x, y)`` returns (loss, accuracy)
+"""
+
+import numpy as np
+
+
+class SoftmaxRegression:
+    """Multinomial logistic regression, the smallest useful FedAvg model."""
+
+    def __init__(self, num_features, num_classes, l2=0.0, dtype=np.float64):
+        self.num_features = num_features
+        self.num_classes = num_classes
+        self.l2 = l2
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def num_params(self):
+        return (self.num_features + 1) * self.num_classes
+
+    def init(self, rng):
+        w = np.zeros(self.num_params, dtype=self.dtype)
+        w[: self.num_features * self.num_classes] = rng.normal(
+            0.0, 0.01, self.num_features * self.num_classes
+        )
+        return w
+
+    def _split(self, w):
+        cut = self.num_features * self.num_classes
+        return w[:cut].reshape(self.num_features, self.num_classes), w[cut:]
+
+    def _probs(self, w, x):
+        weights, bias = self._split(w)
+        logits = x.reshape(x.shape[0], -1) @ weights + bias
+        logits -= logits.max(axis=1, keepdims=True)
+        np.exp(logits, out=logits)
+        logits /= logits.sum(axis=1, keepdims=True)
+        return logits
+
+    def loss_and_grad(self, w, x, y):
+        x = x.reshape(x.shape[0], -1)
+        probs = self._probs(w, x)
+        rows = np.arange(y.shape[0])
+        loss = -np.log(probs[rows, y] + 1e-12).mean()
+
+        probs[rows, y] -= 1.0
+        probs /= y.shape[0]
+        grad = np.empty_like(w)
+        grad_w, grad_b = self._split(grad)
+        np.matmul(x.T, probs, out=grad_w)
+        probs.sum(axis=0, out=grad_b)
+        if self.l2:
+            weights, _ = self._split(w)
+            grad_w += self.l2 * weights
+            loss += 0.5 * self.l2 * float(np.sum(weights * weights))
+        return float(loss), grad
+
+    def evaluate(self, w, x, y):
+        probs = self._probs(w, x)
+        loss = -np.log(probs[np.arange(y.shape[0]), y] + 1e-12).mean()
+        accuracy = (probs.argmax(axis=1) == y).mean()
+        return float(loss), float(accuracy)
@@ -0,0 +1,221 @@
+# privacy.py
+"""Client-level differential privacy for FedAvg (DP-FedAvg).
+
+The intro slide says raw data never leaves the clients, but the updates
+Delta_k do, and an update can still reveal its client's data.
+``DPAggregation`` is the DP-FedAvg stage of McMahan et al., "Learning
+Differentially Private Recurrent Language Models" (2018):
+
+1. clip every row of the ``(m, P)`` update matrix to L2 norm at most S,
+   in place. ``clip_updates`` works through blocks of rows of about
+   256 KiB. It takes a block's row norms and then scales the same block,
+   so the second pass reads from cache. Two passes over the whole matrix
+   would read it from memory twice.
+2. average the clipped rows with equal weights, so that adding or removing
+   one client moves the sum by at most S
+3. add Gaussian noise N(0, (z S / m)^2 I) to the average at the server,
+   where z is the noise multiplier
+
+``RDPAccountant`` tracks the privacy cost. Each round is a sampled
+Gaussian mechanism with sampling rate q = m / K and noise multiplier z.
+Its Renyi DP at integer orders alpha comes from Mironov et al., "Renyi
+Differential Privacy of the Sampled Gaussian Mechanism" (2019). RDP
+composes by addition over rounds, and ``epsilon(delta)`` converts the
+total to (epsilon, delta)-DP. The analysis assumes Poisson sampling.
+``UniformSampler`` draws exactly m clients uniformly, and treating that
+draw as rate m / K is the usual approximation in DP-FedAvg simulations.
+The other samplers pick some clients more often than m / K (importance
+sampling) or deterministically (round robin), so the accounting does not
+hold for them.
+"""
+
+import math
+import time
+
+import numpy as np
+
+from .engine import WeightedAverage
+from .sampling import UniformSampler
+
+DEFAULT_ORDERS = tuple(range(2, 65)) + (80, 96, 128, 192, 256)
+
+
+def clip_updates(updates, clip_norm, block_bytes=1 << 18):
+    """Scale each row of ``updates`` in place to norm <= ``clip_norm``; returns the original norms.
+
+    Rows are processed in blocks of about ``block_bytes``, so each block
+    is still in cache when it is scaled after its norms are taken. Norms
+    accumulate in the matrix's own dtype; a float64 einsum would cast the
+    whole matrix and cost more than the clipping itself.
+    """
+    if clip_norm <= 0:
+        raise ValueError(f"clip norm must be positive, got {clip_norm}")
+    m, p = updates.shape
+    rows = max(1, block_bytes // max(p * updates.itemsize, 1))
+    norms = np.empty(m)
+    for start in range(0, m, rows):
+        block = updates[start:start + rows]
+        norm = np.sqrt(np.einsum("ij,ij->i", block, block))
+        norms[start:start + rows] = norm
+        block *= (clip_norm / np.maximum(norm, clip_norm)).astype(updates.dtype)[:, None]
+    return norms
+
+
+def sampled_gaussian_rdp(sample_rate, noise_multiplier, orders=DEFAULT_ORDERS):
+    """RDP of one sampled Gaussian mechanism step at each integer order."""
+    orders = np.asarray(orders)
+    if np.any(orders < 2) or np.any(orders != np.floor(orders)):
+        raise ValueError("RDP orders must be integers >= 2")
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError(f"sample rate must be in [0, 1], got {sample_rate}")
+    if sample_rate == 0:
+        return np.zeros(orders.size)
+    if noise_multiplier <= 0:
+        return np.full(orders.size, np.inf)
+    if sample_rate == 1:
+        return orders / (2 * noise_multiplier ** 2)
+
+    log_q, log_1q = math.log(sample_rate), math.log1p(-sample_rate)
+    rdp = np.empty(orders.size)
+    for i, alpha in enumerate(orders.astype(int).tolist()):
+        # log A_alpha = log sum_k C(alpha, k) (1-q)^(alpha-k) q^k exp((k^2 - k) / (2 z^2))
+        k = np.arange(alpha + 1)
+        log_binom = np.concatenate([[0.0], np.cumsum(np.log(alpha - k[1:] + 1) - np.log(k[1:]))])
+        terms = (log_binom + (alpha - k) * log_1q + k * log_q
+                 + (k * k - k) / (2 * noise_multiplier ** 2))
+        top = terms.max()
+        rdp[i] = (top + math.log(np.exp(terms - top).sum())) / (alpha - 1)
+    return rdp
+
+
+class RDPAccountant:
+    """Cumulative Renyi DP of a sequence of sampled Gaussian steps.
+
+    The RDP curve for a given (noise multiplier, sample rate) is computed
+    once and cached, so accounting for a round is one vector addition.
+    """
+
+    def __init__(self, orders=DEFAULT_ORDERS):
+        self.orders = np.asarray(orders, dtype=np.float64)
+        self.rdp = np.zeros(self.orders.size)
+        self.steps = 0
+        self._curves = {}
+
+    def step(self, noise_multiplier, sample_rate, steps=1):
+        key = (float(noise_multiplier), float(sample_rate))
+        if key not in self._curves:
+            self._curves[key] = sampled_gaussian_rdp(sample_rate, noise_multiplier, self.orders)
+        self.rdp += steps * self._curves[key]
+        self.steps += steps
+
+    def epsilon(self, delta):
+        """(epsilon, best order) of the steps so far at ``delta``.
+
+        Uses the conversion of Balle et al., "Hypothesis Testing
+        Interpretations and Renyi Differential Privacy" (2020), which is
+        tighter than epsilon = rdp + log(1 / delta) / (alpha - 1).
+        """
+        if not 0.0 < delta < 1.0:
+            raise ValueError(f"delta must be in (0, 1), got {delta}")
+        a = self.orders
+        eps = self.rdp + np.log1p(-1 / a) - (math.log(delta) + np.log(a)) / (a - 1)
+        best = int(np.argmin(eps))
+        return max(float(eps[best]), 0.0), float(a[best])
+
+
+def noise_multiplier_for(epsilon, delta, sample_rate, rounds, orders=DEFAULT_ORDERS, tol=1e-3):
+    """Smallest noise multiplier z whose ``rounds`` steps stay within (epsilon, delta)."""
+    def spent(z):
+        accountant = RDPAccountant(orders)
+        accountant.step(z, sample_rate, rounds)
+        return accountant.epsilon(delta)[0]
+
+    low, high = 0.0, 1.0
+    while spent(high) > epsilon:
+        low, high = high, 2 * high
+        if high > 1e4:
+            raise ValueError(f"epsilon {epsilon} is out of reach for {rounds} rounds at q={sample_rate}")
+    while high - low > tol:
+        mid = (low + high) / 2
+        if spent(mid) > epsilon:
+            low = mid
+        else:
+            high = mid
+    return high
+
+
+class DPAggregation:
+    """Aggregation stage for DP-FedAvg: clip, average, add noise, account.
+
+    ``num_clients`` is the population K, which gives the sampling rate
+    q = m / K. ``delta`` defaults to 1 / K^1.1, below the 1 / K at which
+    (epsilon, delta)-DP stops protecting individual clients.
+
+    The reported epsilon is only valid when clients are selected with
+    ``UniformSampler``, because q = m / K is the same for every client
+    only there. Pass the engine's ``sampler`` to have that checked; any
+    other sampler raises ValueError.
+
+    ``inner`` averages the clipped rows with equal weights. It can be
+    ``SecureAggregation`` or ``HierarchicalAggregation``, so DP composes
+    with either. The n_k / n weights from the slide are not used, because
+    a client with a large n_k would raise the sensitivity above S.
+
+    The update matrix is the engine's scratch buffer, so it is clipped in
+    place. After every round ``last_round`` holds the seconds spent on
+    clipping, noise and accounting, the clipping statistics and the
+    (epsilon, delta) spent so far.
+    """
+
+    def __init__(self, clip_norm, noise_multiplier, num_clients, delta=None, inner=None,
+                 accountant=None, seed=0, sampler=None):
+        if clip_norm <= 0:
+            raise ValueError(f"clip norm must be positive, got {clip_norm}")
+        if noise_multiplier < 0:
+            raise ValueError(f"noise multiplier must be non-negative, got {noise_multiplier}")
+        if num_clients < 1:
+            raise ValueError("need at least one client")
+        if sampler is not None and not isinstance(sampler, UniformSampler):
+            raise ValueError(
+                f"privacy accounting assumes uniform sampling at q = m / K; "
+                f"{type(sampler).__name__} does not sample uniformly"
+            )
+        self.clip_norm = clip_norm
+        self.noise_multiplier = noise_multiplier
+        self.num_clients = num_clients
+        self.delta = 1.0 / num_clients ** 1.1 if delta is None else delta
+        self.inner = inner or WeightedAverage()
+        self.accountant = accountant or RDPAccountant()
+        self.rng = np.random.default_rng(seed)
+        self.last_round = {}
+
+    def aggregate(self, updates, weights, clients=None):
+        m, p = updates.shape
+        clock = time.perf_counter
+
+        t0 = clock()
+        norms = clip_updates(updates, self.clip_norm)
+        t1 = clock()
+        average = self.inner.aggregate(updates, np.ones(m), clients)
+        t2 = clock()
+        std = self.noise_multiplier * self.clip_norm / m
+        average += (self.rng.standard_normal(p) * std).astype(average.dtype)
+        t3 = clock()
+        self.accountant.step(self.noise_multiplier, m / self.num_clients)
+        epsilon, order = self.accountant.epsilon(self.delta)
+        t4 = clock()
+
+        self.last_round = {
+            "clients": m,
+            "clip_seconds": t1 - t0,
+            "aggregate_seconds": t2 - t1,
+            "noise_seconds": t3 - t2,
+            "accounting_seconds": t4 - t3,
+            "clipped": int(np.count_nonzero(norms > self.clip_norm)),
+            "median_norm": float(np.median(norms)),
+            "noise_std": std,
+            "epsilon": epsilon,
+            "delta": self.delta,
+            "order": order,
+        }
+        return average
@@ -0,0 +1,126 @@
+# resnet_client.py
+"""A small ResNet from the ResNet project's ``resnet_engine`` as a FedAvg model.
+
+This gives the "Compute Local Gradients" step a real nabla F_k(w^t). The
+flat vector ``w`` holds every trainable parameter followed by the BN
+running statistics. The statistics have zero gradient, but a training step
+writes the client's updated values back into ``w``, so FedAvg averages
+them along with the weights.
+
+Each worker thread gets one ``Workspace``: a ResNet whose parameter and
+gradient arrays are views into two flat buffers. Loading a client's ``w``
+is then a single copy, and the backward pass writes the gradient straight
+into the flat vector that ``LocalSGD`` consumes. Nothing model-sized is
+allocated after a worker's first client task.
+"""
+
+import os
+import sys
+import threading
+
+import numpy as np
+
+try:
+    from resnet_engine import ResNet, softmax_cross_entropy
+except ImportError:  # the sibling ResNet project is not installed; use it in place
+    sys.path.append(os.path.join(
+        os.path.dirname(__file__), os.pardir, os.pardir, "ResNet_Manim", "resnet_manim"
+    ))
+    from resnet_engine import ResNet, softmax_cross_entropy
+
+
+def _parameters(model):
+    """(layer, value attribute, gradient attribute) of every trainable array, in order."""
+    bns = [model.stem_bn] + [bn for b in model.blocks for bn in (b.bn1, b.bn2)]
+    convs = model.convs()
+    params = []
+    for conv, bn in zip(convs, bns):
+        params += [(conv, "weight", "grad_weight"), (conv, "bias", "grad_bias"),
+                   (bn, "gamma", "grad_gamma"), (bn, "beta", "grad_beta")]
+    params += [(model.head, "weight", "grad_weight"), (model.head, "bias", "grad_bias")]
+    state = [(bn, name) for bn in bns for name in ("running_mean", "running_var")]
+    return params, state
+
+
+class Workspace:
+    """One worker's ResNet, bound to flat ``params`` and ``grad`` buffers."""
+
+    def __init__(self, model):
+        self.model = model
+        params, state = _parameters(model)
+        arrays = [getattr(layer, attr) for layer, attr, _ in params]
+        arrays += [getattr(layer, attr) for layer, attr in state]
+        self.num_trainable = sum(getattr(layer, attr).size for layer, attr, _ in params)
+        self.params = np.concatenate([a.ravel() for a in arrays])
+        self.grad = np.zeros_like(self.params)
+
+        offset = 0
+        for layer, attr, grad_attr in params:
+            shape = getattr(layer, attr).shape
+            size = int(np.prod(shape))
+            setattr(layer, attr, self.params[offset:offset + size].reshape(shape))
+            setattr(layer, grad_attr, self.grad[offset:offset + size].reshape(shape))
+            offset += size
+        for layer, attr in state:
+            size = getattr(layer, attr).size
+            setattr(layer, attr, self.params[offset:offset + size])
+            offset += size
+
+
+class ResNetClassifier:
+    """``ResNet(width, num_blocks)`` on flattened ``image_shape`` (H, W, C) features."""
+
+    def __init__(self, image_shape=(32, 32, 3), width=8, num_blocks=1, num_classes=10,
+                 eval_batch=256, dtype=np.float32):
+        self.image_shape = tuple(image_shape)
+        self.width = width
+        self.num_blocks = num_blocks
+        self.num_classes = num_classes
+        self.eval_batch = eval_batch
+        self.dtype = np.dtype(dtype)
+        self._local = threading.local()
+        self.workspaces_created = 0
+
+    def _build(self, seed):
+        return ResNet(in_channels=self.image_shape[2], width=self.width,
+                      num_blocks=self.num_blocks, num_classes=self.num_classes,
+                      seed=seed, dtype=self.dtype)
+
+    def workspace(self):
+        """This thread's workspace, created on its first client task."""
+        ws = getattr(self._local, "workspace", None)
+        if ws is None:
+            ws = self._local.workspace = Workspace(self._build(seed=0))
+            self.workspaces_created += 1
+        return ws
+
+    @property
+    def num_params(self):
+        return self.workspace().params.size
+
+    def init(self, rng):
+        return Workspace(self._build(seed=int(rng.integers(2**31)))).params.copy()
+
+    def _images(self, x):
+        return x.reshape((x.shape[0],) + self.image_shape)
+
+    def loss_and_grad(self, w, x, y):
+        ws = self.workspace()
+        np.copyto(ws.params, w)
+        logits = ws.model.forward(self._images(x), training=True)
+        loss, dlogits = softmax_cross_entropy(logits, y)
+        ws.model.backward(dlogits)
+        w[ws.num_trainable:] = ws.params[ws.num_trainable:]  # updated BN statistics
+        return loss, ws.grad
+
+    def evaluate(self, w, x, y):
+        ws = self.workspace()
+        np.copyto(ws.params, w)
+        total, correct = 0.0, 0
+        for start in range(0, y.shape[0], self.eval_batch):
+            xb, yb = x[start:start + self.eval_batch], y[start:start + self.eval_batch]
+            logits = ws.model.forward(self._images(xb))
+            loss, _ = softmax_cross_entropy(logits, yb)
+            total += loss * yb.shape[0]
+            correct += int(np.count_nonzero(logits.argmax(axis=1) == yb))
+        return total / y.shape[0], correct / y.shape[0]
@@ -0,0 +1,315 @@
+# sampling.py
+"""Client selection strategies for the FedAvg engine.
+
+The scene lists three ways of picking the clients S_t for a round:
+
+* Random - a uniform sample of m = max(C * K, 1) clients without replacement
+* Round Robin - cycle through the population with a cursor
+* Importance-based - pick clients in proportion to n_k (data quantity) or
+  their last reported loss (data quality)
+
+Every sampler selects m clients in O(m) or O(m log K) time, so a round costs
+the same whether the population has a hundred clients or a few million.
+"""
+
+import numpy as np
+
+# tree lookups that may land on a zero weight before falling back to an O(K) draw
+MAX_RETRIES = 16
+
+
+def num_selected(fraction, num_clients):
+    """Number of clients picked per round: m = max(C * K, 1)."""
+    if not 0.0 < fraction <= 1.0:
+        raise ValueError(f"client fraction must be in (0, 1], got {fraction}")
+    return max(int(fraction * num_clients), 1)
+
+
+class UniformSampler:
+    """Random selection: m distinct clients, each equally likely."""
+
+    def __init__(self, num_clients, seed=None):
+        if num_clients < 1:
+            raise ValueError("need at least one client")
+        self.num_clients = num_clients
+        self.rng = np.random.default_rng(seed)
+
+    def sample(self, m):
+        if m > self.num_clients:
+            raise ValueError(f"cannot select {m} of {self.num_clients} clients")
+        # Generator.choice switches to a hash-set (Floyd style) draw when m is
+        # small relative to K, so this never materialises range(K).
+        return self.rng.choice(self.num_clients, size=m, replace=False)
+
+
+class RoundRobinSampler:
+    """Round Robin selection: the next m clients after a moving cursor."""
+
+    def __init__(self, num_clients, start=0):
+        if num_clients < 1:
+            raise ValueError("need at least one client")
+        self.num_clients = num_clients
+        self.cursor = start % num_clients
+
+    def sample(self, m):
+        if m > self.num_clients:
+            raise ValueError(f"cannot select {m} of {self.num_clients} clients")
+        selected = (self.cursor + np.arange(m)) % self.num_clients
+        self.cursor = (self.cursor + m) % self.num_clients
+        return selected
+
+
+class FenwickTree:
+    """Binary indexed tree over non-negative client weights.
+
+    Supports point updates, prefix sums and inverse-CDF lookups in O(log K),
+    which is what lets importance weights change every round without an
+    O(K) rebuild.
+    """
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or weights.size == 0:
+            raise ValueError("weights must be a non-empty 1-D array")
+        if np.any(weights < 0) or not np.all(np.isfinite(weights)):
+            raise ValueError("weights must be finite and non-negative")
+        self.size = weights.size
+        self.values = weights.copy()
+        self.tree = np.zeros(self.size + 1)
+        self._top = 1 << (self.size.bit_length() - 1)
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute the tree from ``values`` in O(K) vectorised time."""
+        prefix = np.concatenate(([0.0], np.cumsum(self.values)))
+        idx = np.arange(1, self.size + 1)
+        self.tree[1:] = prefix[idx] - prefix[idx - (idx & -idx)]
+        self.positive = int(np.count_nonzero(self.values))
+
+    def refresh(self, indices):
+        """Recompute the nodes above ``indices`` from ``values`` in O(u log^2 K).
+
+        Unlike undoing an ``add`` with the opposite ``add``, this leaves no
+        rounding residue in the internal nodes.
+        """
+        nodes = set()
+        for index in indices:
+            i = int(index) + 1
+            while i <= self.size:
+                nodes.add(i)
+                i += i & -i
+        tree, values = self.tree, self.values
+        # children have smaller indices than their parent, so go bottom-up
+        for n in sorted(nodes):
+            total = values[n - 1]
+            j, low = n - 1, n - (n & -n)
+            while j > low:
+                total += tree[j]
+                j -= j & -j
+            tree[n] = total
+
+    def add(self, index, delta):
+        i = int(index) + 1
+        tree = self.tree
+        while i <= self.size:
+            tree[i] += delta
+            i += i & -i
+
+    def set(self, index, value):
+        if value < 0:
+            raise ValueError("weights must be non-negative")
+        delta = value - self.values[index]
+        if delta:
+            self.positive += int(value > 0) - int(self.values[index] > 0)
+            self.values[index] = value
+            self.add(index, delta)
+
+    def prefix_sum(self, count):
+        """Sum of the first ``count`` weights."""
+        total = 0.0
+        i = int(count)
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def total(self):
+        return self.prefix_sum(self.size)
+
+    def find(self, target):
+        """Smallest index whose inclusive prefix sum exceeds ``target``."""
+        pos = 0
+        step = self._top
+        tree = self.tree
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and tree[nxt] <= target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return min(pos, self.size - 1)
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(K) build, O(1) per draw with replacement.
+
+    The build pairs every under-full column with over-full ones through
+    cumulative deficit/excess sums, so each pass is a handful of NumPy
+    operations instead of a Python loop over K.
+    """
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        total = weights.sum()
+        if weights.ndim != 1 or weights.size == 0 or not total > 0:
+            raise ValueError("weights must be a 1-D array with positive sum")
+        k = weights.size
+        prob = weights * (k / total)
+        alias = np.arange(k)
+
+        small = np.flatnonzero(prob < 1.0)
+        large = np.flatnonzero(prob >= 1.0)
+        while small.size and large.size:
+            deficit = np.cumsum(1.0 - prob[small])
+            excess = np.cumsum(prob[large] - 1.0)
+            # Small column j borrows from the first large column whose
+            # cumulative excess covers its cumulative deficit. The total
+            # deficit equals the total excess up to rounding, so a deficit
+            # past the last excess is a residue the last donor absorbs.
+            owner = np.minimum(np.searchsorted(excess, deficit, side="left"), large.size - 1)
+            donors = large[owner]
+            alias[small] = donors
+            np.subtract.at(prob, donors, 1.0 - prob[small])
+
+            still_large = prob[large] >= 1.0
+            small = large[~still_large]
+            large = large[still_large]
+        # Whatever is left is only off by rounding error.
+        prob[small] = 1.0
+        prob[large] = 1.0
+        self.prob = np.clip(prob, 0.0, 1.0)
+        self.alias = alias
+
+    def probabilities(self):
+        """Probability that one draw returns each column, as implied by the table."""
+        k = self.prob.size
+        implied = self.prob / k
+        np.add.at(implied, self.alias, (1.0 - self.prob) / k)
+        return implied
+
+    def draw(self, rng, size):
+        columns = rng.integers(0, self.prob.size, size=size)
+        accept = rng.random(size) < self.prob[columns]
+        return np.where(accept, columns, self.alias[columns])
+
+
+class ImportanceSampler:
+    """Importance-based selection proportional to n_k, loss, or any weight.
+
+    Without replacement, each draw is an O(log K) Fenwick lookup followed by
+    temporarily zeroing the chosen client's weight, so a round costs
+    O(m log K). With replacement and unchanged weights the sampler uses an
+    alias table for O(1) draws.
+    """
+
+    def __init__(self, weights, seed=None, replace=False):
+        self.tree = FenwickTree(weights)
+        self.rng = np.random.default_rng(seed)
+        self.replace = replace
+        self._alias = None
+
+    @property
+    def num_clients(self):
+        return self.tree.size
+
+    def update(self, indices, weights):
+        """Set new weights for ``indices`` (e.g. the losses just reported)."""
+        indices = np.asarray(indices, dtype=np.int64).ravel()
+        weights = np.broadcast_to(np.asarray(weights, dtype=np.float64), indices.shape)
+        if np.any(weights < 0) or not np.all(np.isfinite(weights)):
+            raise ValueError("weights must be finite and non-negative")
+        self._alias = None
+        # A full rebuild is O(K); point updates are O(u log K).
+        if indices.size * max(self.tree.size.bit_length(), 1) > self.tree.size:
+            self.tree.values[indices] = weights
+            self.tree.rebuild()
+        else:
+            for i, w in zip(indices.tolist(), weights.tolist()):
+                self.tree.set(i, w)
+
+    def probabilities(self, indices=None):
+        """Single-draw selection probability p_k = w_k / sum(w)."""
+        values = self.tree.values if indices is None else self.tree.values[indices]
+        return values / self.tree.total()
+
+    def sample(self, m):
+        if self.replace:
+            return self._sample_with_replacement(m)
+        return self._sample_without_replacement(m)
+
+    def _sample_with_replacement(self, m):
+        if self._alias is None:
+            self._alias = AliasTable(self.tree.values)
+        return self._alias.draw(self.rng, m)
+
+    def _sample_without_replacement(self, m):
+        tree = self.tree
+        total = tree.total()
+        uniforms = self.rng.random(m)
+        selected = np.empty(m, dtype=np.int64)
+        removed = np.empty(m)
+        drawn = 0
+        # ``total`` keeps a rounding residue after the last positive weight
+        # is drawn, so count the clients left instead of testing it for 0.
+        for j in range(min(m, tree.positive)):
+            i = tree.find(uniforms[j] * total)
+            retries = 0
+            while tree.values[i] == 0.0:
+                # Rounding pushed the target past the last live weight.
+                retries += 1
+                if retries > MAX_RETRIES:
+                    i = self._draw_exact()
+                    break
+                total = tree.total()
+                i = tree.find(self.rng.random() * total)
+            selected[j] = i
+            removed[j] = tree.values[i]
+            total -= removed[j]
+            tree.add(i, -removed[j])
+            tree.values[i] = 0.0
+            drawn += 1
+        tree.values[selected[:drawn]] = removed[:drawn]
+        tree.refresh(selected[:drawn])
+        if drawn < m:
+            raise ValueError(f"cannot select {m} clients, only {drawn} have positive weight")
+        return selected
+
+    def _draw_exact(self):
+        """O(K) fallback draw from the live weights, for when tree lookups keep missing."""
+        values = self.tree.values
+        live = np.flatnonzero(values)
+        return int(self.rng.choice(live, p=values[live] / values[live].sum()))
+
+
+SAMPLERS = {
+    "random": UniformSampler,
+    "round_robin": RoundRobinSampler,
+    "importance": ImportanceSampler,
+}
+
+
+def make_sampler(name, num_clients=None, weights=None, seed=None, replace=False):
+    """Build a sampler by the name used on the "Client Selection" slide.
+
+    ``replace`` only applies to importance sampling, where it selects the
+    alias-table sampler that draws with replacement.
+    """
+    if name == "random":
+        return UniformSampler(num_clients, seed=seed)
+    if name == "round_robin":
+        return RoundRobinSampler(num_clients)
+    if name == "importance":
+        if weights is None:
+            raise ValueError("importance sampling needs per-client weights")
+        return ImportanceSampler(weights, seed=seed, replace=replace)
+    raise ValueError(f"unknown sampler {name!r}; choose from {sorted(SAMPLERS)}")
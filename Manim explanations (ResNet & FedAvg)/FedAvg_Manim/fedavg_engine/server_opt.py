@@ -0,0 +1,93 @@
+# server_opt.py
+"""Server-side optimizers for the aggregation stage.
+
+Plain FedAvg sets w^{t+1} = sum_k (n_k / n) w_k^{t+1}. Writing the weighted
+average of the client deltas as a pseudo-gradient
+
+    Delta^t = sum_k (n_k / n) (w_k^{t+1} - w^t)
+
+turns that into one SGD step w^{t+1} = w^t + Delta^t, and any optimizer can
+be used in its place (Reddi et al., "Adaptive Federated Optimization"):
+
+* ``ServerSGD``      - FedAvg; ``lr=1`` reproduces the formula on the slide
+* ``ServerMomentum`` - FedAvgM, heavy-ball momentum on Delta^t
+* ``ServerAdam``     - FedAdam
+* ``ServerYogi``     - FedYogi, Adam with a sign-controlled second moment
+
+Each optimizer updates ``w`` in place and returns it.
+"""
+
+import numpy as np
+
+
+class ServerSGD:
+    def __init__(self, lr=1.0):
+        self.lr = lr
+
+    def step(self, w, delta):
+        if self.lr == 1.0:
+            w += delta
+        else:
+            w += self.lr * delta
+        return w
+
+
+class ServerMomentum:
+    def __init__(self, lr=1.0, momentum=0.9):
+        self.lr = lr
+        self.momentum = momentum
+        self.velocity = None
+
+    def step(self, w, delta):
+        if self.velocity is None:
+            self.velocity = np.zeros_like(w)
+        self.velocity *= self.momentum
+        self.velocity += delta
+        w += self.lr * self.velocity
+        return w
+
+
+class ServerAdam:
+    def __init__(self, lr=0.01, beta1=0.9, beta2=0.99, tau=1e-3):
+        self.lr = lr
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.tau = tau
+        self.m = None
+        self.v = None
+
+    def _second_moment(self, delta_sq):
+        self.v *= self.beta2
+        self.v += (1.0 - self.beta2) * delta_sq
+
+    def step(self, w, delta):
+        if self.m is None:
+            self.m = np.zeros_like(w)
+            # tau^2 keeps the very first steps from blowing up, as in the paper.
+            self.v = np.full_like(w, self.tau * self.tau)
+        self.m *= self.beta1
+        self.m += (1.0 - self.beta1) * delta
+        self._second_moment(delta * delta)
+        w += self.lr * self.m / (np.sqrt(self.v) + self.tau)
+        return w
+
+
+class ServerYogi(ServerAdam):
+    def _second_moment(self, delta_sq):
+        self.v -= (1.0 - self.beta2) * delta_sq * np.sign(self.v - delta_sq)
+
+
+SERVER_OPTIMIZERS = {
+    "fedavg": ServerSGD,
+    "fedavgm": ServerMomentum,
+    "fedadam": ServerAdam,
+    "fedyogi": ServerYogi,
+}
+
+
+def make_server_optimizer(name, **kwargs):
+    if name not in SERVER_OPTIMIZERS:
+        raise ValueError(
+            f"unknown server optimizer {name!r}; choose from {sorted(SERVER_OPTIMIZERS)}"
+        )
+    return SERVER_OPTIMIZERS[name](**kwargs)
@@ -0,0 +1,227 @@
+# telemetry.py
+"""Per-round metrics for the FedAvg engine.
+
+The engine already times every phase of a round (sample, broadcast, local
+training, upload, aggregate) and counts bytes and stragglers. ``Telemetry``
+adds global loss/accuracy and client participation, keeps the last
+``capacity`` rounds in a ring buffer and forwards each row to any number of
+sinks:
+
+* ``CSVSink`` / ``JSONLinesSink`` - one line per round
+* ``PrometheusExporter`` - a localhost ``/metrics`` endpoint in the
+  Prometheus text format, served from a daemon thread
+
+Telemetry times itself; ``overhead()`` is the fraction of round time spent
+on instrumentation and should stay well under 1%.
+"""
+
+import csv
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+FIELDS = (
+    "round",
+    "round_seconds",
+    "sample_seconds",
+    "broadcast_seconds",
+    "train_seconds",
+    "upload_seconds",
+    "aggregate_seconds",
+    "bytes_down",
+    "bytes_up",
+    "train_loss",
+    "loss",
+    "accuracy",
+    "participants",
+    "new_participants",
+    "coverage",
+    "stragglers",
+    "dropped",
+)
+
+PHASES = ("sample", "broadcast", "train", "upload", "aggregate")
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of the most recent rows, oldest first."""
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._rows = [None] * capacity
+        self._count = 0
+
+    def append(self, row):
+        self._rows[self._count % self.capacity] = row
+        self._count += 1
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def __iter__(self):
+        start = max(self._count - self.capacity, 0)
+        for i in range(start, self._count):
+            yield self._rows[i % self.capacity]
+
+    def latest(self):
+        return self._rows[(self._count - 1) % self.capacity] if self._count else None
+
+
+class _FileSink:
+    """Line-per-round file sink, flushed every ``flush_every`` rounds."""
+
+    def __init__(self, path, flush_every=10):
+        self._file = open(path, "w", newline="")
+        self.flush_every = flush_every
+        self._pending = 0
+
+    def write(self, row):
+        self._write(row)
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._file.flush()
+            self._pending = 0
+
+    def close(self):
+        self._file.close()
+
+
+class CSVSink(_FileSink):
+    def __init__(self, path, flush_every=10):
+        super().__init__(path, flush_every)
+        self._writer = csv.DictWriter(self._file, fieldnames=FIELDS, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def _write(self, row):
+        self._writer.writerow(row)
+
+
+class JSONLinesSink(_FileSink):
+    def _write(self, row):
+        self._file.write(json.dumps(row) + "\n")
+
+
+class PrometheusExporter:
+    """Serves the latest round as Prometheus text on http://host:port/metrics.
+
+    ``write`` only swaps in the new row; the text is rendered when scraped,
+    so the round loop never pays for formatting.
+    """
+
+    def __init__(self, port=9109, host="127.0.0.1"):
+        self._lock = threading.Lock()
+        self._row = None
+        self.rounds = 0
+        self.bytes_down = 0
+        self.bytes_up = 0
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.port = self.server.server_address[1]
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def write(self, row):
+        with self._lock:
+            self._row = row
+            self.rounds += 1
+            self.bytes_down += row["bytes_down"]
+            self.bytes_up += row["bytes_up"]
+
+    def render(self):
+        with self._lock:
+            row, rounds = self._row, self.rounds
+            bytes_down, bytes_up = self.bytes_down, self.bytes_up
+        lines = [
+            "# TYPE fedavg_rounds_total counter",
+            f"fedavg_rounds_total {rounds}",
+            "# TYPE fedavg_bytes_total counter",
+            f'fedavg_bytes_total{{direction="down"}} {bytes_down}',
+            f'fedavg_bytes_total{{direction="up"}} {bytes_up}',
+        ]
+        if row is not None:
+            lines += [
+                "# HELP fedavg_phase_seconds Wall time of the last round by phase.",
+                "# TYPE fedavg_phase_seconds gauge",
+            ]
+            lines += [
+                f'fedavg_phase_seconds{{phase="{phase}"}} {row[phase + "_seconds"]:.9g}'
+                for phase in PHASES
+            ]
+            lines += [
+                "# TYPE fedavg_round_seconds gauge",
+                f"fedavg_round_seconds {row['round_seconds']:.9g}",
+            ]
+            for name in ("train_loss", "loss", "accuracy", "participants", "coverage",
+                         "stragglers", "dropped"):
+                if row.get(name) is not None:
+                    lines += [f"# TYPE fedavg_{name} gauge", f"fedavg_{name} {row[name]:.9g}"]
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class Telemetry:
+    """Collects one metrics row per round and fans it out to ``sinks``."""
+
+    def __init__(self, sinks=(), capacity=1024):
+        self.sinks = list(sinks)
+        self.buffer = RingBuffer(capacity)
+        self.seen = None
+        self.covered = 0
+        self.seconds = 0.0
+        self.round_seconds = 0.0
+
+    def observe(self, engine, record):
+        start = time.perf_counter()
+        if self.seen is None:
+            self.seen = np.zeros(engine.num_clients, dtype=bool)
+        clients = np.unique(record["clients"])
+        new = int(clients.size - np.count_nonzero(self.seen[clients]))
+        self.seen[clients] = True
+        self.covered += new
+
+        row = {name: record.get(name) for name in FIELDS}
+        row["participants"] = int(clients.size)
+        row["new_participants"] = new
+        row["coverage"] = self.covered / engine.num_clients
+        report = getattr(engine.aggregator, "last_round", None)
+        if report:
+            row["bytes_up"] += report.get("extra_bytes", 0)
+            row["dropped"] = report.get("dropped")
+        self.buffer.append(row)
+        for sink in self.sinks:
+            sink.write(row)
+
+        self.round_seconds += record["round_seconds"]
+        self.seconds += time.perf_counter() - start
+
+    def overhead(self):
+        """Instrumentation time as a fraction of total round time."""
+        return self.seconds / self.round_seconds if self.round_seconds else 0.0
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
@@ -0,0 +1,53 @@
+# wire.py
+"""Binary wire format for models and client updates.
+
+Every frame is a fixed 32-byte little-endian header followed by the raw
+parameter vector, so decoding is one ``struct.unpack`` and a zero-copy
+``np.frombuffer``:
+
+    offset  size  field
+    0       4     magic b"FAVG"
+    4       1     version (1)
+    5       1     dtype code (1 = float32, 2 = float64)
+    6       2     reserved
+    8       4     round t
+    12      8     client id k (0 for a model broadcast)
+    20      8     n_k, samples behind the update (0 for a model broadcast)
+    28      4     P, number of parameters
+    32      P*s   parameters (w^t for a model, w_k^{t+1} - w^t for an update)
+"""
+
+import struct
+
+import numpy as np
+
+MAGIC = b"FAVG"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHIQQI")
+DTYPES = {1: np.dtype("<f4"), 2: np.dtype("<f8")}
+CODES = {dtype: code for code, dtype in DTYPES.items()}
+
+
+def encode(round_, params, client=0, num_samples=0):
+    """One frame: header plus the bytes of ``params``."""
+    dtype = params.dtype.newbyteorder("<")
+    if dtype not in CODES:
+        raise ValueError(f"unsupported dtype {params.dtype}; use float32 or float64")
+    header = HEADER.pack(MAGIC, VERSION, CODES[dtype], 0, round_, client, num_samples, params.size)
+    return header + np.ascontiguousarray(params, dtype=dtype).tobytes()
+
+
+def decode(frame):
+    """(round, client, n_k, params view) of a frame; ``params`` shares its memory."""
+    if len(frame) < HEADER.size:
+        raise ValueError(f"frame of {len(frame)} bytes is shorter than the header")
+    magic, version, code, _, round_, client, num_samples, size = HEADER.unpack_from(frame)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version {VERSION} FAVG frame")
+    if code not in DTYPES:
+        raise ValueError(f"unknown dtype code {code}")
+    dtype = DTYPES[code]
+    if len(frame) != HEADER.size + size * dtype.itemsize:
+        raise ValueError(f"frame length {len(frame)} does not match {size} parameters")
+    params = np.frombuffer(frame, dtype=dtype, count=size, offset=HEADER.size)
+    return round_, client, num_samples, params
@@ -1,5 +1,15 @@
+import os
+import sys
+
+import numpy as np
 from manim import *
 
+try:
+    from render_tools.bulk import DotCloud, StaggeredFade
+except ImportError:  # rendered from this folder; render_tools sits at the repository root
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+    from render_tools.bulk import DotCloud, StaggeredFade
+
 class FederatedAveraging(Scene):
     def construct(self):
         # Title
@@ -202,17 +212,15 @@ class FederatedAveraging(Scene):
         training_text.to_edge(DOWN)
         self.play(Write(training_text))
         
-        data_icons = VGroup()
-        for i in selected_indices:
-            data = VGroup(*[
-                Dot(radius=0.04, color=RED).shift(UP*0.08*j + LEFT*0.08*k)
-                for j in range(3) for k in range(3)
-            ])
-            data.scale(0.5).move_to(clients[i])
-            data_icons.add(data)
-        
-        self.play(LaggedStart(*[FadeIn(icon) for icon in data_icons], 
-                             lag_ratio=0.2))
+        # A 3x3 block of data points on every selected client, all in one DotCloud
+        j, k = np.divmod(np.arange(9), 3)
+        offsets = np.stack([(1 - k) * 0.04, (j - 1) * 0.04, np.zeros(9)], axis=1)
+        centers = np.array([clients[i].get_center() for i in selected_indices])
+        data_icons = DotCloud((centers[:, None] + offsets).reshape(-1, 3),
+                              radius=0.02, color=RED)
+        
+        self.play(StaggeredFade(data_icons, np.repeat(np.arange(len(selected_indices)), 9),
+                                lag_ratio=0.2))
         
         # Pulsing effect to show training over E epochs
         for _ in range(2):
@@ -0,0 +1,232 @@
+# build_tables.py
+"""Precompute the interactive page's simulation state.
+
+``fedavg-resnet-interactive.html`` can step through FedAvg and the
+residual block on its own, but then every round is drawn from
+``Math.random`` and nothing is actually trained. This script runs the real
+engines ahead of time over a grid of presets. It writes the results to
+``tables/`` as small JavaScript files that the page loads when a preset
+is started:
+
+* ``fedavg-K<clients>-C<fraction>.js`` - one ``fedavg_engine.FedAvg`` run
+  per (K, C) pair for ``ROUNDS`` rounds. It holds each client's n_k, the
+  clients selected in every round and the global model's loss and
+  accuracy after each round. A run with T < ``ROUNDS`` rounds is a prefix
+  of the table.
+* ``resnet.js`` - every layer's output for each input grid preset, computed
+  with ``resnet_engine``'s ``Conv2d``, ``BatchNorm2d`` and ``relu``
+* ``index.js`` - the preset grid, so the page knows what it can look up.
+  It is built from every ``fedavg-*.js`` in the output directory, so
+  rebuilding a few presets adds to the grid instead of replacing it.
+
+Arrays are packed rather than listed: the selected clients are one bit
+per client per round and n_k is ``uint16``, both base64 encoded. The
+1000-client tables come to a few kilobytes each. The files call
+``InteractiveTables.register`` instead of being fetched as JSON, so the
+page also works when opened from disk.
+
+    python Interactive/build_tables.py
+    python Interactive/build_tables.py --clients 3 6 1000 --fractions 0.2 0.5  # rebuild a subset
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, os.pardir, "FedAvg_Manim"))
+sys.path.append(os.path.join(HERE, os.pardir, "ResNet_Manim", "resnet_manim"))
+
+from fedavg_engine import (  # noqa: E402
+    ClientDatasetStore, FedAvg, LocalSGD, SoftmaxRegression, UniformSampler,
+    num_selected, synthetic_classification,
+)
+from resnet_engine import BatchNorm2d, Conv2d, relu  # noqa: E402
+
+# the page's slider ranges, plus populations too large for the slider
+CLIENTS = list(range(3, 11)) + [100, 1000]
+FRACTIONS = [round(0.1 * i, 1) for i in range(2, 11)]
+ROUNDS = 20
+# the page's defaults for E and eta; the tables record them
+EPOCHS = 5
+LEARNING_RATE = 0.01
+# n_k range of the page's live mode
+MIN_SIZE, MAX_SIZE = 100, 600
+NUM_FEATURES = 16
+NUM_CLASSES = 4
+TEST_SAMPLES = 2000
+
+RESNET_LAYERS = ["Input", "Conv", "BatchNorm", "ReLU", "Conv", "BatchNorm", "Add", "Output"]
+
+
+def _ramp(n):
+    return np.add.outer(np.arange(n), np.arange(n)) * (40.0 / (2 * n - 2))
+
+
+def resnet_inputs():
+    """Input grid presets: (name, label, values)."""
+    rng = np.random.default_rng(0)
+    edge = np.zeros((8, 8))
+    edge[:, 4:] = 40.0
+    return [
+        ("default", "Default 3×3", np.array([[10.0, 20.0, 15.0],
+                                             [25.0, 40.0, 30.0],
+                                             [15.0, 25.0, 20.0]])),
+        ("negative", "Signed 3×3", np.array([[-20.0, 5.0, 30.0],
+                                             [-10.0, 0.0, 10.0],
+                                             [-30.0, -5.0, 20.0]])),
+        ("ramp", "Ramp 5×5", _ramp(5)),
+        ("edge", "Edge 8×8", edge),
+        ("noise", "Noise 8×8", np.round(rng.normal(20.0, 12.0, (8, 8)), 1)),
+    ]
+
+
+def fedavg_table(num_clients, fraction, rounds=ROUNDS, epochs=EPOCHS, lr=LEARNING_RATE, seed=0):
+    """One seeded FedAvg run, packed for the page."""
+    rng = np.random.default_rng([seed, num_clients])
+    sizes = rng.integers(MIN_SIZE, MAX_SIZE, num_clients)
+    features, labels = synthetic_classification(
+        int(sizes.sum()) + TEST_SAMPLES, NUM_FEATURES, NUM_CLASSES, seed=seed, noise=2.0
+    )
+    test = (features[-TEST_SAMPLES:], labels[-TEST_SAMPLES:])
+    assignment = rng.permutation(np.repeat(np.arange(num_clients), sizes))
+
+    with tempfile.TemporaryDirectory(prefix="fedavg_tables_") as tmp:
+        store = ClientDatasetStore.create(
+            tmp, features[:-TEST_SAMPLES], labels[:-TEST_SAMPLES], assignment, num_clients
+        )
+        model = SoftmaxRegression(NUM_FEATURES, NUM_CLASSES)
+        engine = FedAvg(model, store, fraction=fraction,
+                        trainer=LocalSGD(model, epochs=epochs, lr=lr),
+                        sampler=UniformSampler(num_clients, seed=seed), seed=seed)
+        history = engine.run(rounds, eval_data=test)
+        del store, engine
+
+    selected = np.zeros((rounds, num_clients), dtype=bool)
+    for t, record in enumerate(history):
+        selected[t, record["clients"]] = True
+    return {
+        "clients": num_clients,
+        "fraction": fraction,
+        "perRound": num_selected(fraction, num_clients),
+        "rounds": rounds,
+        "epochs": epochs,
+        "learningRate": lr,
+        "sizes": _b64(sizes.astype("<u2")),
+        "selected": _b64(np.packbits(selected, axis=1, bitorder="little")),
+        "trainLoss": _rounded(r["train_loss"] for r in history),
+        "loss": _rounded(r["loss"] for r in history),
+        "accuracy": _rounded(r["accuracy"] for r in history),
+    }
+
+
+def resnet_table(values):
+    """Every layer's output for one input grid, as in ``nextResNetLayer``.
+
+    The page's simplified layers are a 1x1 convolution with weight 0.8 and
+    bias 5, and batch norm with gamma 8 and beta 25.
+    """
+    conv = Conv2d(1, 1, k=1, dtype=np.float64)
+    conv.weight[:] = 0.8
+    conv.bias[:] = 5.0
+    bn = BatchNorm2d(1, dtype=np.float64)
+    bn.gamma[:] = 8.0
+    bn.beta[:] = 25.0
+    bn.track_running_stats = False
+
+    x = np.asarray(values, dtype=np.float64)[None, :, :, None]
+    outputs, y = [], x
+    for layer in RESNET_LAYERS:
+        if layer == "Conv":
+            y = conv.forward(y)
+        elif layer == "BatchNorm":
+            y = bn.forward(y, training=True)
+        elif layer == "ReLU":
+            y = relu(y)
+        elif layer == "Add":
+            y = y + x
+        outputs.append(_rounded(y.ravel(), 2))
+    return {"size": x.shape[1], "layers": outputs}
+
+
+def _b64(array):
+    return base64.b64encode(np.ascontiguousarray(array).tobytes()).decode("ascii")
+
+
+def _rounded(values, digits=4):
+    return [round(float(v), digits) for v in values]
+
+
+def write_table(directory, name, data):
+    path = os.path.join(directory, f"{name}.js")
+    with open(path, "w") as f:
+        f.write(f"InteractiveTables.register({json.dumps(name)}, ")
+        json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+        f.write(");\n")
+    return os.path.getsize(path)
+
+
+def read_table(path):
+    """The data that a file written by ``write_table`` registers."""
+    with open(path) as f:
+        text = f.read()
+    return json.loads(text[text.index(", ") + 2:text.rindex(")")])
+
+
+def fedavg_grid(directory):
+    """Clients, fractions and rounds covered by the FedAvg tables in ``directory``.
+
+    A run with T rounds is a prefix of its table, so the grid offers the
+    fewest rounds of any table. (K, C) pairs missing from a partial grid
+    fall back to the live simulation, as on the page.
+    """
+    tables = [read_table(os.path.join(directory, name))
+              for name in sorted(os.listdir(directory))
+              if name.startswith("fedavg-K") and name.endswith(".js")]
+    return {
+        "clients": sorted({t["clients"] for t in tables}),
+        "fractions": sorted({round(t["fraction"], 1) for t in tables}),
+        "rounds": min(t["rounds"] for t in tables),
+        "epochs": EPOCHS,
+        "learningRate": LEARNING_RATE,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute state tables for the interactive page.")
+    parser.add_argument("--clients", type=int, nargs="+", default=CLIENTS)
+    parser.add_argument("--fractions", type=float, nargs="+", default=FRACTIONS)
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    parser.add_argument("-o", "--output", default=os.path.join(HERE, "tables"))
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    for k in args.clients:
+        for c in args.fractions:
+            start = time.perf_counter()
+            name = f"fedavg-K{k}-C{c:.1f}"
+            nbytes = write_table(args.output, name, fedavg_table(k, c, args.rounds))
+            print(f"{name:22s} {nbytes / 1024:6.1f} KiB  {time.perf_counter() - start:5.1f} s")
+
+    presets = resnet_inputs()
+    nbytes = write_table(args.output, "resnet",
+                         {name: resnet_table(values) for name, _, values in presets})
+    print(f"{'resnet':22s} {nbytes / 1024:6.1f} KiB")
+
+    index = {
+        "fedavg": fedavg_grid(args.output),
+        "resnet": [{"name": name, "label": label, "size": len(values)}
+                   for name, label, values in presets],
+    }
+    write_table(args.output, "index", index)
+    print(f"wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C0.2", {"clients":10,"fraction":0.2,"perRound":2,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"wAAMAAECwABQAEACIALAAAgBgQCCAIEABQAYAAMAYABEABgAgAJAAg==","trainLoss":[0.9206,0.6521,0.5732,0.5525,0.5575,0.5437,0.565,0.5124,0.553,0.4612,0.5473,0.4451,0.4817,0.5623,0.5072,0.5295,0.5071,0.5587,0.5359,0.5281],"loss":[0.7648,0.6541,0.6274,0.6053,0.5951,0.5913,0.5888,0.584,0.5829,0.5807,0.583,0.5834,0.58,0.5781,0.583,0.5791,0.5768,0.5758,0.5771,0.5775],"accuracy":[0.758,0.7675,0.77,0.771,0.769,0.767,0.767,0.7695,0.7725,0.7735,0.7785,0.774,0.7745,0.774,0.7745,0.7765,0.7765,0.774,0.774,0.7745]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C0.3", {"clients":10,"fraction":0.3,"perRound":3,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"YAIBAyADIAPEAFEAQwAVAAkCcABYAMgAwAGiABwAgQIkARgBBAMRAg==","trainLoss":[0.9127,0.6504,0.6176,0.5892,0.5473,0.529,0.5248,0.5191,0.5176,0.5439,0.5347,0.5092,0.5076,0.5478,0.5375,0.5005,0.5274,0.5541,0.5291,0.5188],"loss":[0.753,0.6764,0.6393,0.6214,0.5987,0.5904,0.5881,0.5837,0.584,0.5805,0.5786,0.5773,0.5777,0.5779,0.5751,0.5762,0.576,0.5765,0.5791,0.5815],"accuracy":[0.7605,0.7625,0.77,0.7685,0.7725,0.7705,0.7725,0.772,0.7745,0.7745,0.7715,0.7695,0.7695,0.7785,0.774,0.777,0.7735,0.775,0.7715,0.7695]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C0.4", {"clients":10,"fraction":0.4,"perRound":4,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"tADDAGADqQCiAR0AwQFYAmQBpgCcAFgCOAHEAcwAQQPIARkClAFDAQ==","trainLoss":[0.922,0.652,0.6063,0.5487,0.5718,0.5366,0.5096,0.5517,0.5288,0.5359,0.5282,0.543,0.5522,0.5119,0.5064,0.5089,0.5081,0.5283,0.5228,0.513],"loss":[0.7602,0.6649,0.6258,0.6092,0.6028,0.592,0.5864,0.5833,0.5807,0.5802,0.5786,0.5779,0.578,0.5762,0.5751,0.5763,0.5758,0.5759,0.5761,0.5767],"accuracy":[0.7615,0.765,0.768,0.776,0.774,0.7755,0.7755,0.773,0.7745,0.777,0.772,0.7715,0.774,0.7735,0.7725,0.7765,0.775,0.7725,0.7725,0.7745]});
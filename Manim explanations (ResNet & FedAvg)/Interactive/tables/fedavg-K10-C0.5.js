@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C0.5", {"clients":10,"fraction":0.5,"perRound":5,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"vADQA8wCowEdAXwAWAPmAC0BbgDGAVQDlgEzAZwCJwGOAawCnAKwAw==","trainLoss":[0.9384,0.6729,0.5928,0.5703,0.5464,0.5485,0.5551,0.5369,0.5163,0.5334,0.527,0.5362,0.5376,0.5369,0.5323,0.5184,0.5251,0.5262,0.5278,0.543],"loss":[0.7722,0.6684,0.6248,0.6102,0.5986,0.5901,0.5867,0.5835,0.5817,0.5807,0.58,0.5793,0.5804,0.5814,0.5806,0.5812,0.5819,0.5804,0.5804,0.5804],"accuracy":[0.763,0.7615,0.768,0.7745,0.7715,0.773,0.7725,0.7725,0.7715,0.7755,0.775,0.7735,0.7725,0.7725,0.7745,0.7715,0.772,0.771,0.7735,0.7725]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C0.6", {"clients":10,"fraction":0.6,"perRound":6,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"XQHYA10CnQJ9APQBvAI8A8wDtAPNAecAuwCeAbMCLwLhA9kBXgIuAw==","trainLoss":[0.938,0.674,0.5936,0.5615,0.5472,0.545,0.546,0.5481,0.5289,0.5386,0.5032,0.5168,0.5301,0.5357,0.5325,0.5245,0.5152,0.5081,0.5359,0.5398],"loss":[0.7709,0.671,0.6272,0.6092,0.5962,0.5891,0.5859,0.5846,0.5822,0.5819,0.5793,0.5782,0.5782,0.5791,0.5801,0.5805,0.5788,0.5768,0.5769,0.5781],"accuracy":[0.762,0.7605,0.7645,0.77,0.771,0.774,0.771,0.771,0.7735,0.7695,0.7735,0.7715,0.774,0.7725,0.775,0.772,0.773,0.7775,0.776,0.7745]});
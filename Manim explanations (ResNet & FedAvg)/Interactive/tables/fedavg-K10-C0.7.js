@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C0.7", {"clients":10,"fraction":0.7,"perRound":7,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"PwL0A3cCxwN6A70C1gO7AnkD6wF7Af4AXQPyA7UDfgFuA3UDdwHOAw==","trainLoss":[0.943,0.6676,0.5967,0.562,0.5724,0.541,0.5483,0.543,0.5349,0.5247,0.5319,0.5327,0.5231,0.543,0.5226,0.5351,0.534,0.5203,0.5209,0.5275],"loss":[0.7773,0.6637,0.6247,0.607,0.5985,0.5918,0.5882,0.5867,0.584,0.5823,0.5816,0.58,0.5785,0.5788,0.5783,0.5779,0.578,0.5774,0.5773,0.5773],"accuracy":[0.7645,0.7625,0.768,0.768,0.7675,0.77,0.771,0.771,0.774,0.7745,0.776,0.7775,0.774,0.7755,0.7745,0.7735,0.7725,0.7745,0.773,0.775]});
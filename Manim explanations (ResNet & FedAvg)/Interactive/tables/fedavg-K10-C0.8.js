@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C0.8", {"clients":10,"fraction":0.8,"perRound":8,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"XwP8A/UD3gP+AX0DuwP3AXsD/wC/Au8CfwH+Ae8B9wH+AX0D/gLdAw==","trainLoss":[0.9429,0.6689,0.5929,0.5764,0.5609,0.5432,0.5488,0.5327,0.5411,0.5256,0.5314,0.5223,0.5253,0.5319,0.5143,0.5192,0.5297,0.5221,0.5322,0.5147],"loss":[0.7764,0.666,0.6256,0.6079,0.5973,0.5905,0.5883,0.5851,0.5837,0.5817,0.5813,0.5803,0.5796,0.5789,0.5785,0.5782,0.5778,0.5768,0.5766,0.576],"accuracy":[0.7615,0.763,0.7695,0.7705,0.7695,0.772,0.7695,0.7715,0.773,0.773,0.7725,0.773,0.7725,0.7735,0.7745,0.774,0.775,0.773,0.7745,0.7765]});
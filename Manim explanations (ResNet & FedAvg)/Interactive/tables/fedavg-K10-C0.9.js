@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C0.9", {"clients":10,"fraction":0.9,"perRound":9,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"vwN/A98D/wH/Af4D/QP7A98DvwN/A78DfwP3A38DvwP9A/0D9wP/AQ==","trainLoss":[0.9556,0.6772,0.6017,0.57,0.5532,0.5555,0.5359,0.5406,0.5321,0.5347,0.5329,0.5313,0.5303,0.5266,0.5285,0.5279,0.519,0.5181,0.5235,0.5186],"loss":[0.7893,0.6715,0.6302,0.6097,0.5986,0.5921,0.5871,0.5849,0.5831,0.5825,0.5816,0.5815,0.5808,0.5801,0.5797,0.5799,0.5786,0.5776,0.5775,0.577],"accuracy":[0.761,0.7635,0.765,0.7685,0.7705,0.7695,0.7705,0.772,0.773,0.7705,0.7725,0.7715,0.772,0.7725,0.772,0.772,0.772,0.773,0.772,0.7745]});
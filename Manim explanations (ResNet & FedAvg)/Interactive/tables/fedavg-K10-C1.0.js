@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K10-C1.0", {"clients":10,"fraction":1.0,"perRound":10,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"9QBdAR4CygBlAZgB9wEFAWUAlgE=","selected":"/wP/A/8D/wP/A/8D/wP/A/8D/wP/A/8D/wP/A/8D/wP/A/8D/wP/Aw==","trainLoss":[0.9451,0.6705,0.6016,0.5721,0.5565,0.5472,0.5411,0.5369,0.5339,0.5316,0.5299,0.5285,0.5274,0.5264,0.5257,0.525,0.5244,0.5239,0.5234,0.523],"loss":[0.7789,0.6697,0.6291,0.6096,0.5988,0.5922,0.588,0.5852,0.5833,0.5819,0.5809,0.5801,0.5795,0.579,0.5786,0.5783,0.578,0.5777,0.5775,0.5773],"accuracy":[0.758,0.766,0.7675,0.769,0.7695,0.77,0.7695,0.7715,0.773,0.7735,0.773,0.7725,0.7725,0.7725,0.773,0.773,0.7735,0.774,0.7745,0.7755]});
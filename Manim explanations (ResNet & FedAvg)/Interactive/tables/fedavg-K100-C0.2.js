@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C0.2", {"clients":100,"fraction":0.2,"perRound":20,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"SoBABABEsCpQAggwAAUEgAAuSAAHSCAgwAgQASBqEBiRYCAACJABEAEOCASAEMEABDygCIIAEARoiAEAYiEAqAkAUBhSAQsQACFDIQgAICCwRUACMAFAgSABDJQgEACBAFIIDEACxQQpBABgjGQIAAo0ACgAECRAAAAQkQFHQBcYAAUACiAkwCADBwTQgADAECgEAQIQAiAEJnADkABHAQDIAYCBQBAUCYMCAIgIAQCIhVogFAATAACRwAAFEhAGEAwJAgQADloAScMAQFAAAQCIBhIRAJUkCgAESgAOYKMAAEXIQIBIgAAAIJCANEEAAggCQLwEAYAECAhTBAQiRgCCIQE=","trainLoss":[0.9218,0.6673,0.6077,0.581,0.5612,0.5486,0.5488,0.5455,0.5553,0.5423,0.5497,0.5213,0.5454,0.537,0.5319,0.5414,0.5435,0.537,0.5241,0.5276],"loss":[0.7223,0.6247,0.5904,0.5727,0.5631,0.5569,0.5526,0.5493,0.5476,0.5459,0.5454,0.5439,0.5434,0.5427,0.5417,0.5411,0.5403,0.5404,0.5408,0.5403],"accuracy":[0.7785,0.783,0.788,0.791,0.788,0.7895,0.7905,0.791,0.7925,0.7905,0.791,0.7895,0.791,0.7935,0.792,0.792,0.7905,0.791,0.7935,0.7915]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C0.3", {"clients":100,"fraction":0.3,"perRound":30,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"KyCIAiCitlACDRTQBkAEgGIL5jYzLDAISACYggIhgcpCCwINhcIEQjNgwAogJAColNtEBBAIvgwKYEGREHkJDgDpCaDQUDTA5UCACwAEEEkIACgisTG4YQpIC+BQoJkoDEArEJREBQVIQRQA4CPgGKjhqgEBEykB5YYHADBBQgSiBQgGYAkIhj1Bwk4AFAcMYMdVABhPAgLMBAwIQhLdiwAGxARhFAkCBgkbAmAYQBhphhlsIQAEibqoQqJJkKIRMIAARCAiBcQAQWkxCKU0CyhAgIGnAIl/hwQYBQBJQBnBQEYgYBi4KxICscgpoDyogDJRQAgEAkRacAIEswABQmMlMAM=","trainLoss":[0.9412,0.6698,0.6083,0.5757,0.5594,0.5591,0.5606,0.5453,0.5366,0.548,0.5387,0.5343,0.529,0.5411,0.5367,0.5329,0.5406,0.5346,0.5426,0.5287],"loss":[0.7382,0.6288,0.5914,0.5719,0.5627,0.5562,0.5522,0.5492,0.547,0.5462,0.5449,0.5439,0.5431,0.5426,0.5422,0.5417,0.5413,0.5409,0.5408,0.5409],"accuracy":[0.7835,0.783,0.7875,0.789,0.791,0.791,0.792,0.79,0.79,0.7905,0.7905,0.789,0.789,0.789,0.791,0.791,0.79,0.7915,0.792,0.795]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C0.4", {"clients":100,"fraction":0.4,"perRound":40,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"pxFTIJPUiQEWZ8bCCGgg+0yVhnAQuzDxBAijxhA0HQDVCYQ5WacKMMbWFMCGS8icx4FMAi0goXYEBX4C4imk0wqg0aBKRupBqHoQXqYBqxgCoIryFPKOdoC4CENFzDUcG6vEBhUkAwVEdE+khrDRxSYCVBMGIk5/BDg3BYV6UdBIAOHIQJoEjBAj7tIOxQeE0MzUORsngS4GQS4IEBA4vARKf2GJBEN/BgKs1Di4siIXCznEQQZEfnYAjO4FDCB1jCoFgRxOUKWBSxUDoIV/BgLLKyA60BMDlgw88QXTkA1cRpkGvBignTACYJNBUEYg7lCz9ApVCQCTSAclCGejLt5ekAQ=","trainLoss":[0.9284,0.66,0.6004,0.5752,0.5616,0.5551,0.5566,0.5533,0.5476,0.5473,0.5428,0.542,0.5432,0.545,0.5366,0.5387,0.5443,0.5367,0.5312,0.5387],"loss":[0.7285,0.6251,0.5902,0.5733,0.5634,0.5576,0.5535,0.5502,0.5485,0.5467,0.5454,0.5443,0.5437,0.5424,0.542,0.5416,0.5411,0.5411,0.5409,0.5406],"accuracy":[0.7825,0.787,0.7875,0.791,0.79,0.791,0.791,0.789,0.7885,0.789,0.7895,0.79,0.7905,0.79,0.7885,0.79,0.79,0.791,0.7925,0.793]});
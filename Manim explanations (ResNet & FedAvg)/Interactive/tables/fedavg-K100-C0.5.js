@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C0.5", {"clients":100,"fraction":0.5,"perRound":50,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"10wJrtJMBbUzuwtfAljiGyGJ96Me4o/GZQPmM6snJf6U24GZFEYMdYGytcu6oLsBmZlOC+A08ty6J/QOxpOqsArZBG3yNGJbPjkrsskKhOgutndi1SUuAh/eCVIe/2Kp+dUJNytYUARRNrgKdaFWfqTb/ggFMFoHL6A/o+R4HydXA2l8TllmGsZD4V8kVgvI/F0VWm58mBOQOf4AAU/FZcvotkMVutdkCWEYyMG37KDTZKs1ew6BkeRfGF7VWVO/HEMKgiejHT1BZTvU7bFXCLrxLtYtj0QPFtIR6QoNgLYT98mpY0PJ/owJG0gB0+PknL0WF/C/BHtSonB9Q2+BSqytLAs=","trainLoss":[0.9395,0.6696,0.6012,0.582,0.5604,0.5552,0.5516,0.5471,0.5372,0.5432,0.5346,0.5381,0.5441,0.5394,0.5347,0.5366,0.5426,0.5372,0.5398,0.535],"loss":[0.7401,0.6305,0.5917,0.5738,0.5628,0.5565,0.5527,0.5499,0.548,0.5465,0.5451,0.5441,0.5435,0.543,0.5422,0.5419,0.5415,0.5412,0.5406,0.5403],"accuracy":[0.7825,0.786,0.7895,0.789,0.789,0.7905,0.7915,0.789,0.7885,0.79,0.7885,0.789,0.7885,0.79,0.791,0.7915,0.7915,0.792,0.792,0.792]});
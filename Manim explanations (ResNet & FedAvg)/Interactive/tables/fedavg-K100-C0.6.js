@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C0.6", {"clients":100,"fraction":0.6,"perRound":60,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"Tz3hhn+nvJc6lpfyDV6ttr79/CHSflVQtwnc/Bpa88KvywhU/+8L5RtjiH+9vbra43O7AHcZUBPv2fCX/hHv7wPEumv9Zfz2T0Qr7yQP2/6D/f2c9c3QIEc1Dtb/i7Nlyy71vkT+hQSKob9zXM8/Nfk2/xsAjVv/qcKULV+/shn5DqF7WPlyX1fvT1TzsgytQLn9TLXoJ/qXbu8N+MaJkhx/e++nrr2VCWNbLtPQFH3bd3K7/A6PU9qcGLa+frnZb3UDBTOk//Gnrg/xv05bB41R7vE5rnbvy9NtNgb7a9K9xR/zvDErnTwFxt/gw127A3M092u9ByfB3KID/fs7j5x/Lw4=","trainLoss":[0.9326,0.6651,0.601,0.5763,0.5631,0.5499,0.552,0.5481,0.5423,0.5437,0.5441,0.5404,0.545,0.5352,0.5371,0.5351,0.5371,0.5438,0.5346,0.539],"loss":[0.7329,0.6296,0.5911,0.5725,0.5622,0.5559,0.5521,0.5495,0.5475,0.5459,0.5447,0.5438,0.5431,0.5424,0.5417,0.5412,0.5408,0.5403,0.5399,0.5397],"accuracy":[0.782,0.7885,0.7895,0.79,0.7905,0.79,0.7905,0.7905,0.79,0.79,0.7895,0.7905,0.7905,0.792,0.792,0.7895,0.7905,0.792,0.7925,0.7925]});
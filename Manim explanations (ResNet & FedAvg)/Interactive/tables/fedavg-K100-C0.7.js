@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C0.7", {"clients":100,"fraction":0.7,"perRound":70,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"Z1YxvFv9/7//d39VBN9y91o1/9t0Pe3+eQt3yb/b13/42ZruzfMN3u3GMy77553b1f/sD/nnbf7T77I891r5fA/+dT/t3efZ38R/f0MGvvuxV/85UV39r/puDzt+tzwzz/d574va7w/6s+r/K/vturWfL5kP493Bf7t9cx/pb/O3DyG/iqPrSn9/3/q//wvrN1ntvrl/99dfepwOrVT/vu/5N6O7n/aeC8P01ve/m6e/zdXxXw/+u7n34r8963cv42cG9r29V/fp5/Opn+d9AeuZ0Z/cTf+Nt9/+2Q97WbKd2/s//6W7pzsPO/esDNP9Vz/7b/z9Dbef2fKt+/9vvH1tmQo=","trainLoss":[0.9322,0.6637,0.605,0.5809,0.5681,0.552,0.549,0.5464,0.5445,0.5421,0.5431,0.5406,0.5413,0.5416,0.536,0.5343,0.5411,0.5398,0.5377,0.5402],"loss":[0.7331,0.6266,0.5901,0.5728,0.5627,0.5561,0.5522,0.5498,0.5477,0.5461,0.5451,0.5443,0.5436,0.5428,0.5422,0.5417,0.541,0.5405,0.5402,0.5398],"accuracy":[0.782,0.7865,0.7875,0.7895,0.7895,0.791,0.7905,0.791,0.7895,0.7895,0.7905,0.789,0.7895,0.788,0.7895,0.79,0.791,0.792,0.7915,0.793]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C0.8", {"clients":100,"fraction":0.8,"perRound":80,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"90qzf7/7dfd7f/f/D////vuWvb/8+rV/sw/L/yXv7/7+/v9vvp8Lf93u75uuz+t/v/f/B//7+97P+Xfv/d/5Hgf3/v3//K7ttT/6/N8P/f3/36fq/P59vj/7Df/87X+96/Xn/vd/5g39f/+/39brPv+O928N7Pb8+/+L/+/7/2/OC/+f/+6V39u23d39/wcb6vO33///93/t298N77f79+f75/1//zzkD/rv5/+ev/fvc+e/+wzXzf3ZeX/1///+724P/Pv3+/+fXnvlW//7DfvLL959z//e+/1f/w7/+/3/73Wbrb/3eqcP78/5+f+/vZ/5t/7bDnt+/6f+3+899f99fQ4=","trainLoss":[0.9367,0.6691,0.6013,0.5779,0.5653,0.5552,0.5523,0.5485,0.5464,0.5405,0.5411,0.5457,0.5407,0.5439,0.5371,0.536,0.5379,0.5378,0.5358,0.5394],"loss":[0.7372,0.6297,0.591,0.5731,0.563,0.5568,0.5527,0.55,0.5478,0.5463,0.5451,0.5441,0.5435,0.5427,0.5418,0.5414,0.5409,0.5405,0.5399,0.5398],"accuracy":[0.784,0.7875,0.7875,0.789,0.789,0.79,0.79,0.7895,0.789,0.7895,0.789,0.79,0.791,0.791,0.791,0.7915,0.7925,0.7925,0.791,0.7915]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C0.9", {"clients":100,"fraction":0.9,"perRound":90,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"2+/39/////9//3/9Cv//3373/dv////v/wb////v/+/r7/n+7f8P3/////v7ffv7/7+/Db//7//v/v+t/3//fQ++0/1/f7///////f8P/9/v7//7/f/3/3t+D/n++/v93+///////g1+9n3/3/+/3//9//8P///f/+xt/3/f///3D9f///t/9/z/7/v/+w//3/fX+/d7///9//sP+/99+/////////O7Bv/tfb/3//7/fX///w/3/f//7/77//+/9ucP////9//8+0//9+f/D//b/3///9X/7f+//wf////n+8/b973///8P/+//b/971v/7/7//D///+//////7/56/5wU=","trainLoss":[0.9359,0.6662,0.6057,0.5765,0.5677,0.5553,0.5526,0.5479,0.5435,0.5424,0.5413,0.5417,0.5409,0.5401,0.5393,0.5377,0.535,0.5374,0.5377,0.5364],"loss":[0.7354,0.6289,0.5914,0.5732,0.5631,0.5569,0.5528,0.5499,0.5478,0.5463,0.5451,0.5441,0.5432,0.5425,0.5419,0.5414,0.5409,0.5404,0.54,0.5397],"accuracy":[0.781,0.788,0.7885,0.7885,0.7895,0.7905,0.789,0.7895,0.7895,0.7895,0.79,0.7895,0.7895,0.7905,0.7905,0.79,0.7925,0.7925,0.7925,0.7925]});
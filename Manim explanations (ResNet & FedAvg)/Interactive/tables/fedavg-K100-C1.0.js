@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K100-C1.0", {"clients":100,"fraction":1.0,"perRound":100,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAKoAWUB2ADcASwB4wHjATkBfQGnAP8ASgIqAqgA9gAFAi8B0QDAAGQAzAH0AfEAPQGKAeIArwBPAfEAPAKSAfgAqAEBAq4BcwFAAdUBPwJoAX4BNgIkAXABkQB0AFAB5ACRAIgAcACuAbwB8gDBAawBFgJoAcEBLwLLAZIAyQB1AHcB+wGoAQcCNwHkAa0AoAHNAEkCSwLMANkBzAHFALMBAwKEAPAB+wE2AjcCKwFyAUMBJQEnAREBHQKoATQBEAF8AFICWgE=","selected":"////////////////D////////////////w////////////////8P////////////////D////////////////w////////////////8P////////////////D////////////////w////////////////8P////////////////D////////////////w////////////////8P////////////////D////////////////w////////////////8P////////////////D////////////////w////////////////8P////////////////D////////////////w8=","trainLoss":[0.937,0.6688,0.6045,0.5779,0.5641,0.5561,0.551,0.5476,0.5452,0.5434,0.5421,0.541,0.5401,0.5394,0.5388,0.5382,0.5378,0.5373,0.537,0.5366],"loss":[0.7369,0.6297,0.5913,0.573,0.5628,0.5566,0.5526,0.5498,0.5477,0.5462,0.545,0.5441,0.5433,0.5426,0.542,0.5415,0.541,0.5406,0.5402,0.5398],"accuracy":[0.782,0.787,0.789,0.788,0.789,0.79,0.79,0.7895,0.789,0.7885,0.789,0.79,0.7905,0.791,0.7905,0.791,0.7915,0.792,0.792,0.792]});
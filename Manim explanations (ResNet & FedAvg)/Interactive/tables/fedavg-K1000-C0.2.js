@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K1000-C0.2", {"clients":1000,"fraction":0.2,"perRound":200,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAErASYC9QHrAYkB4AHBADcCzgHwAE4CeQFHAWQA4AE3AcIBOwL9AE8CRwEyAtYAewHNAE8BaQFcAXsAEwIUAVQBNgHLAGoAKwL+AS0C9ADUAS8CqACyAfIBGwI4ArMBCwE3AfgBtADUALEBcgDzAMoBHAL1AccB3gGoAeUAZQDsAYQAuwB5AZcBPQHBAIcAfAGiAYcAGQHDAboBAwKsANQAZQAzAXcAAgEMAR0BHwGVAOkAKgIMAQcCUQIoAb0BZwASAcIBiQF8ACcB8QGqAcsBrQAOAiIBVwGPANAA8QA0AtcBTQH8ADYBIwJ1AbcAEAHgAN8B2gHjAXAB3wGZAboAegBBASgBAgKRAGQAJwKtAWoAVgFKARwC7wApAVIBxAHPAb4AMQLPAFoBqgEiAiQC4wCeAAsCAQLAABsBcAFWAcEBEAIoATUCxQAKAUsCKAGfAXYAmgD6AXoAcgAFAcUAOAEaAi0BWwEgAaYBOgE0AYYBPwGEAXEAcwBPAb4BeQBQAiMB9gESAQwCKQLrAL8A0gD7AJ0A8gA9AYgA8gArAncBAAETAegAlgGrARcBCgH1ATwBFgJcAQUBsgHWAb8AAgInAogAbAEoAtkA9AF7ATsBkwAMAkcBwQAXAsQAjgHJAKgBUgJ/ASUC/gEeAYsAbgAzAoMBswFhAVcCHAImAuYB0QE+AacBAgHeAW4BZgBeAS8BKgIWAnsBOQI6ArwBegHKAJ8BEAI8AZoBHQJjAWgAZgGMALMA8ACVAfoAjQDMASoB2wHAANoAogH/AJ8AgwDcAJUA+gBxAQQCRgFDAXQBtAG0AOsBywGAAcsBKAI0AS0C5wB/AHoASQI+AekBIgJpAfIAngChAO4AAgFCAo8AHwFUAsQALAESAuAA9QAfAaMAvQAuAkACMALcAXYBoQBfAZ8BpQGfAHcB9QCTARECIAHVAO0AsQGRAYUAYQGlAWsBlgH6AAoCNQGYAR4CfADeAcsBxQH9ADkBkgAyAYABIgIOAu0AgAFQArQByQGRAMoB9QGzAR4CTgHBAKUBfQB3AI0AtQDuALMBUQLtAXQB7wEWAc4AVAFtAHYAgAGjANwAfgFfARMCsQCwAVEBDAKFAYABpQBwATABngFrAQMCEAKHANQAVAGvARcCnQCgADMBmQDaABQBbwAKATsBagAUAiwBkQBeAQMBegEiAo8AfwBRAsMABQL/AWgB5gBlANkAkADpATQCdwAyAngATwH4AP8AHQF4ADoB0wBNATwCzQCNAbIANAFDAWwBhwAXAiQClQD4AYQArQFFAe0BHwKvAJoAqQHZAB8CmgDXAWUAEwIKAvMB2ACZAIAB9wDYACQBcQHiARYBzwEnAbIAGQH+Ab8AJwEbAWYAQgJ7AOgAmAGVAT0BMgLBANYA3wHgAQ4B9QFoAA4BPgKkAIUB8QFiAbcADgFFAiYCwQDfAa0AJwICAdYBAQHAAbcBVQLcAbIB8wGCAYwBYwGNAGgBRgFIAfIBaABxANsBxQAUAtoAxwDkAcIBMgEcAjABOQJBAasA3QFUAnABjwFDAucBSAGkACQC3QBTAX8BxgAkApkAfAEjAqUApQC9AAEBPAHDATIBhwD4APUARQFKAnYAbgFHAqYBGAGBABgBnAFPAREBjQGtAEECcQHOAaYBygAWARIBiQHDAMoATALhAUsBlQD7APkADQLoAawA7gFfAfsBgADwAHABtQBzADYCSALvAWkBwwH6ADEBegDVATYC0wEhAmgBPQHfAHwAPAH7ARoCKALgAKkB8wF8ANMB/gCjALEBugFxAG8BAQEzAiACmwBAAb4BmwGyAF4BuABRAZUAqAHBAaMB1wCjAFkBPwHzAe4BoQBLAvgBTgLbAA0B7ACdAVQClwBKAcsBpwFhAd8B/gF9ABkCtADnAL8AIgItAnAAZQGDAfIAqQBZAc4AGwGJAI0AfACwAcABfwHGAAABDgE0AqwA8gE2Ar8AuAC4AL4AQAL7AQ4BjgAZAZMAnQF6AVcCOQKvAcYBUgIOAqMBHAFFARMC0gGrAAICowBlAdAB9gG/AZkBcAFqAYEBSQKcAbsBHwHcAS0CwQEmAeEASALvADECZADHAJ4AFAKaAPkA+AASAe4BwABTAqgBkABzAaIAPQJGAmkAcQDkAXYBkAHFAc0AtADyAAkBEAK9AcQB3wAdAt0AjQCzAakAXQEFAawBdQGqAWQBZgC7AK4ACQHIAdwBzgHYANEAiwFCAmwAvgCNACsBlAG5AM4BjgExAVkBPgHUABMCKQGzAQgBYgEoAaoAIAJDAmcA7QEqARcBVQLGAT4C0gFrAJ8BXwEvAYsA1gELAY4B5ADwAMkBNQHxASsCmwEOAoMA9ACNAKIBtAHIAUgCoQDoAXcAwQAIARUCFgFDAbUAZQAFAu4AVAJOAVMBJwLSAZIB7gEAAXQALwGVAIgAHQLJABMBUgIeASgBagHJAdEB4QGjAFYCYQFtAWcBOALMAf0AdwGCAZ8B2wFxAcAAUwKHALMApQCzAeMAdgF/AG0AEQGZAFICrwDoAFYB4AAZAaABbwB9AL0BogCvAEsCagA5AkACAAFFAncBKQHdAA4BtAHoAXEARgIbAusAKgGEAK0AhQDaAK8BMQLQAaQBXgF1AGQAagErAhMBmQEIAckAJAE=","selected":"lOCECAKoIJCIDBIACAExAAIiDAAAAJAGAAgIRQkIgAgAQCIwEBACBGAgSRAoQhKACAM8DgEBALISBgiEACAgwRRsAAQQwYAAApAroAQAFJRABAVAEAIRgDGWCUMgICBBAAiCBAQAXUSIACgFQAgiAbRjgABMoOARCJkQAAgZUCgARBASTICRARABTgIEKBBCIBIQCBIKAAKARYIAAAkRk3DIhQgAAQYCgQAABMCjSSAKiCmIVIAoMAEwGkAGAABAVABAA2BEDBACJAAwgJ4IgAgATAAgUIDQAi5oAaBIGAEBJAQJAGAiEQCOAIgB4BAAAoQoAAUDUAIBAAgAgAEAEKQIgTABYABAYAAAOMEETaDIgAASoACIASAoQBQYZABUIkAByAIJKACANAAAMAQguAkwQAIAGgQMCHEEpAwOAThIgKChJGSoCACAGDQMAKCIIA9MCACABgFJUhEgIgRACQQEAgQAQ8AIAQQADFHCAgEQQEIBhkBBdAEgJAACAaAkACBApEgSAwAQwiAJAQggEyAo7BAwAAAYYBEQQAEiKSkAcQgWKEoBhghCARAQDMQBYAAoowQsAIgQNAQcQjAAMEACAAKggKAhCQAIAAABQBARKUAgCAIwIkYJEhQjAAMEFKAAAIIIECIwLJBQQKBiBaAAAMoNJIpQggECIQAAEAAQiECAACAjIAhBOCiUEGBAQAGIgCgQkAABSmEAjAAIEQMLggAQD5CEAi8AkABAEAzIEKMCChAARUFABBE4ChgQACqIAEIAoQhkQAkkRCAwZAAC0AQAwhAEIUCUXgFBQgmALwgACAAAVAABMIBEESAQGIQEFgAUAUBMAIAhAMogkDUSoICCgQABAACLFGwCRQgAHjEECAECGgBIKoEALEAQQEqQRQJGgABNTskIYABMIQAEgFYQgAIMAJAAaFBQSAiAAAAAIAAIQMKAQiAAAJAClKgDAAAQDxRJSAAiAOgBAAAQwBwAyYIIUBgiMiAQRBaAxDBgCEAIhgEAIAIACAjkARAIICAAiIEAAEBEDgEKSKgCksCAsAIiQAAAACATIkQAAIJoAQiRBBoIgNAQlDQAMGoNgBAuACgQEAIKBwAcKhAISoADxACAEAUKhAAEAAVAKAIDAIAgBIpGBELBBHAMCgYhAQQRTiUMoAAUTGAiBARBgQACIkhBDEACaBmABgQjDACAFgACDEAAEICQUIKMRAFhAAQCAQIMA0EgCiBABIQhIAABIAIIAAQgEADAyhAAgAIFCEwkLQ6DAoEBAECDABBwBKCyACkwgzAwIKBFDgCAAQMAOiAACQQigKIGCIAIiEBoCmVQYGgBgBggEgGoAMRE4gIOGCQEiACDAA4AQgBJEBEuCAHIQQCBIiCKACIIEBeAggSQZAFEwgIQAAIAJSAIAhIoDHEAgQIhEMAgkgkAEAFCCUIAABCkCIgAAGgsAygEgIAAgAQAgAoEgM1IAAEOIBEAgSA0hUElIcJBAADpQAEASMUEBakAhIB6AFLiAQAEAAkQEA8HQKQhBAQAhEYASCBAEwzDAYoEIAwIEGAxADEsEBBCAO5GgATAIkAA0IYAAABEGQAgRABQARBAREKSCAAIAAFBABACABBAAIxwSggAAAoClQFiABMYQACAQiKJJggADAAAAKJoBAgEIewBoIgECSYxoY8QaAgAAEQEAyjQggAIUSEKARACEDZGEBYAxMIgQYAEECgIEQCFyCIAoAAAQGGCoCAAoAYAUAAAKgoUIgAAASEAQCEJQRZCAASkAAAAhAAAgABnkoQjQgLIKVASBASABGAwCGE0wAJBAAIIAnISAQAEBQhmIEAVoChAICAXhVAFBALAEAAcRoYEBAgUQwABKQAQmAAFBoiEAAsBBELghA2QwSOBoQDgECBoAAABGAIgDQABoAEABTgECRIiIYhQFIABgCIAAKmgsIEQAE5AEQAAAUBBAAAw6gAwBAQEEgIICGDBAAC4IEkAUMRACkAhUAQAABEgMEALIgAYAIShIAFXAIyDAAgDAIAAQAAEcgCBJW0iYAAQLEAggCIEGgACUUEBIgACJRsk4UjAJkKAERAQAEBghAAKEgAAAR0EUByKECAGIAAAQAoAAhIagMUpIFkwIRACwAACQAQAQCAiIYVAkApNABgABFgEUYsAARBCsAIsAAAJMAwAAACQAEsEABRZGAAQAAQAIhQAaEYJQAECQIkMgEAUYAYiECgQggoEwEcAgIEIMAyVDQJAAIEIBKDAECEKhAETKGgCAA4BABALIwIZAAUZYI0QEBKREKggxIiIAEGwAGAABIAhACFEQECgMBAIoBBRhgCEBAlAogADAGBQBCEgRAAMBRCAIBVApoY0VghAgCAAIGFKEFkCACkYQABJAASqYAAuwSkAAEBCQAYUCBAAFIYZAJkAIggQFAQA4AAAAHiAAlDBACyAhJsAAAgFAVQAABAokcVCYAACgFAA4AABIQLSAAMBpQLECBSABAERBCRIIAA1ICMNAMAAIAAMkAUqCEFAMKAAOyawAhKBAgAEUSBDBQWICIgALAAIoIIGkAIMUTAAojAAREgjARUgkKAhDgECQgAAkFAgBgBAyQBYIhCCLkQAuBgAEAiIJAAqQgJAMABBMSAAAEABAEkYUBCAQBNhAAAAAIAIBYQMUIYAKiCAE0DYAFCgIQBAFADwApAYCBAAgICjAJRJiAJBIETgUYGIRFQCIAABJBBIAmAA0gnmHxAAEgN4g0AACgoDIgDSAAABAwMAgAAH2AgCACAIIQEA2CABAAAMIgQJAWAECEACAQAAdHCgBEAhAUcZBAASBAABIDxRAoAYEEARkDwMgJERFggAAghgZhEAKIDpCAhEJBCIGAMMAAIEAEkAhAgIDABAjQDo0CSgBAY0AAAAkAUEAxIEASQAERARAQCICFCAkAQBoZQEBCACLCgAEoQETBCKgjBAIIIAECMKBIAAAACGJFqEIgMiQAAQBmKgCkKEwAIKCAAmCUAEAhAqwgAEAEADAEIgAUo4ASBK4EBCIICgDAgBQooAAqTQh4QEggAQkGQACEABgGIICIEBsggAISACAAFBCAAAiQMFUkJhADIBAAIFIAhTALgJVIJoQVBESaAJAakBN1QAA4ABABAEDCBhAABRBAJAkEEABAZgCEACCUIaEQQYpADAIRACEQgASEgAJASiQgQwyOIEcEgEAIAIAAoFIIgVACCAgFCRMgsAADAsgAACBAUgAEQARIAEAlSICIIwxAJRKACSQGhMoAJBaKIGWAgsRwUCIAAALAAOAiKABCgIQGSQAhIBICgAAQBQiGAEAALAkWAAICEIyA==","trainLoss":[0.9542,0.6742,0.605,0.5753,0.5615,0.5525,0.5497,0.5445,0.538,0.5335,0.5405,0.539,0.5322,0.5335,0.5338,0.5313,0.5359,0.5304,0.5345,0.5306],"loss":[0.7546,0.6353,0.5917,0.5711,0.5597,0.5524,0.5476,0.5442,0.5415,0.5392,0.5378,0.5366,0.5355,0.5346,0.5337,0.5331,0.5325,0.5318,0.5313,0.531],"accuracy":[0.7945,0.7955,0.7945,0.794,0.794,0.794,0.7955,0.794,0.7945,0.7945,0.7945,0.794,0.7935,0.7945,0.7935,0.7925,0.793,0.7945,0.7955,0.796]});
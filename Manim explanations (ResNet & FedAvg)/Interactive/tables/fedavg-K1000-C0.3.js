@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K1000-C0.3", {"clients":1000,"fraction":0.3,"perRound":300,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAErASYC9QHrAYkB4AHBADcCzgHwAE4CeQFHAWQA4AE3AcIBOwL9AE8CRwEyAtYAewHNAE8BaQFcAXsAEwIUAVQBNgHLAGoAKwL+AS0C9ADUAS8CqACyAfIBGwI4ArMBCwE3AfgBtADUALEBcgDzAMoBHAL1AccB3gGoAeUAZQDsAYQAuwB5AZcBPQHBAIcAfAGiAYcAGQHDAboBAwKsANQAZQAzAXcAAgEMAR0BHwGVAOkAKgIMAQcCUQIoAb0BZwASAcIBiQF8ACcB8QGqAcsBrQAOAiIBVwGPANAA8QA0AtcBTQH8ADYBIwJ1AbcAEAHgAN8B2gHjAXAB3wGZAboAegBBASgBAgKRAGQAJwKtAWoAVgFKARwC7wApAVIBxAHPAb4AMQLPAFoBqgEiAiQC4wCeAAsCAQLAABsBcAFWAcEBEAIoATUCxQAKAUsCKAGfAXYAmgD6AXoAcgAFAcUAOAEaAi0BWwEgAaYBOgE0AYYBPwGEAXEAcwBPAb4BeQBQAiMB9gESAQwCKQLrAL8A0gD7AJ0A8gA9AYgA8gArAncBAAETAegAlgGrARcBCgH1ATwBFgJcAQUBsgHWAb8AAgInAogAbAEoAtkA9AF7ATsBkwAMAkcBwQAXAsQAjgHJAKgBUgJ/ASUC/gEeAYsAbgAzAoMBswFhAVcCHAImAuYB0QE+AacBAgHeAW4BZgBeAS8BKgIWAnsBOQI6ArwBegHKAJ8BEAI8AZoBHQJjAWgAZgGMALMA8ACVAfoAjQDMASoB2wHAANoAogH/AJ8AgwDcAJUA+gBxAQQCRgFDAXQBtAG0AOsBywGAAcsBKAI0AS0C5wB/AHoASQI+AekBIgJpAfIAngChAO4AAgFCAo8AHwFUAsQALAESAuAA9QAfAaMAvQAuAkACMALcAXYBoQBfAZ8BpQGfAHcB9QCTARECIAHVAO0AsQGRAYUAYQGlAWsBlgH6AAoCNQGYAR4CfADeAcsBxQH9ADkBkgAyAYABIgIOAu0AgAFQArQByQGRAMoB9QGzAR4CTgHBAKUBfQB3AI0AtQDuALMBUQLtAXQB7wEWAc4AVAFtAHYAgAGjANwAfgFfARMCsQCwAVEBDAKFAYABpQBwATABngFrAQMCEAKHANQAVAGvARcCnQCgADMBmQDaABQBbwAKATsBagAUAiwBkQBeAQMBegEiAo8AfwBRAsMABQL/AWgB5gBlANkAkADpATQCdwAyAngATwH4AP8AHQF4ADoB0wBNATwCzQCNAbIANAFDAWwBhwAXAiQClQD4AYQArQFFAe0BHwKvAJoAqQHZAB8CmgDXAWUAEwIKAvMB2ACZAIAB9wDYACQBcQHiARYBzwEnAbIAGQH+Ab8AJwEbAWYAQgJ7AOgAmAGVAT0BMgLBANYA3wHgAQ4B9QFoAA4BPgKkAIUB8QFiAbcADgFFAiYCwQDfAa0AJwICAdYBAQHAAbcBVQLcAbIB8wGCAYwBYwGNAGgBRgFIAfIBaABxANsBxQAUAtoAxwDkAcIBMgEcAjABOQJBAasA3QFUAnABjwFDAucBSAGkACQC3QBTAX8BxgAkApkAfAEjAqUApQC9AAEBPAHDATIBhwD4APUARQFKAnYAbgFHAqYBGAGBABgBnAFPAREBjQGtAEECcQHOAaYBygAWARIBiQHDAMoATALhAUsBlQD7APkADQLoAawA7gFfAfsBgADwAHABtQBzADYCSALvAWkBwwH6ADEBegDVATYC0wEhAmgBPQHfAHwAPAH7ARoCKALgAKkB8wF8ANMB/gCjALEBugFxAG8BAQEzAiACmwBAAb4BmwGyAF4BuABRAZUAqAHBAaMB1wCjAFkBPwHzAe4BoQBLAvgBTgLbAA0B7ACdAVQClwBKAcsBpwFhAd8B/gF9ABkCtADnAL8AIgItAnAAZQGDAfIAqQBZAc4AGwGJAI0AfACwAcABfwHGAAABDgE0AqwA8gE2Ar8AuAC4AL4AQAL7AQ4BjgAZAZMAnQF6AVcCOQKvAcYBUgIOAqMBHAFFARMC0gGrAAICowBlAdAB9gG/AZkBcAFqAYEBSQKcAbsBHwHcAS0CwQEmAeEASALvADECZADHAJ4AFAKaAPkA+AASAe4BwABTAqgBkABzAaIAPQJGAmkAcQDkAXYBkAHFAc0AtADyAAkBEAK9AcQB3wAdAt0AjQCzAakAXQEFAawBdQGqAWQBZgC7AK4ACQHIAdwBzgHYANEAiwFCAmwAvgCNACsBlAG5AM4BjgExAVkBPgHUABMCKQGzAQgBYgEoAaoAIAJDAmcA7QEqARcBVQLGAT4C0gFrAJ8BXwEvAYsA1gELAY4B5ADwAMkBNQHxASsCmwEOAoMA9ACNAKIBtAHIAUgCoQDoAXcAwQAIARUCFgFDAbUAZQAFAu4AVAJOAVMBJwLSAZIB7gEAAXQALwGVAIgAHQLJABMBUgIeASgBagHJAdEB4QGjAFYCYQFtAWcBOALMAf0AdwGCAZ8B2wFxAcAAUwKHALMApQCzAeMAdgF/AG0AEQGZAFICrwDoAFYB4AAZAaABbwB9AL0BogCvAEsCagA5AkACAAFFAncBKQHdAA4BtAHoAXEARgIbAusAKgGEAK0AhQDaAK8BMQLQAaQBXgF1AGQAagErAhMBmQEIAckAJAE=","selected":"SmghF2CHIOkKBhERkAKQVTGJAABKARAwgUCnIkiApFQIBJGggyYiAVISAI6ITRABUFlWYAAxg9Eg5BpgMUgRAKg0UsIApNggA2WQgQjkkKYTZgAmAgRkCAdBRgIytgBATFIokNjHG2ZViP0KnAIFGEACgsBQA2oBeIooJBaQQgQcKABAFEEgaCwRQygsUDkwiYI5RAgZUlAEASNtWAwAiA1JSCjEQahDQSmBQXAARxAOGGQJQmsCAJZc0oRjQOQgEBiC+iGSEqEBqyhIjAIAwOAQDgQBiHC1YG2KIHIYEwBuAEgMIkvAlQgMgDA2SL9ICi1oBtNQABMCpLQgiAIUJEAtARBlSkoULIiUUCGQIDW4FLUQEgBQBKUQBi5k4AFYg0IBs4hBGj5AEJanxEFELDFAggUFrMmDwzAQAgAEcClIVGigAAgABDBcYJhAIWBp2YIKw9gACCPcAg3wJKYxVYEAQbQoGUAkGNyARBSIAF1ADDrgJTBhTQ1oBGIhgGJnCygiSBAGXCYJEYKICEpCA5A2gzKsqiRgiEkIkIkClkAEikGBBkEAKGgFAQpOwxzYATkCwRLyCg4p6iCtCYI0QDghmlEskCCAqNVQ4LSJkRIgAHKAyADMgjKMgQkBgAJAEQYaQwUGxQGkEhQAUKCqBWAGkgdcR5CNi2GKkIKFChUAQIrKAYoBAgJoDAEIhKiC2jDQQoIJEuWwAkKIAFySShBAQUYREQAvGAhHkIaHRPolICiyBGGWSQCFEABhIYOBwVICxAooRpRAgBkBoMwAKCAdCBxHdAVF5UM4AIFEE1BiMhhBISR7gIEZCCV5JEBJgdYNA8UiABaMUAAcgIkO4AWXKAvGQiIExgAkaUBGkiEoQgknqbSAg0CBkcC4MAUhDUMoBkQrTgC1mAaKABSAJCJ18ABKETDFQzIQQQ0CWCAgryAABohEyUABRNDByBRh2EzEEQ1ORQQAmyGQEUgcwAELWhAJICi4wQLgABALpCOxqAYQgT0AVSgLEIUmJ4RnASaTUCmAAD8socBXsMSZUCRGOBISYoBBDojVgPCugpAuQMBI0SAAYJAJCJBQyGCCjMgDDAKCwAEEABAgEAjQ4QIZEmEVk0KBEOWWQJLEBSihIwEgeACVkAiJRQXCBPSZBBDMPgFqAgCQMQCISMX34CMQwRvHVApTCEgUBAmZh3ESFEKBsyFAQgAAQcAgAA0LAQtQCS3QPMR8yAnxKjISJT6QGoIQpCEAGBQiGMHCwEVSwgC1YhYSgFQADgCJFJFJDHAhAUBAEYgGRQLAPEfgBENoGIIERQCMEGhQBQHg3FCCBIAR4ECAroAkHAdayCA4QdIf3LQAsG0BQSAABiAABSMAcfsnMkQpESgkGSREEJzALCRERH2UAo1LhxkEODAAYIaYIkwAgQheAEZSSEgGU4AAgQII1gQ5BVJCOaWGACGQEwBlIdA5tAFoOMwyQAAYBQIAgRVE9CgoAiCwFHFCwQBQUh4SGsAfADSQJRlMHEECECGEhYAmEKnqoVEZRKGCCJDNxgIEUPFcYIcEeHDggAoqHQKmKF4gMHJUEQAtKJoIgbo4dFBAcqMBUBIAwdSBAAUIABakEEBBA5agaA0ImJNZ9EQA6CcBhgqAIQFRiChbF0gJREAwS4EIAEEAAJ0AAYIcUIs6aQCABQgAB36goCOQFEjo2eCTZIQIgaAlXzQRwgBX4AMAMWUgQRbCiQQcaUF0upGAxQQOmhCpSABAmECD8QQxDKmGwViQMISMCDCCGAJYEBGBoSTQMQYAIDLhYgBgMGQVIAAhAJCEJhVwJFEI0HASQMSQCtS2QAIEMMnfZK/AEShWDBIRApDFBEoEDCA4gKAocEBIUMiCXAZ2ITIUgSjKwEADQBlBQFgZK7gBF4EFJMAHmIAOIQKUmhBxEkAcQghC8CAQVUCgGIEAgAITaAwApCAEFgQxwAiwcii1SoYJA1BICMYsaChCAXQbMQQqMBJH5kJSkdBCDTBB8PSkAYwgYDAIQwSKmAAcCg4mDBD4JIIQFgUMOJxQDiAEAtRiY5RBIFjCaORQPxggAIWgICMAEECUlAAFKEDnIJAjgFwBaKOCQYGawQoSEse3cTApCAEXIJLBQpoCDQDA0VFGAAM4gBCIgCgsInAImcOwmhIZEcCkJCOAABDJACqigIWJEAD4EnQEwBEHoDLCEoRUqCGT4lBQACCABAQQrDAIEgMh4CWEAGAgggAgJYGNYgIM6ZCwzSIyDUfCEjgNcgSEZaZC4hpkQNK2aAIJYAYGUKGiANcBg4JtaGBoAUQmAkIcBFI4RfRFMNg5bpAChIAAJGpI0IAaYqCkNYQk6DYtHhACYsCBFHAMeCsBCqwcTQcgWwQgIEqkiQhAtIikgkQCACAgAIAgDQEgARTAjgAkE1QAFqIFAQKK7DAS1gwQLSiC4BjqIKSGCYJJKIIQkU9QZoXpO4BGQADj+sYIREEAMCphCBwC1k0BCAiGjCBEcl5AJ4hMOwiwgcAXFFQKCRQAwAoQkGEYDFELDEfMoOCogghIqEUFgSQHQBQQkQMHARIISWiCANqoAgAwFgOGwRApUIVckgrUIoBIAAEQAEqB3LRVTOxINyuABpABdZIhJBgwVAkh0qVI0TUAJAlFAGshINCuJMNQESwCgBMHECAAsUQmNIEARAAoBJgWAHCOOBqagAIw6IGwKFABCghAAAwvAzYKQGAsoBiGzCCDLIUAQRAUzgsDoACQcqs4JZWXqQgqQMTJySEiajDmPAIgsUFCQBcAYhNAAF6UmADMwXQBQCEBIBZiVQLgFwpwMFQyZQhRWpPIAAikMAknAAA2QyRGUIJVYCohhBBgQpYoPBpAyCCBpIAiIkUAKFiCgKcMMywTjZSEJgmxsAWCPgCFEGnIWQZgIKhScWjVCgCXIJVLgIAwCSAPoICBEphCIoWCgMEIQxAjEaCqAgAVwDiBAIImDAABPBMICqAUMKhZkNgIgFKM9PBhcJBwCCKFyRFMFUkwQHQEPFJRsYAqAZGgEKFpAKCAhgAADDKJAlI2WCRVgDhHMqEAoggmARgA4EAaJ4tQEuBxgOEpliAC4OJgAAACLUIZACcUJBFTiIMDxA0zRATiQCgD8DTISYCZEIGHoAQMhy9MgUuAxYScB1ESKFJEogCiEAidKTUAEBERoYBSthREAhjnmCZsAgAgEIEBGoKYg5EBQIRGxQFAEOIDg4QxV+1YogwgAKULqABIYBMRB8sBwgtA7EgACnKQD0liDNCGTQCEEAMp3IyLEAACrWFQAgBMgICAgSFUCIwt4SRCYAYARRAiMmWBEXioBh2kRSRgJA==","trainLoss":[0.9456,0.6722,0.6033,0.5767,0.5617,0.5518,0.5461,0.5423,0.5406,0.5408,0.5414,0.5381,0.5334,0.5324,0.532,0.5348,0.5351,0.5312,0.5323,0.5261],"loss":[0.748,0.6315,0.5911,0.5707,0.5594,0.5523,0.5476,0.5443,0.5417,0.5397,0.538,0.5365,0.5354,0.5347,0.5337,0.533,0.5324,0.5319,0.5316,0.5312],"accuracy":[0.7935,0.795,0.795,0.795,0.7945,0.7955,0.7965,0.7955,0.794,0.7945,0.794,0.7945,0.7935,0.793,0.794,0.794,0.7925,0.7945,0.7925,0.7945]});
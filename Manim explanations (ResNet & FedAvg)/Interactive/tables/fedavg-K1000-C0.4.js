@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K1000-C0.4", {"clients":1000,"fraction":0.4,"perRound":400,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAErASYC9QHrAYkB4AHBADcCzgHwAE4CeQFHAWQA4AE3AcIBOwL9AE8CRwEyAtYAewHNAE8BaQFcAXsAEwIUAVQBNgHLAGoAKwL+AS0C9ADUAS8CqACyAfIBGwI4ArMBCwE3AfgBtADUALEBcgDzAMoBHAL1AccB3gGoAeUAZQDsAYQAuwB5AZcBPQHBAIcAfAGiAYcAGQHDAboBAwKsANQAZQAzAXcAAgEMAR0BHwGVAOkAKgIMAQcCUQIoAb0BZwASAcIBiQF8ACcB8QGqAcsBrQAOAiIBVwGPANAA8QA0AtcBTQH8ADYBIwJ1AbcAEAHgAN8B2gHjAXAB3wGZAboAegBBASgBAgKRAGQAJwKtAWoAVgFKARwC7wApAVIBxAHPAb4AMQLPAFoBqgEiAiQC4wCeAAsCAQLAABsBcAFWAcEBEAIoATUCxQAKAUsCKAGfAXYAmgD6AXoAcgAFAcUAOAEaAi0BWwEgAaYBOgE0AYYBPwGEAXEAcwBPAb4BeQBQAiMB9gESAQwCKQLrAL8A0gD7AJ0A8gA9AYgA8gArAncBAAETAegAlgGrARcBCgH1ATwBFgJcAQUBsgHWAb8AAgInAogAbAEoAtkA9AF7ATsBkwAMAkcBwQAXAsQAjgHJAKgBUgJ/ASUC/gEeAYsAbgAzAoMBswFhAVcCHAImAuYB0QE+AacBAgHeAW4BZgBeAS8BKgIWAnsBOQI6ArwBegHKAJ8BEAI8AZoBHQJjAWgAZgGMALMA8ACVAfoAjQDMASoB2wHAANoAogH/AJ8AgwDcAJUA+gBxAQQCRgFDAXQBtAG0AOsBywGAAcsBKAI0AS0C5wB/AHoASQI+AekBIgJpAfIAngChAO4AAgFCAo8AHwFUAsQALAESAuAA9QAfAaMAvQAuAkACMALcAXYBoQBfAZ8BpQGfAHcB9QCTARECIAHVAO0AsQGRAYUAYQGlAWsBlgH6AAoCNQGYAR4CfADeAcsBxQH9ADkBkgAyAYABIgIOAu0AgAFQArQByQGRAMoB9QGzAR4CTgHBAKUBfQB3AI0AtQDuALMBUQLtAXQB7wEWAc4AVAFtAHYAgAGjANwAfgFfARMCsQCwAVEBDAKFAYABpQBwATABngFrAQMCEAKHANQAVAGvARcCnQCgADMBmQDaABQBbwAKATsBagAUAiwBkQBeAQMBegEiAo8AfwBRAsMABQL/AWgB5gBlANkAkADpATQCdwAyAngATwH4AP8AHQF4ADoB0wBNATwCzQCNAbIANAFDAWwBhwAXAiQClQD4AYQArQFFAe0BHwKvAJoAqQHZAB8CmgDXAWUAEwIKAvMB2ACZAIAB9wDYACQBcQHiARYBzwEnAbIAGQH+Ab8AJwEbAWYAQgJ7AOgAmAGVAT0BMgLBANYA3wHgAQ4B9QFoAA4BPgKkAIUB8QFiAbcADgFFAiYCwQDfAa0AJwICAdYBAQHAAbcBVQLcAbIB8wGCAYwBYwGNAGgBRgFIAfIBaABxANsBxQAUAtoAxwDkAcIBMgEcAjABOQJBAasA3QFUAnABjwFDAucBSAGkACQC3QBTAX8BxgAkApkAfAEjAqUApQC9AAEBPAHDATIBhwD4APUARQFKAnYAbgFHAqYBGAGBABgBnAFPAREBjQGtAEECcQHOAaYBygAWARIBiQHDAMoATALhAUsBlQD7APkADQLoAawA7gFfAfsBgADwAHABtQBzADYCSALvAWkBwwH6ADEBegDVATYC0wEhAmgBPQHfAHwAPAH7ARoCKALgAKkB8wF8ANMB/gCjALEBugFxAG8BAQEzAiACmwBAAb4BmwGyAF4BuABRAZUAqAHBAaMB1wCjAFkBPwHzAe4BoQBLAvgBTgLbAA0B7ACdAVQClwBKAcsBpwFhAd8B/gF9ABkCtADnAL8AIgItAnAAZQGDAfIAqQBZAc4AGwGJAI0AfACwAcABfwHGAAABDgE0AqwA8gE2Ar8AuAC4AL4AQAL7AQ4BjgAZAZMAnQF6AVcCOQKvAcYBUgIOAqMBHAFFARMC0gGrAAICowBlAdAB9gG/AZkBcAFqAYEBSQKcAbsBHwHcAS0CwQEmAeEASALvADECZADHAJ4AFAKaAPkA+AASAe4BwABTAqgBkABzAaIAPQJGAmkAcQDkAXYBkAHFAc0AtADyAAkBEAK9AcQB3wAdAt0AjQCzAakAXQEFAawBdQGqAWQBZgC7AK4ACQHIAdwBzgHYANEAiwFCAmwAvgCNACsBlAG5AM4BjgExAVkBPgHUABMCKQGzAQgBYgEoAaoAIAJDAmcA7QEqARcBVQLGAT4C0gFrAJ8BXwEvAYsA1gELAY4B5ADwAMkBNQHxASsCmwEOAoMA9ACNAKIBtAHIAUgCoQDoAXcAwQAIARUCFgFDAbUAZQAFAu4AVAJOAVMBJwLSAZIB7gEAAXQALwGVAIgAHQLJABMBUgIeASgBagHJAdEB4QGjAFYCYQFtAWcBOALMAf0AdwGCAZ8B2wFxAcAAUwKHALMApQCzAeMAdgF/AG0AEQGZAFICrwDoAFYB4AAZAaABbwB9AL0BogCvAEsCagA5AkACAAFFAncBKQHdAA4BtAHoAXEARgIbAusAKgGEAK0AhQDaAK8BMQLQAaQBXgF1AGQAagErAhMBmQEIAckAJAE=","selected":"6n3kAWpi2h2DSYEy6IzREgKBRCRkMcXEAjCB1gRFyB7XYACxFlRegLKFEK8EC3CSZzyhXEokYgi6DkxY4xiDirC4SXH86fAFaiBlCzBFJKpJ0eocAEnmIdfcPxm61O0w+wOCMog4IwzzJWdiogFAhQg0dU5BGJiIHV4lwQgkCioArEyEMsMFQgUAbMqOfp4dLCYtO5Am7BzBckFGu7EU7iCEtKJxEAl/IBqSriSg4R7vNjIBm0bCgoruzNluC6zDUvCiqCTRCDmw3BUA6ciMAPibgAFEAwZJ4igYv0ZmHFsqAEaSFCxMAGsD2a4jwr0uCOKFf46IBCwIUlevpOTgRABAaeMuxJKpJgYGd4iKGggpDEFCaAnQ1zJBKhod1UDhS5vB4RpEEioOyQCYcgJ8gICsWyB1miK4gix0f5GAKVZqXhwI1wIq9oQA6QmPeLDlmShgwGksPBlfv14CPfiZHlKMInsJ6Hi4opXSQigoYhCENE41wCEgrCKykx6xVVFF1YEAK88FaDVJqkQEiLQ0o/DUPEghFmVAISCZCeYYkLGEPFLCkluSjmxDvZqXCBDzFWFbdyCEwIfCAdFDMygQB18IiEuGqFxSrU+IMO240SQmOTwS5DJgHIGQRoM4r80naOA2HQgKyilZgooJhHzUbSFMwAb0YHVmqcAiwZYXFjIZWOADkAoV+krmMWNDQVhwULpKyAQ770YdRNGkcACBinLkJLqfxpgL0kKAIKMDAfVE50wCmTjGIsxQIbABfICNEm3kJe0wARfB9EQIFZxa+JEBBGGMDTpWTICQF2aEbdAyU86CVpaOVCYjVms6AqHI1hGUFbof7leQoyGUbdF69AlCVdkkjB64PE4zzKOOFSRRMGEyWicYxHCSgtOMuZAQQXYrhFOZgao3EDpqxgu3kgQicEUG3MwFFwY64oAe4BkLFRmNZE4rgMGhRAFiccZ1RA8VaZBQBCLEEEAUAFEx2YAge7UIq/OGoW1FSdABQGrloCeGeMqixfoDwJp3EEASEUBYGdB53saBpUBgC5EnAnDTLoCSW/UqAbeC02CNhBHWAbFiQSwV6kODktI1MmRYYSvAZJpHNVN5QAoRCdTXNTGYO51xZBzhAaTMkBiGCYygo7BOIMHGQSLgHeSmSFYQPqqAREMbB89GoJsFLgNHCoZDCBxLy6AlLOAjLftThgxAGE/rUdR0AaCGsUDDuQpUxmEUiLnUJKK2CD7SVsIgVJoskMKDmBwBSqtInUQUwoHqMEV+OPp65yicsYyhAoQt1RbEz+ABDiaGS4gBwRCBBAMFipEjMNAguKZsMBHZcC2T9qGzcs620YlfF0+MNoksJpgsJGvRaZQAyRlMTDllUJhA1kiwWyCTQmSAK1Gdxd+oWo/AdA5lRaAA+QAvsQkoXUUykgcoPvIjygMOxQBrqHGHAdSNjAqAiWx4OJQMNtVKARBrIgBmPIMUAUEhwAAeawihQS68DY52SimmYpOPM3bbThIDLV4oTtUHWyEYeNQg0u0aifGGSAjuikMxcGhip50RyICE8juvcIjORErZPBIARgolJgXgcAiQIIIB3DtL/wmcj5MRM5S0SsGad2ZimB4OlOKIpkgyYoEpQCqVJcERIK0CO5AHQFNgGBEWfnjVgBIKRFjKvcgG6YpwYRIOUw4B4CR14gT6sONSgsAmwjzFGfl9zhDAADAEboAODYMDzPGtwsaK0XIsREkjgeACUsmgOrNIunigUJEqEAVOpA5iIXhTAgaTuKBJMDUpKqaGGDPENIiLUkyT5MmYBS6eNHLqrwZIhyKSMXKUFCpMaCxebEed9RMPJowKyZCwTU8YOdIHxCLA+A3kLCKhQ6/IwaNDPAo2xKmhgAS+UgaCoJQgUNGMFqgExslQUEbAAVNxniAlQRNO9UpJXr0AIE8hZhRIiDjyZPVIUV5rVAYJihDkgjIwJuvLIQjLLqGt+KYYqI7jBRSGaTIAK22jXwWRLhoDeyRgcMHnHrMKgCjRyYUWiBRtoXABgjeq4tGwWTsezkMSEoCwgAalaWIDABVt0J8sBJ0poECchvY7AIhJ/0hls37WQNDhcfqVRAziij/wwYUMM6RpFMCIzGEEULtRQ8lQwAxAk8MFmpuAdMM/GAAS9b6QURTooDgQkAzCDdD5T6Ukp5JoDKaOAsSaRodtySRyhgklnDSQlyBnYhQgmRjGjpOLMKZGgXqReGCotl+R6wioJSIYM4CRBmNY1pPMAAJSI4OrABSQTZI46IhqGltQIkpY/24ry+wV25gQBMfIIINLvh5/AUMbyR3nElPCGh3lvEgwAB1AFpRPCgETEukgPcAAATVz1gcuo0KOU15lSBFYVIBotXMq+w0iAAkfkCBiImnDQ2JBYcqJKE+kgAYZNfkRYrTcdvqQMsgmcbTIYEETYQXTnMkQ0EgIHKKsdSBYdLxAaAoAT1hsgrTyFGOuYvykaIUJ+41htxyAmEjwjBCgmSJynAE0S3FITcicIkDAcyqmQCUz2rFAhyP9AxY0tD1hczcCOamUkYgqYVOgHaIeDgbxwSXUEgdkEIjwNWXEkBcBCgOkVAwN8xgip24CfA1h5DpCsBEaFA4vRmbEqtRxzeC0DAQ4wdpk7zxQjb98CIFNJJiBLhQWAJYamBOQdDIBcB0JI1EAw1HAtJZcfIilNDUFiJVAlB8VGkQitMWGJ2IJEE2dpRSfSwrJwaL3VCECIFguXU9gQWKK7iMlPSLQe4OvqArQBCBZMxQAS2Agke6SRMIVbQgBUCF9okqI6fsXgUQMQIAOLGPNB7pw2AAJqlQcsK7IOFESJucKt8KcBc3caTFCoiNLkYgUxISs7WzYQAXjIABvOouIlARA7++JwRYW6Fssi24xOUh1NJSDx0JwC8chTQCS912ZswgpIsUCFkPKugQKsrY4EiMsQJm1NYAgVACAKQCeQcjVPxUlI4gwgjQMTKJOBLXWtaAEBUZCPJARiDGfSHh3ZqueSo2QCwcN9C9JqT1IKbiCHEVpWmfYaIcpC6KMNVaMpfYpm8byjpjDDzidggwFH+ACWAjlDLB/rZBNEjBAQXaJWSMAqxBjD0p0w1CJ0KEDgiKLgpgmQoooFFXvyJghEs2YaE0wkEouxS1N1g1FLgTgghY2AHL8CvgnADUgeKGJBWDnCcAnDQLX0PQcEOJlRaky4uH7K7bYoEhOsCVCrYxAxsEAA4yj4AUMqDDlGiH8EAYUEQeQCWPSiMZheowpCRp/iUABNjSIHMIbTKhgSCipsPM63oggKwlYpVNEQyJARBwCaaH4CBdCHeOQxcoTFjZHHZo+FChGM2bVtJQygmDXmQfwZQ==","trainLoss":[0.94,0.6696,0.6025,0.5748,0.5599,0.5527,0.5474,0.5407,0.5439,0.5378,0.5378,0.5341,0.5355,0.5343,0.5332,0.5357,0.5323,0.532,0.5311,0.5322],"loss":[0.7422,0.6303,0.5897,0.5705,0.5593,0.5523,0.5476,0.544,0.5414,0.5396,0.538,0.5368,0.5356,0.5347,0.534,0.5334,0.5327,0.5322,0.5317,0.5312],"accuracy":[0.792,0.794,0.7965,0.796,0.795,0.795,0.795,0.7955,0.7955,0.7935,0.793,0.7935,0.7955,0.7945,0.7935,0.794,0.7935,0.794,0.7925,0.793]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K1000-C0.5", {"clients":1000,"fraction":0.5,"perRound":500,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAErASYC9QHrAYkB4AHBADcCzgHwAE4CeQFHAWQA4AE3AcIBOwL9AE8CRwEyAtYAewHNAE8BaQFcAXsAEwIUAVQBNgHLAGoAKwL+AS0C9ADUAS8CqACyAfIBGwI4ArMBCwE3AfgBtADUALEBcgDzAMoBHAL1AccB3gGoAeUAZQDsAYQAuwB5AZcBPQHBAIcAfAGiAYcAGQHDAboBAwKsANQAZQAzAXcAAgEMAR0BHwGVAOkAKgIMAQcCUQIoAb0BZwASAcIBiQF8ACcB8QGqAcsBrQAOAiIBVwGPANAA8QA0AtcBTQH8ADYBIwJ1AbcAEAHgAN8B2gHjAXAB3wGZAboAegBBASgBAgKRAGQAJwKtAWoAVgFKARwC7wApAVIBxAHPAb4AMQLPAFoBqgEiAiQC4wCeAAsCAQLAABsBcAFWAcEBEAIoATUCxQAKAUsCKAGfAXYAmgD6AXoAcgAFAcUAOAEaAi0BWwEgAaYBOgE0AYYBPwGEAXEAcwBPAb4BeQBQAiMB9gESAQwCKQLrAL8A0gD7AJ0A8gA9AYgA8gArAncBAAETAegAlgGrARcBCgH1ATwBFgJcAQUBsgHWAb8AAgInAogAbAEoAtkA9AF7ATsBkwAMAkcBwQAXAsQAjgHJAKgBUgJ/ASUC/gEeAYsAbgAzAoMBswFhAVcCHAImAuYB0QE+AacBAgHeAW4BZgBeAS8BKgIWAnsBOQI6ArwBegHKAJ8BEAI8AZoBHQJjAWgAZgGMALMA8ACVAfoAjQDMASoB2wHAANoAogH/AJ8AgwDcAJUA+gBxAQQCRgFDAXQBtAG0AOsBywGAAcsBKAI0AS0C5wB/AHoASQI+AekBIgJpAfIAngChAO4AAgFCAo8AHwFUAsQALAESAuAA9QAfAaMAvQAuAkACMALcAXYBoQBfAZ8BpQGfAHcB9QCTARECIAHVAO0AsQGRAYUAYQGlAWsBlgH6AAoCNQGYAR4CfADeAcsBxQH9ADkBkgAyAYABIgIOAu0AgAFQArQByQGRAMoB9QGzAR4CTgHBAKUBfQB3AI0AtQDuALMBUQLtAXQB7wEWAc4AVAFtAHYAgAGjANwAfgFfARMCsQCwAVEBDAKFAYABpQBwATABngFrAQMCEAKHANQAVAGvARcCnQCgADMBmQDaABQBbwAKATsBagAUAiwBkQBeAQMBegEiAo8AfwBRAsMABQL/AWgB5gBlANkAkADpATQCdwAyAngATwH4AP8AHQF4ADoB0wBNATwCzQCNAbIANAFDAWwBhwAXAiQClQD4AYQArQFFAe0BHwKvAJoAqQHZAB8CmgDXAWUAEwIKAvMB2ACZAIAB9wDYACQBcQHiARYBzwEnAbIAGQH+Ab8AJwEbAWYAQgJ7AOgAmAGVAT0BMgLBANYA3wHgAQ4B9QFoAA4BPgKkAIUB8QFiAbcADgFFAiYCwQDfAa0AJwICAdYBAQHAAbcBVQLcAbIB8wGCAYwBYwGNAGgBRgFIAfIBaABxANsBxQAUAtoAxwDkAcIBMgEcAjABOQJBAasA3QFUAnABjwFDAucBSAGkACQC3QBTAX8BxgAkApkAfAEjAqUApQC9AAEBPAHDATIBhwD4APUARQFKAnYAbgFHAqYBGAGBABgBnAFPAREBjQGtAEECcQHOAaYBygAWARIBiQHDAMoATALhAUsBlQD7APkADQLoAawA7gFfAfsBgADwAHABtQBzADYCSALvAWkBwwH6ADEBegDVATYC0wEhAmgBPQHfAHwAPAH7ARoCKALgAKkB8wF8ANMB/gCjALEBugFxAG8BAQEzAiACmwBAAb4BmwGyAF4BuABRAZUAqAHBAaMB1wCjAFkBPwHzAe4BoQBLAvgBTgLbAA0B7ACdAVQClwBKAcsBpwFhAd8B/gF9ABkCtADnAL8AIgItAnAAZQGDAfIAqQBZAc4AGwGJAI0AfACwAcABfwHGAAABDgE0AqwA8gE2Ar8AuAC4AL4AQAL7AQ4BjgAZAZMAnQF6AVcCOQKvAcYBUgIOAqMBHAFFARMC0gGrAAICowBlAdAB9gG/AZkBcAFqAYEBSQKcAbsBHwHcAS0CwQEmAeEASALvADECZADHAJ4AFAKaAPkA+AASAe4BwABTAqgBkABzAaIAPQJGAmkAcQDkAXYBkAHFAc0AtADyAAkBEAK9AcQB3wAdAt0AjQCzAakAXQEFAawBdQGqAWQBZgC7AK4ACQHIAdwBzgHYANEAiwFCAmwAvgCNACsBlAG5AM4BjgExAVkBPgHUABMCKQGzAQgBYgEoAaoAIAJDAmcA7QEqARcBVQLGAT4C0gFrAJ8BXwEvAYsA1gELAY4B5ADwAMkBNQHxASsCmwEOAoMA9ACNAKIBtAHIAUgCoQDoAXcAwQAIARUCFgFDAbUAZQAFAu4AVAJOAVMBJwLSAZIB7gEAAXQALwGVAIgAHQLJABMBUgIeASgBagHJAdEB4QGjAFYCYQFtAWcBOALMAf0AdwGCAZ8B2wFxAcAAUwKHALMApQCzAeMAdgF/AG0AEQGZAFICrwDoAFYB4AAZAaABbwB9AL0BogCvAEsCagA5AkACAAFFAncBKQHdAA4BtAHoAXEARgIbAusAKgGEAK0AhQDaAK8BMQLQAaQBXgF1AGQAagErAhMBmQEIAckAJAE=","selected":"9o2S8E3OT4UvcAdvhC4E7dBiEz4rDyp4V/Fpb/IDBcov2fCSN4mO0dNdRXLFVInRxJB4Y5BXGUwHtZrOevwp9Qm0zCjmE27OIMP2KBZ27Y9pfNcnd7odAHjUy4C3HeI3xWXzPaDN2Q/HEWRvZcoJwWN4G1c3PO0fqB/SHYD8YMgSFOVBLUHQ7etKTj+dqnArUOV9vhW9DXGoWY7X0R/uvOCNPIP+CFtZY081QBjuta+h5Zb6Y/OCQ+zmsXMVWo+EFti0PCpc0kiMqFI5LmDcoDj+PG3xvWP/iq4TbqOGerLfOCvlhGG3l+6kPwzHRJKmRKA6aE9MoBqauOJ8oCbEG2jMbsguB75j0EBoTVyHeVE1QLMhKNdKcjLRv+suiPt5+IYyCA3sQCOkKgZV8SQsRtOKQqByxYnL3FHk0xPx5qZb9+Esmq8OotNn+x7HlJqj/LpAgi8PD/iHr9V/mLwYcrem0KSzjlfj4Xd8p8rkVt1z2DjDedeT/mm8H5oMWjnCUix2yutIRVi6wA1xqY71+LVY6Q4ycNeHPMyK8Zq4g5axdPLqYnPSQcm6l9QIhqmlY0DlAZYz4igiv7dg0Wg++68+flzKQ58lIvlwHARFbMH8/bQH3BRMJbYmEaXUtljfL64SVmbkLbui80cHWzMfnpfbOkKJ3sX3+H+wwRbnduvyClQ/B4vMR7+5fOVB0RiiJ8StNaA4gIbfgkWorBY/HlN75ERd39rFMi+shEBceR1FTy1RxrEw9bW0Klat+YZmsBSQD8SjxeeeKX7kJmk0nNvwSQq075G8YShvQ5Hyu6SR0p+yKAGsO1ay2aYfAI3R/bd+6Fcsv3tnwcwQFxwKhbS+r4gCFEHuHMsf4dG+Hdi8zXbYZsuUTyC6eIFd3R3cHJPoH8Oso2vrGuCm1MVRvW2n9g71wgBSPgTz6rVmVw8qz5mGOufQ2NBzTmEfIXALKLop3FZIy3dC3tBzxVFD7wQI6+RyY8dwAhhSE/p6Ct7UHgwtDabOddlD+U3dUZg+EsnX8WZTI+r78Nx+uGyjYznWsb40bwtHaSNEZrgBJ5P7UPIiNrq0rUOJMzSa+YY/hmTM5O2rqs8CTaxhkIBxqsRpzeECn5aPh/xXd0+sU6sJ+8gpCCHu3WcnJki4gFaKfDCx9uDB3Tkj4JM9ucGw3qbBthpwWowvFNl5hy5NTzcHGT6SQQnbRRcNb7wyUsFA+fgZpRwwzjtOvdaPownkJXRMOOBOaXM1rplG6BwEdgbQO+Svfmh0vZv+p6G/3p2F17oweBuzDTyS2L8CRJa34Yp2RMDPjTJMM3WRQ8gchXTeyX+WDaXpWwGy5CNr9NfTd6LYL/PJvef8BgRMBnfFOp46wtxPq056xSY7fnolCRgLac40b4/SS0qkxI8l201YNSUFAN6jol/OFfdgu6J2L2VAj9gVrZaLqDX3a5zruW2PvAmFv6DIwYf/ylk3QiQmQY1HAQ6xKwTEhBZ3oXKeY8Orq5GxH2t9CCroU9rvCAznRAYf7AXRnun5f8W4+ozIOW4kmFvVJKVOlJTTFdjzosCOStzh9wtR58M3rGlEMJvyLyf3xhcuf6qYuraOShLB+yfvGM/yPsvyaFNTgEfQ+hgHqE0HrZLyBlorjSQVn1GPdpRVEyrRqZcAVXqhN7CVTcoCP0duZnCHLXGW8qJ4saFrFp4eIHRIMDmwsPERgEqWI7Dv849/wj2dpnV3jv5E/iXtSGLHeX2GDmKvtIfbbwXYLV91Bw2mSaz9EEW+bGYy2ZkqxU5i+U7MxKD79ChujnaECwmvGIcJ8C58eqkV6aq0cuKQR8V67ohh65HpWSfn22/Cx/Rbb52Nj57yANMcWkwfbDOWra9AYHTNxsFmwwZ2JJQeieRh0UI+rpKCDry7bfS3vdL4fHsP0l7JL30cPGv9H7cCMntOKaAhceIxxnKetCVyMTOXvFJzzcAFFcaDOFjCncWM8HlbPGoZmEfE4VapvonHIpIkWsagu8wLrOw89ZA58zWaWDF9XLdDmcUTbBcBO7nyRd2nFJd2rOfGcIXZV349xqD16gA1G3DDDeT+AXPIVR7tJTqY198MDpbKpf9wGTXBmA2Tiy//4r9EJucCj0wKW5CWURTXT1ZtqERryiJQRUbngXUZTHF7yGvkC7lGx0QYlm8UZF6t0e/kd+AUc7+QCKVpSN28xsbbTOkMQdIzK/1ai9W/Q/T7itK2l1tms7gTv6Phv1AU1P6FmYFjDuMhsdigcwiNQkXy8OYSSE2a480dJUTqMmlffrfSirlszLEspRM+OSbXDxknq7wpQZ8Po6mgqbapIEhKi7bYqOJjmlFN38gynkTpmyHrE7Sxfnj6Q+xyIWyrun4TTid7ko+t44B6iWJqZwISsoIhzQdfQG4RHRMU+XSATPHSX+gr6QU/LeDmzCJnAoD7wOxKzvjmb/N96pUi7leWjizVAe4/Iil6fkk7LjhpMxe4lYEbMlS3BGUa9/dqb5lhXqXgpwEJzwfGtHT6WaQGP2nb2a5X0Yxcao4fdax0qiORhfUDog828kpsZBqKUbRJvLq6pZVbLsEDiTb+6wemplUhsnnyYsgp9jBA9G7Q/ecyUW2BOrFJOaRGKhcsB3yN6+HVpC5FrTtevjXI+wh9FnIGct/O2d8vCLmSB41qmaoMVRnPx2f7n4MrUWtc6z7DjXR/uSXnT0EWCNsG9XYjx+K6ZJ2fDjzg+V5mQU3Ff9/qBxWxfOMqSCqsEKA2Xz1FgRGzprlAMZMpuIBOcHkt8rdv5khD0/txkOVTANBYd4Iwl6jWFHIPb0I2B0A6CvoXGC2giR7zYngaz5vf94dE2VWOZMo4+otTxnCPgS6BCfSUXTe8RJAVkXHfhOPArB42Xq9xvrVG9UUyb8kwncYBPUcUqyK+8nQzCu+xrBctG0su5sjxGAwOb3xoFRrj8lO+uGJb/+GQB1ymYWzOBfx+vJQLcI5r4DX9coBSt3gR9noBLOq2R1PNT/yOf2F3wDXwiRm6DkGqKjaXvO1NVK6zR9iAxUqkd6zrxidwXRI2pFzEw8zkCZNchma35cm+bqlGYTN6zF/qoNulCGgT2s/eskN0kd0f7jL7wdo46RgHYsYX3k+sMVrslKammrArmgWoGv16lCE1qHdG8DAUv+sYD2YhAum/VtOYpg3ew1DQKqd0g/mcSoYx6dTCSj2v5G5/FJzzYrbjdZJSnyPYJnHEuQMW7zxJjApXiuxiblV/3QwvhCSCyIYk2u2whE5WvBJhRX/pNIT6NGsvSr57CG8EwrjM9Nwx3TQG5fH76rD0eo+2JCgOxeUU38Dnz56128gqrVAPKw==","trainLoss":[0.9397,0.6686,0.6033,0.5753,0.5598,0.5529,0.5487,0.5404,0.5428,0.5379,0.5383,0.5387,0.5372,0.5323,0.5349,0.533,0.5341,0.5308,0.5348,0.5322],"loss":[0.7418,0.6318,0.591,0.5711,0.5595,0.5522,0.5476,0.544,0.5416,0.5395,0.5381,0.5369,0.5357,0.5348,0.5339,0.5332,0.5326,0.5321,0.5316,0.5312],"accuracy":[0.79,0.7945,0.795,0.7945,0.7945,0.7955,0.7955,0.7965,0.794,0.794,0.7945,0.7955,0.7945,0.7935,0.7935,0.7925,0.7925,0.7925,0.792,0.7925]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K1000-C0.6", {"clients":1000,"fraction":0.6,"perRound":600,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAErASYC9QHrAYkB4AHBADcCzgHwAE4CeQFHAWQA4AE3AcIBOwL9AE8CRwEyAtYAewHNAE8BaQFcAXsAEwIUAVQBNgHLAGoAKwL+AS0C9ADUAS8CqACyAfIBGwI4ArMBCwE3AfgBtADUALEBcgDzAMoBHAL1AccB3gGoAeUAZQDsAYQAuwB5AZcBPQHBAIcAfAGiAYcAGQHDAboBAwKsANQAZQAzAXcAAgEMAR0BHwGVAOkAKgIMAQcCUQIoAb0BZwASAcIBiQF8ACcB8QGqAcsBrQAOAiIBVwGPANAA8QA0AtcBTQH8ADYBIwJ1AbcAEAHgAN8B2gHjAXAB3wGZAboAegBBASgBAgKRAGQAJwKtAWoAVgFKARwC7wApAVIBxAHPAb4AMQLPAFoBqgEiAiQC4wCeAAsCAQLAABsBcAFWAcEBEAIoATUCxQAKAUsCKAGfAXYAmgD6AXoAcgAFAcUAOAEaAi0BWwEgAaYBOgE0AYYBPwGEAXEAcwBPAb4BeQBQAiMB9gESAQwCKQLrAL8A0gD7AJ0A8gA9AYgA8gArAncBAAETAegAlgGrARcBCgH1ATwBFgJcAQUBsgHWAb8AAgInAogAbAEoAtkA9AF7ATsBkwAMAkcBwQAXAsQAjgHJAKgBUgJ/ASUC/gEeAYsAbgAzAoMBswFhAVcCHAImAuYB0QE+AacBAgHeAW4BZgBeAS8BKgIWAnsBOQI6ArwBegHKAJ8BEAI8AZoBHQJjAWgAZgGMALMA8ACVAfoAjQDMASoB2wHAANoAogH/AJ8AgwDcAJUA+gBxAQQCRgFDAXQBtAG0AOsBywGAAcsBKAI0AS0C5wB/AHoASQI+AekBIgJpAfIAngChAO4AAgFCAo8AHwFUAsQALAESAuAA9QAfAaMAvQAuAkACMALcAXYBoQBfAZ8BpQGfAHcB9QCTARECIAHVAO0AsQGRAYUAYQGlAWsBlgH6AAoCNQGYAR4CfADeAcsBxQH9ADkBkgAyAYABIgIOAu0AgAFQArQByQGRAMoB9QGzAR4CTgHBAKUBfQB3AI0AtQDuALMBUQLtAXQB7wEWAc4AVAFtAHYAgAGjANwAfgFfARMCsQCwAVEBDAKFAYABpQBwATABngFrAQMCEAKHANQAVAGvARcCnQCgADMBmQDaABQBbwAKATsBagAUAiwBkQBeAQMBegEiAo8AfwBRAsMABQL/AWgB5gBlANkAkADpATQCdwAyAngATwH4AP8AHQF4ADoB0wBNATwCzQCNAbIANAFDAWwBhwAXAiQClQD4AYQArQFFAe0BHwKvAJoAqQHZAB8CmgDXAWUAEwIKAvMB2ACZAIAB9wDYACQBcQHiARYBzwEnAbIAGQH+Ab8AJwEbAWYAQgJ7AOgAmAGVAT0BMgLBANYA3wHgAQ4B9QFoAA4BPgKkAIUB8QFiAbcADgFFAiYCwQDfAa0AJwICAdYBAQHAAbcBVQLcAbIB8wGCAYwBYwGNAGgBRgFIAfIBaABxANsBxQAUAtoAxwDkAcIBMgEcAjABOQJBAasA3QFUAnABjwFDAucBSAGkACQC3QBTAX8BxgAkApkAfAEjAqUApQC9AAEBPAHDATIBhwD4APUARQFKAnYAbgFHAqYBGAGBABgBnAFPAREBjQGtAEECcQHOAaYBygAWARIBiQHDAMoATALhAUsBlQD7APkADQLoAawA7gFfAfsBgADwAHABtQBzADYCSALvAWkBwwH6ADEBegDVATYC0wEhAmgBPQHfAHwAPAH7ARoCKALgAKkB8wF8ANMB/gCjALEBugFxAG8BAQEzAiACmwBAAb4BmwGyAF4BuABRAZUAqAHBAaMB1wCjAFkBPwHzAe4BoQBLAvgBTgLbAA0B7ACdAVQClwBKAcsBpwFhAd8B/gF9ABkCtADnAL8AIgItAnAAZQGDAfIAqQBZAc4AGwGJAI0AfACwAcABfwHGAAABDgE0AqwA8gE2Ar8AuAC4AL4AQAL7AQ4BjgAZAZMAnQF6AVcCOQKvAcYBUgIOAqMBHAFFARMC0gGrAAICowBlAdAB9gG/AZkBcAFqAYEBSQKcAbsBHwHcAS0CwQEmAeEASALvADECZADHAJ4AFAKaAPkA+AASAe4BwABTAqgBkABzAaIAPQJGAmkAcQDkAXYBkAHFAc0AtADyAAkBEAK9AcQB3wAdAt0AjQCzAakAXQEFAawBdQGqAWQBZgC7AK4ACQHIAdwBzgHYANEAiwFCAmwAvgCNACsBlAG5AM4BjgExAVkBPgHUABMCKQGzAQgBYgEoAaoAIAJDAmcA7QEqARcBVQLGAT4C0gFrAJ8BXwEvAYsA1gELAY4B5ADwAMkBNQHxASsCmwEOAoMA9ACNAKIBtAHIAUgCoQDoAXcAwQAIARUCFgFDAbUAZQAFAu4AVAJOAVMBJwLSAZIB7gEAAXQALwGVAIgAHQLJABMBUgIeASgBagHJAdEB4QGjAFYCYQFtAWcBOALMAf0AdwGCAZ8B2wFxAcAAUwKHALMApQCzAeMAdgF/AG0AEQGZAFICrwDoAFYB4AAZAaABbwB9AL0BogCvAEsCagA5AkACAAFFAncBKQHdAA4BtAHoAXEARgIbAusAKgGEAK0AhQDaAK8BMQLQAaQBXgF1AGQAagErAhMBmQEIAckAJAE=","selected":"f1crf1yXi0/kuRdNEV+bFy2b1uiXPVvSf+krqO++Y8ifzb9Z68utyzgns5Em8Exju/1kX9l/3ep9W/jsOWvxOxZuPvvQ6/tz/+doEpUUN+v7lVDPqj867/7X21fX7Ki5ptbQV5f2r4hgKVyn52X/F3M/+W3vJCsv2UrKnC4fv8vS9pHPrx5U8aMTnbPenKeqfQ/5t9daTDk9yOpEXz7+3sa+ZzEC1oafzcOPVszJJyzel948+SbROWe2//vpz/3zVZmxQTu+up9t02rujnDvOcc/UTL9eyeXmk2zHt9kNd+gfv7Xd6yUWff+/Lfa2dSYeJf8HYmcTvZn3f78+3/+xLN9mGO2rvOW9Jf2u90173E+6vBrFyXzFVasen/+7qr75NhCh/3Aw/d7fc0zC0pnfU+KZv5u0g/K+bRy8F21kiNd+Jjt6fa/fKzjXcG3uGwRB2co7o+5w79K/zdLffvELtbvVNiBB/6o9Gf1fmqD9WlNd/O3upNX++JuJl/lu+zOHX2njTPzpv8f7f1vnf+qc6/HTe79P+59pvXYVlL9m4vFXxa2tH+E7L7dDyzedW+HF/v5L02q+NxDt6Lntm1hhS93OPc71j539WmfKGwxdFy8T9PfHu+9/9o1OBohppZt4/Oo0Dfm3owQFfMEzjQ7Pfq8cwJT/cutFtvfuy5wnw3KuGXPys/fT23KJtMy+dZVzn8yXUe6/rtFJ22z7HL+g9cxvFIt/L7EO9z/8/3vsBUU3Xx9iqdruu3wfd7Z9902LOQXQ3Re1a5sv7vCuVty0jPx1O3+b7fb9r+hZKRq9buKdfVyyL+9qJZWiu/8mDoYaga7d8GzIPi//di83yIOpH4vJ39HlLP3Ud8RtW91f96k+//rW3tFzQQ6V++lw3OaV59+9v+AS2nb/T2yD/95fvajTW0rGpvPQh+vT/ErL1y0XPWZGb6tTOSIv3rWV0B+P/1IN6Hn+3+4/SFt4P7f6lPWte95wKZPShhe81/4nzee+fbO9hrL2Qu+BeNUlX/V/pYr2nmcJf//hNb3XfHdIu7aw0THVJzdfl0lbuHzsf77Yh/gSfxWiaxffF+pmSdxvvZ1fsa+fG5H9vG6mfZv1l/+/48Yrni+F9Kn+k3Zg72z8z4nXp5jX+YbQwjHRl/NlRuPb8MYb/NSV7u5ZZnu1/v/aVfXTztLLu/4cW0elrS3OFP708eY3hu0Ap9aDTe+06upqmcP4FSfd2bG+IQwK2+9r/3/dyb/OtE7fqfb6Jd9zM+p4XWfN++LnhNq/7frIuO65RRy31zix1Arr/f2XuunLoufPHL0h/r135iDcVbb4YB8dx/5WJKT4XMV/3noKX1VTrmm3vvVHPQTjVfyrb2o6+NlgPOXmM08Q+evfvn178LbxoufL4ofP/v/z1Qwr1fK+F9lVJnCqzv85vy/vbndRJ8FXv/jCjrz+Fi9F/2ldmp/OLn3+uiTuPlfrvMau3U7wQOOT79jVWTfk/+/PoAO5p92Rp/9fzt86/nsX/syX3dfqWXEebi4mPVCffHv/J0JxtUMx1Fj/P//Uhpu7QIxLfl5wbPfqmfA8bf3N2a0/s6057/5d2LXnPvtcezE6FXu2jVfk/ma9Fg5um5VlioENcf6GH9eK9ZGsS+XS+W8ngFpK22f95OP/zf1zv6d141b9alqrd3Vp30plnE1Y+6L349Nemv+pMbvF5lXLxWfn92+L328GciaQWl+JOeXvpZ+et7ct/HVEF+9punzlSkr2irb5v577bqfKnEfP9XspPRfgWGNpvynqtXq39SJ4Jf9/m4yO70nflnLcaXJ2vr/jV0XvVc5fQd3wti3c0A17ek7sfWenV7d0Mrj+qONh7/C5c5++RNcM3fbiN3Wl3F7nD/Wu777dvm968Nppary177tt6aubtw3/Gvj7C/4fjZ7f23fvAQe3H6Zrcgc9rGx5P+O87ifaps/srCr7HnWBVCPy2hsmvk/hvSM4yXFastcr/ykuL/Nd6fK7R1bO7Tb1z+jb5/R9NxhveFVW92td/zwFF5lkf7Lby/jK5hNdEW3XkKc/UfluEPU3/PtnR4R19V7F1yDEruro+eQ/6H3yDu/3XYuDYjp9zJbfUPre3aSe2fW+kyj4+9dcH4N79wsdz4N/WfKz+fWV0vie8n312/e/ZOuQaM9afbFYv0h8Pmccvxf7uOU2doP7b46L2bna27d5Znq+R/nWgjd+zPnKmutcrX6pDxHio+x/2nDP867+nde/k6muqd9UVTxSVy4v5v7lEJE0R/x4l3TVyfey1J1j/D24r2PjtH55k33a6dn6b/9zKijL0ddlt+7xB37qfW6NU89TKeo4Q0WZpm3HAY/0O+Wq3pv6l/taI9Po4uunxDbp16MNm6RpJ/7ep/XNdT813aJaetWN7WgMj80zpnopvrYmz555cf+u/7hyOnX2y/ufFLvVO8jCav23re7uq92L383pr89S3l+WWz+XPcud5vGIov/p5rbSPXn81bbf7gXvrGnC/9BUpc2N/PyPy49utwkg420P+68PoH9wxv8v08ba6y8eHWa14dz3mFsiG9d5l9q3hTg/brz2fs0/rZ9v79tzsQ7Dzp5+adNafQfnPyZT8wlPyzgcu65eJ/sX+/Hw/m3dc9Fzv1lHWaZeHK/VVisj/v+cK/PIytxf39k0ot46TZ+V2OZ+2uZPrLnb/9p1Uh+7Om/Q6NyanH7dXqg86telTWz7bzP07/tfsmP69vLqc/17dpF5kxu/pH9Xrn7z1cRi4A14z9je69yh/Fhbohr6wda8kyT50PTJZodPf9Py/VS0QN6e/m+2F9F+bEf+Lm3WZbtLD6Brj89sC1LnWzuLz3V9j6+tG/v2sxUfHz//g87+5trqgqbxhe+s2s7x79DdqMaxu5nIHz7s/W9+s3dF95wvvw5X58kLPErBAL2Cnrdd5SKk/U+v/GS63qvf/+qWnFHxvZYN9s3dcfuaZOK9qKf/13urKzhy65SUI79d815OVvb/f/dqf5+RVXNINkzzLdgswu21wB1dk0rJbfWrbtXdb2dP9e+vnk0kSmu/9i+jOdOU9hPx99X+xC8vWpx7tOJDW34jdm2Pdm3mZU646+XUwW9PTZpVLszm9vZkj52k9Xxd0XBKnz5Huzd/m79bmlN/7nO9/HzvuXfQri7/671euXiM9H8p3/wurV7P6Hvvvrmsn4Ow7bUrVyWd9g9bq6n+1DcsDN1vnq4zV9CcpHjfOW7prWSzrtbclw3L30t/f/tKB72sLfevLg9+3HvdQzQecw/yNWZosDtfqg02Pdeb9MAHe/wdLHt2/W8+on4toz8/4Dmrd7TFw==","trainLoss":[0.9414,0.6707,0.6041,0.5744,0.5614,0.5533,0.5477,0.5427,0.5405,0.54,0.5355,0.5364,0.5364,0.5345,0.5333,0.5333,0.533,0.5327,0.5334,0.533],"loss":[0.7428,0.631,0.5901,0.5702,0.559,0.552,0.5474,0.544,0.5414,0.5395,0.5379,0.5367,0.5357,0.5347,0.5339,0.5333,0.5327,0.532,0.5315,0.5311],"accuracy":[0.794,0.794,0.7965,0.7955,0.7945,0.796,0.796,0.7945,0.795,0.7935,0.794,0.793,0.794,0.793,0.7935,0.793,0.792,0.792,0.7925,0.7925]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K1000-C0.7", {"clients":1000,"fraction":0.7,"perRound":700,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAErASYC9QHrAYkB4AHBADcCzgHwAE4CeQFHAWQA4AE3AcIBOwL9AE8CRwEyAtYAewHNAE8BaQFcAXsAEwIUAVQBNgHLAGoAKwL+AS0C9ADUAS8CqACyAfIBGwI4ArMBCwE3AfgBtADUALEBcgDzAMoBHAL1AccB3gGoAeUAZQDsAYQAuwB5AZcBPQHBAIcAfAGiAYcAGQHDAboBAwKsANQAZQAzAXcAAgEMAR0BHwGVAOkAKgIMAQcCUQIoAb0BZwASAcIBiQF8ACcB8QGqAcsBrQAOAiIBVwGPANAA8QA0AtcBTQH8ADYBIwJ1AbcAEAHgAN8B2gHjAXAB3wGZAboAegBBASgBAgKRAGQAJwKtAWoAVgFKARwC7wApAVIBxAHPAb4AMQLPAFoBqgEiAiQC4wCeAAsCAQLAABsBcAFWAcEBEAIoATUCxQAKAUsCKAGfAXYAmgD6AXoAcgAFAcUAOAEaAi0BWwEgAaYBOgE0AYYBPwGEAXEAcwBPAb4BeQBQAiMB9gESAQwCKQLrAL8A0gD7AJ0A8gA9AYgA8gArAncBAAETAegAlgGrARcBCgH1ATwBFgJcAQUBsgHWAb8AAgInAogAbAEoAtkA9AF7ATsBkwAMAkcBwQAXAsQAjgHJAKgBUgJ/ASUC/gEeAYsAbgAzAoMBswFhAVcCHAImAuYB0QE+AacBAgHeAW4BZgBeAS8BKgIWAnsBOQI6ArwBegHKAJ8BEAI8AZoBHQJjAWgAZgGMALMA8ACVAfoAjQDMASoB2wHAANoAogH/AJ8AgwDcAJUA+gBxAQQCRgFDAXQBtAG0AOsBywGAAcsBKAI0AS0C5wB/AHoASQI+AekBIgJpAfIAngChAO4AAgFCAo8AHwFUAsQALAESAuAA9QAfAaMAvQAuAkACMALcAXYBoQBfAZ8BpQGfAHcB9QCTARECIAHVAO0AsQGRAYUAYQGlAWsBlgH6AAoCNQGYAR4CfADeAcsBxQH9ADkBkgAyAYABIgIOAu0AgAFQArQByQGRAMoB9QGzAR4CTgHBAKUBfQB3AI0AtQDuALMBUQLtAXQB7wEWAc4AVAFtAHYAgAGjANwAfgFfARMCsQCwAVEBDAKFAYABpQBwATABngFrAQMCEAKHANQAVAGvARcCnQCgADMBmQDaABQBbwAKATsBagAUAiwBkQBeAQMBegEiAo8AfwBRAsMABQL/AWgB5gBlANkAkADpATQCdwAyAngATwH4AP8AHQF4ADoB0wBNATwCzQCNAbIANAFDAWwBhwAXAiQClQD4AYQArQFFAe0BHwKvAJoAqQHZAB8CmgDXAWUAEwIKAvMB2ACZAIAB9wDYACQBcQHiARYBzwEnAbIAGQH+Ab8AJwEbAWYAQgJ7AOgAmAGVAT0BMgLBANYA3wHgAQ4B9QFoAA4BPgKkAIUB8QFiAbcADgFFAiYCwQDfAa0AJwICAdYBAQHAAbcBVQLcAbIB8wGCAYwBYwGNAGgBRgFIAfIBaABxANsBxQAUAtoAxwDkAcIBMgEcAjABOQJBAasA3QFUAnABjwFDAucBSAGkACQC3QBTAX8BxgAkApkAfAEjAqUApQC9AAEBPAHDATIBhwD4APUARQFKAnYAbgFHAqYBGAGBABgBnAFPAREBjQGtAEECcQHOAaYBygAWARIBiQHDAMoATALhAUsBlQD7APkADQLoAawA7gFfAfsBgADwAHABtQBzADYCSALvAWkBwwH6ADEBegDVATYC0wEhAmgBPQHfAHwAPAH7ARoCKALgAKkB8wF8ANMB/gCjALEBugFxAG8BAQEzAiACmwBAAb4BmwGyAF4BuABRAZUAqAHBAaMB1wCjAFkBPwHzAe4BoQBLAvgBTgLbAA0B7ACdAVQClwBKAcsBpwFhAd8B/gF9ABkCtADnAL8AIgItAnAAZQGDAfIAqQBZAc4AGwGJAI0AfACwAcABfwHGAAABDgE0AqwA8gE2Ar8AuAC4AL4AQAL7AQ4BjgAZAZMAnQF6AVcCOQKvAcYBUgIOAqMBHAFFARMC0gGrAAICowBlAdAB9gG/AZkBcAFqAYEBSQKcAbsBHwHcAS0CwQEmAeEASALvADECZADHAJ4AFAKaAPkA+AASAe4BwABTAqgBkABzAaIAPQJGAmkAcQDkAXYBkAHFAc0AtADyAAkBEAK9AcQB3wAdAt0AjQCzAakAXQEFAawBdQGqAWQBZgC7AK4ACQHIAdwBzgHYANEAiwFCAmwAvgCNACsBlAG5AM4BjgExAVkBPgHUABMCKQGzAQgBYgEoAaoAIAJDAmcA7QEqARcBVQLGAT4C0gFrAJ8BXwEvAYsA1gELAY4B5ADwAMkBNQHxASsCmwEOAoMA9ACNAKIBtAHIAUgCoQDoAXcAwQAIARUCFgFDAbUAZQAFAu4AVAJOAVMBJwLSAZIB7gEAAXQALwGVAIgAHQLJABMBUgIeASgBagHJAdEB4QGjAFYCYQFtAWcBOALMAf0AdwGCAZ8B2wFxAcAAUwKHALMApQCzAeMAdgF/AG0AEQGZAFICrwDoAFYB4AAZAaABbwB9AL0BogCvAEsCagA5AkACAAFFAncBKQHdAA4BtAHoAXEARgIbAusAKgGEAK0AhQDaAK8BMQLQAaQBXgF1AGQAagErAhMBmQEIAckAJAE=","selected":"v9v+61/vW+T/8vbjqy7pr/nuTOXfH2fUPTPcN2udc9tntu0355u22U/qp/7+q3sf05rnv3b4/91+jv/87X07+vn3+69cpWe+u1b1bvv//VP//rfc97dG/qd3yyTylxr7effNtaLf9pm/Zz69Evvnz7ufv+vsx/X3/f335/v/rV4f/6e65zf37H/scef8783T+qg33+Nf3dvbtn75/7W+7FT5675/p0/V+403xTu//sfa9fv1//+svut9/39fh910+b3/2+0bn1bvHd9eUOLe9/98ff58P/2wXG53nX+hvefy/w/6wtrt6VfzK/lb6q89fbe3vO7bmPrnzf9vvB/bTtt5wl/+d87r9Of6l8ov/f1V9/S7aX0OEnb7339u3fvOtMP7/Ty/djHt+eT99e33btf09T+87ifzm79Y0f/fuN+2r/9X337/2b7LOu/9fk6K+rfa9X+9WVYr+jN7v5h2at9s77v3Pv/j8rb/5/+DP/3f399rdT+nc/d74/2+Xe+fv/not9/5lx/411X/m3fcqD++/bvv/2ipe/x64ap3e3/+s+n2duq//zVRfbrq37/Xbp/bZt7ofP5Ev5O/l/8d/3fPX9wN/ZrvO3799+d0I2Vvf46oft+zq+139Rs/r/vr3n//1nvcbYbt8+89bMZp34/+mf//9ss7+etuX+/78z99+rufTjzu7XR5tv/1/XjO3//MPuT3+69hxlXol9c/U8+3/m3Pv1L/fO9/e34//dDHm3x/neTn4+9Jzt2ed/+dQDvnc/2933nfe+Iet6sz/92fO0/fe//Yxbi/5ta/fuy/3ztX38/crkfzX/rrb3rd+H9r/X4/blNZPwpb0/Y/bv6jp3v3V89y7rurn9jL4veb91v/n/e2BfLp32mtiwuijb/OT7//f3jmz7/r9+1Hv7fd89pct0/+vT3Pu//+fzz7PH3fXnffPN+X5f9Xd/3vV4y72tb9one3elfa9/72fbP7671//Z673V3/VLR++/z/n/xP9x7D2dt8/fT+xkP387KP+Tcuobsb6/JWmv9dbnZPbbE98/Vbe//Y/j38t9z5/pe/lV3vX6NU735r/f/393ndb+T36Sl/W77YGv/zj/b3f95a77f91un3/NVH79/7889vt3qe6fWu+/u/+v7NTUPtzdr9n9vaU5/C/0/+ovz3v3f/Wef8+fB7D95uXv5O+fy9+fyJxG3ff9z+/88v4e/f+98Xp/+x/Xo/1J3637fjF/2//+l73zF3236/QEN10/cfrm2/23T83p+u28vtt7f3e36Pn+V3VczXKuV1Z3vc/8Xebrd/n7XsfB3yrf3at/39OXe/b+//8KO2/Uz5Hl/Z/+u/Um8Xt4140nBfHS7v/55hY/3Pf/6+/v1x/k70z3qn95WT3z3fZmf9+/qvfX/6uZvp/67p49LHP3+9bvf/4qD/vvXvZzb/zT7bv1r9e/3+X//3Rs/l57IV/7yMr+eP7ardjyab/gz7f93X+/v9//roP7/73v5t9P3497/4+N31L+8f+ju97cz/8ct43vXQ/9Ar/t6r1fT/n9d/U2/6703a/L/6WkNuPfWn+nn6e/PdX7UbfXMu6vJ76f+8KSnfb7D7tu9e7d/Rvf9jU+tZ/7XZfvv7d9/rtfdPr/f+tDbL6/9/UO2rv8Lrf37Cfr357T75x++b8/7eOz/P+2W3ezrf1vp9Pv3pN9ltmf0c8atvqO2nZbvqB//ay2759N3+d/51+X8385tXbn63947/t2Zf9uUf3zV9+17VjpX1vWPf3xIf55//vefZ8/Wb/J+9o3P6/3f373+7//zX5ZXVKzfsPxxf7//Ovct8P2+z9a6Xte816T3d5v7s26/mm8HDr9N97w39Oev4+/1Pyr7vxlfnp7O5X7zbd/zf7957/p5dfvP/Z07+vF7Lzb/O3tbtz/666/fj3d+fD+/dDv/nN6dvfm2eXune1/vspkfz0L/TL7PXbKvfx333774t17ud+XGd333b+e//18/5Vf5q+iz/j3PHu+0p18Vk+uqv218Ta5r83v+vmHrbk8/3fb3v5/zcre/7N86/fart3etjdPff/2/rP//p+v0TvduKPt9j5rv8p28+/Taf/8PfvXffnf+ztl7+b79y99797Pr3Z+d7f5fD+TtfqFnH407R/3wb+/93M+d9z9/pX/9vn9v/RpH+tY+1Wn/1Hju+5qPl/9Vn86bdebaX576fe/x8R/tP3q8rbxc0m99+3913+6+c3w7nddf759lynx//2Q83LPq+L3l+2Zv9c5+//t3Zz2v858yxLYvtX7rPf/vo/7z/5v75PXi/mP9drf/97uXWPv/37nzlVfveL691X+1xqr8rPv8d8q+3+/91///2v/7bLvy34t/d53Y3f36b/O//rOfbz3+Kw/ampleXxvdzP+X73O/+r759h+r937++n87/yYcrxxP3ff243v/kpq3Rv8P2v/9p7JT392+dTLdz5vfPlj/l7/bP1020+sK3bdV/5/sNV/r8/5/p7/u++/+fdfPXv5Vy+/nN8669c8/o98/fc3vf//feO3u3zn//dm+f+7DWk99jf7t/3vZ/R1rdkg/SUyj5zy6vPX+sxtb9TM59/0c9r6Ua47n//vv+vO/f/3xyzT+vs7tfpe/t7dusu/MnQ3u/JdVvjfuvkvrh+296/bif8c7dGf/Uftm6n4c9/xud1+Pr/9tj9/7ffeUp/unIo3tl3Xv/1//d//ao73uvu3f9s71M1Xl1vfvv+7XrX+qs+L19pd/Tj/dX7/0/dc82vb2xbu09tedm/s1/F/16yoT2VZvzd493/3//+SK/1++7/jNZ1v2m9//x8/T7ej/1Of3+rb//v/1p+/bw+f9/u///f/0eVlptz+rn/f7c9rOd5Wz1rP15d2ruz6/8N628Sm38/W6nn1qP/x0/YLcXXs7dQX5U19+b+Pvj19fqn/v/U9/v9j+i0u0Wfc6S//459Ozc43v/1+/b1a91Wv5frR//zs0u97238X7149xFN/f9OXeb77ivP13fo933Xba5pnO///vSer98/b4////7L1Nrd6+p9/vuTeLy/+c/Py2dz/3Z52el9+22952vPf167rOdG9f7oe5z9p/3+7Z8/2/B9477UifKfS+78J9vfW7L++74L2U2uXvO5//+b6fG8uf997V3t/YU9cVo//91+75RPvodhzZT+rvt///6/3//X/+u/+tzdd2L99/w6fUX1bONtbul8iOrX/aVLr/L+97d+1e7v/z99772nT8/u0v+VX+bz/9c0zvf/7PyXfmvx9uf/M53b/2rpjvOxO/4+6/E9zGcxx/36cpfcve8tw==","trainLoss":[0.9442,0.6715,0.6037,0.5762,0.5615,0.5537,0.5467,0.5437,0.541,0.5391,0.5374,0.5362,0.5359,0.5343,0.5336,0.5345,0.5322,0.5317,0.5333,0.5311],"loss":[0.746,0.6317,0.5908,0.5709,0.5595,0.5524,0.5475,0.5441,0.5415,0.5395,0.538,0.5367,0.5356,0.5347,0.534,0.5333,0.5327,0.5321,0.5316,0.5311],"accuracy":[0.794,0.793,0.796,0.7945,0.795,0.796,0.796,0.7955,0.795,0.7945,0.794,0.794,0.794,0.794,0.794,0.7925,0.7945,0.794,0.794,0.7935]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K1000-C0.8", {"clients":1000,"fraction":0.8,"perRound":800,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAErASYC9QHrAYkB4AHBADcCzgHwAE4CeQFHAWQA4AE3AcIBOwL9AE8CRwEyAtYAewHNAE8BaQFcAXsAEwIUAVQBNgHLAGoAKwL+AS0C9ADUAS8CqACyAfIBGwI4ArMBCwE3AfgBtADUALEBcgDzAMoBHAL1AccB3gGoAeUAZQDsAYQAuwB5AZcBPQHBAIcAfAGiAYcAGQHDAboBAwKsANQAZQAzAXcAAgEMAR0BHwGVAOkAKgIMAQcCUQIoAb0BZwASAcIBiQF8ACcB8QGqAcsBrQAOAiIBVwGPANAA8QA0AtcBTQH8ADYBIwJ1AbcAEAHgAN8B2gHjAXAB3wGZAboAegBBASgBAgKRAGQAJwKtAWoAVgFKARwC7wApAVIBxAHPAb4AMQLPAFoBqgEiAiQC4wCeAAsCAQLAABsBcAFWAcEBEAIoATUCxQAKAUsCKAGfAXYAmgD6AXoAcgAFAcUAOAEaAi0BWwEgAaYBOgE0AYYBPwGEAXEAcwBPAb4BeQBQAiMB9gESAQwCKQLrAL8A0gD7AJ0A8gA9AYgA8gArAncBAAETAegAlgGrARcBCgH1ATwBFgJcAQUBsgHWAb8AAgInAogAbAEoAtkA9AF7ATsBkwAMAkcBwQAXAsQAjgHJAKgBUgJ/ASUC/gEeAYsAbgAzAoMBswFhAVcCHAImAuYB0QE+AacBAgHeAW4BZgBeAS8BKgIWAnsBOQI6ArwBegHKAJ8BEAI8AZoBHQJjAWgAZgGMALMA8ACVAfoAjQDMASoB2wHAANoAogH/AJ8AgwDcAJUA+gBxAQQCRgFDAXQBtAG0AOsBywGAAcsBKAI0AS0C5wB/AHoASQI+AekBIgJpAfIAngChAO4AAgFCAo8AHwFUAsQALAESAuAA9QAfAaMAvQAuAkACMALcAXYBoQBfAZ8BpQGfAHcB9QCTARECIAHVAO0AsQGRAYUAYQGlAWsBlgH6AAoCNQGYAR4CfADeAcsBxQH9ADkBkgAyAYABIgIOAu0AgAFQArQByQGRAMoB9QGzAR4CTgHBAKUBfQB3AI0AtQDuALMBUQLtAXQB7wEWAc4AVAFtAHYAgAGjANwAfgFfARMCsQCwAVEBDAKFAYABpQBwATABngFrAQMCEAKHANQAVAGvARcCnQCgADMBmQDaABQBbwAKATsBagAUAiwBkQBeAQMBegEiAo8AfwBRAsMABQL/AWgB5gBlANkAkADpATQCdwAyAngATwH4AP8AHQF4ADoB0wBNATwCzQCNAbIANAFDAWwBhwAXAiQClQD4AYQArQFFAe0BHwKvAJoAqQHZAB8CmgDXAWUAEwIKAvMB2ACZAIAB9wDYACQBcQHiARYBzwEnAbIAGQH+Ab8AJwEbAWYAQgJ7AOgAmAGVAT0BMgLBANYA3wHgAQ4B9QFoAA4BPgKkAIUB8QFiAbcADgFFAiYCwQDfAa0AJwICAdYBAQHAAbcBVQLcAbIB8wGCAYwBYwGNAGgBRgFIAfIBaABxANsBxQAUAtoAxwDkAcIBMgEcAjABOQJBAasA3QFUAnABjwFDAucBSAGkACQC3QBTAX8BxgAkApkAfAEjAqUApQC9AAEBPAHDATIBhwD4APUARQFKAnYAbgFHAqYBGAGBABgBnAFPAREBjQGtAEECcQHOAaYBygAWARIBiQHDAMoATALhAUsBlQD7APkADQLoAawA7gFfAfsBgADwAHABtQBzADYCSALvAWkBwwH6ADEBegDVATYC0wEhAmgBPQHfAHwAPAH7ARoCKALgAKkB8wF8ANMB/gCjALEBugFxAG8BAQEzAiACmwBAAb4BmwGyAF4BuABRAZUAqAHBAaMB1wCjAFkBPwHzAe4BoQBLAvgBTgLbAA0B7ACdAVQClwBKAcsBpwFhAd8B/gF9ABkCtADnAL8AIgItAnAAZQGDAfIAqQBZAc4AGwGJAI0AfACwAcABfwHGAAABDgE0AqwA8gE2Ar8AuAC4AL4AQAL7AQ4BjgAZAZMAnQF6AVcCOQKvAcYBUgIOAqMBHAFFARMC0gGrAAICowBlAdAB9gG/AZkBcAFqAYEBSQKcAbsBHwHcAS0CwQEmAeEASALvADECZADHAJ4AFAKaAPkA+AASAe4BwABTAqgBkABzAaIAPQJGAmkAcQDkAXYBkAHFAc0AtADyAAkBEAK9AcQB3wAdAt0AjQCzAakAXQEFAawBdQGqAWQBZgC7AK4ACQHIAdwBzgHYANEAiwFCAmwAvgCNACsBlAG5AM4BjgExAVkBPgHUABMCKQGzAQgBYgEoAaoAIAJDAmcA7QEqARcBVQLGAT4C0gFrAJ8BXwEvAYsA1gELAY4B5ADwAMkBNQHxASsCmwEOAoMA9ACNAKIBtAHIAUgCoQDoAXcAwQAIARUCFgFDAbUAZQAFAu4AVAJOAVMBJwLSAZIB7gEAAXQALwGVAIgAHQLJABMBUgIeASgBagHJAdEB4QGjAFYCYQFtAWcBOALMAf0AdwGCAZ8B2wFxAcAAUwKHALMApQCzAeMAdgF/AG0AEQGZAFICrwDoAFYB4AAZAaABbwB9AL0BogCvAEsCagA5AkACAAFFAncBKQHdAA4BtAHoAXEARgIbAusAKgGEAK0AhQDaAK8BMQLQAaQBXgF1AGQAagErAhMBmQEIAckAJAE=","selected":"/90/f737vO//51z5//tfvb97/7/z/7/v7/u//as/9utf/7//u/X/ez/578X/e9/zfn+b/79u/v7v/l0u+42f37/8//b/+9/5/+//6q9d/7vP+O7P9/9vfv/o9b3f72f//f97z+33/o+7v//3XvfnPeu97e3taX8p863T/37/+clLd++v/U59//P/e//9+5/X/v//+/fz/979u3vz7/+f79N49f9/u/f/d/O/+25/7df37P/zVf///5f/rre977c//+X9r6n83/P/fntk/Tunv3+5+/2b3f/h2tz3fv77Xfv3/f/f33//r+f+/7+7/F/9zu/r/82feu9/3f7v3f+37X783//X/Z/b5/fW/5/3//63/bfj7//+////+z7N///rz375///+e9fzZ49///Q9v+v/v3+//cx/9f/117fN/99/v/136Vt7qa+v+h+3+v/63fveD+Lp37s6/va33fjP97fxXv//97X/f/////2y/uu//+577sX9+9///Vfv73vv7/fvoPd/v/1b8/7/9f8+79/v9tL///e+/f/9vu8v////+/6399v5/+r3s+f9e/5n1/9tybX7e6//v/y+6us3fO77z/73/ev/970q5/zj9N+vt/Wvb//j/7+H//9b///e/3v/29uP/ev/xv/bO/+K35ff7+P/+/9f/f9+X/m9379+//+/9/u2zte/Ffz/Q73/7f//T7/3//L1/3//u/v9/3//1xt1/5u7+/vQxv9H73+vb+/u/+rd//W5t/3dPy/7/rd/v/Z////o3+/zv/t9+//P7/t9+vf/w9rtOut/7b91z+//+6d/9sfl75u39f/yt8G//X3n//+r9//n/9fY9vrvv/e5v73d783c3/7/69//19/+vd/ben/ed998vn95vf//9vPXz19n/9b/M9Xu5d9/9/fA3fOffanz1X/fv/f7q+//8bzzd79u3t/705////nB/f9/7//7+3/d/fff+//bf3/5+d///v/96//1Nu9u9+fv+3/t3+/X/f/w/P3+vnvd//6+vd/v/r8t39d/+333z/v/6/v3uv//3fzf7T/f9f7//v5x+q3r/3r7//ff//2v7+L/X+7///Hf7ttN/35lxvvz9Pen9Lf//24r3e/X3//fv/3euHN+///7dY9+3972/z+9/td3/fx/n7f7/3Hf3/38vv/79eh9+/H5X8++/Ofa/+/+vv9u/s/v+4/X77u+95dfVv/f+/9/X/3589573//99qfmjV/+7+97/L1/38//vbX7d/ufP/5+Pr+//eue/+/YnP/v+97p/f/6v////8t/z/G919/e/+2/Xuq////4//c/f7/5/7f/97e79b1x/n3lp7/bu37t7fPe33dX1v/7///d89//2z/9u7/5197/9//f83+/+v/vfj/9l/9/eb5+bb1736//v2P/9vX/72Tv/Y//j/373frj+6v975/Xdx7+/7/3v/35/+3u+313//3/vXfNm7enr+vPvP337/33/35f/7fe//v57v77///v99/V/7+fl7/X97f9/d378rf/3/2d/vdfr/6P7+v/39P/Kfsvq77+7/h/f753fbJPzF97f73zd//7/d/9/7X3/tb9+43v//r+//3j9vXyv///3zf73/6/7/3n++/qHvv+X/9u39sn03/727L/bXPqz///ddv/v/876v/6/u4/++////tt3eS9f//b9v/f76/860ue///uN3//D//vsrv+e3++//7n//v/3//m717/uvP995Ob/7///a23/6n9/f+x1/f/v87+7b3ezXP/+/L3+//x/v3tt5Xv/89291/K73r/p/5/56/f9z36Hf7f/ZL//375ffL91ev+r/+N/X3/bfvT/3/zfff++e/Z5+e/3v3/f33mfns/9/fX/P153n7//X+7/d/f/03/9Hz+P/3//Pz7z63vE3u+99Pvd6399v+p/X/v//ff/36+v7+7+/+/933ff1/F37z/uv5/Vf/39fvcve/6/W/9+d/qt1n//O7v+///7t5/fjv+vz/zPzfl/+/7/o+37//e/j/nXu9+3/fe/r333//PPs7+/r/3n/Nl3///3evm3+P39e7//O/92d9e2vf/P9T//G/f67vvr/tay9eX/P+//7v/7+frv9+++X+79v/ev/d/n7vr/c//3u//DveP/3//rb7Z//9h/37f/9c/v/3+dvw3/vvf7x///zc3/8n7+r/3/3nq/P/9P3tL+/vrZ/+rx/a7v3fxv//7/3+nv76/37/+a/c77v/9/rX7/f//5//2/Pdzeu9/95vkv5r/fN2/3n3m+7/7r/9L83fb733//V//tz+3/P2+3/H/6//3976+v37+/u/3r3///7/+397f799//bddft7/ftlv/7+9//659+//vNT/+/P72eb79/f2f7/vf//l5773fP/9wNeS+19Jn//N9///31/Hf29f/frnX//d5c7P31y9/9+/3///37/9he7vzf9/xW+8/+dbp79/1tvb7fv903Xf/+19/6/+//6v9/PrcPvpdt5//8/72/Z+/vWwf3/+8h199/9L/7f//+77J3f5e9/2Ljv//3/35//f/9/v/+vvfXrv++r//f1/rx7m5/X23/U/n9vb2v978//fr/v372zuzX//u/3vv+dv+d/7/99+/2/f//zV9nv//9e/3/+vbv/1L+//79P/O/b9rr/f9//HnS/fb3+u3+3/tf/f1T7/f2/t/au17h+v/63v///5O+9f//79v/1vttm/f9/9/ruvvcpxv///+7Xtl3//+lsXz/N//99/++u/9e777ueP6u933q/7+/ft2v2//v/v/u/df1+a7dtf9/e0uz///6/z9u/vn/9/7u7uvfffP/77O/7/9yj73v/t6///K2x+7r3zf3+/X//3ft///bvfv3/6Xd/L7z/H7v/fdx/29//mp/z9/t//xf633n+/j/9y//XnXk773/v2vo99VV/Xff+791/3//9e9t6//d3n73/z3/////8v/2/593v7vr/nxn/P959f+j9/uvqP+3//buvb//nv/736c/+i/v//nNe+z3vev3d//7r38yN7/+78t/9d7e6//3/zzr2/fz359b/947/f///836H3u9/r7//3////naa2v//Pb39/r9n/9/5/T56/3fe1x/7/v//r79zP/rf+/u/5P7rvfP2////X/sF+69KZbvb6/d5fnv119X/6v//877P/z///e3d++/znevv++uv3/P/Hn//733937+/u///v+fv//fr+38/f//wrb/b7zu6+/3/3/7f/t1U9///73/l2/f//k9RXb3+7/779//zrtVb33//UXw==","trainLoss":[0.9407,0.6698,0.6038,0.5759,0.561,0.5533,0.5476,0.5439,0.5409,0.5387,0.5383,0.5365,0.5353,0.5345,0.5345,0.5335,0.5317,0.5325,0.5319,0.5323],"loss":[0.7426,0.6313,0.5908,0.5707,0.5593,0.5521,0.5474,0.5439,0.5414,0.5394,0.5379,0.5366,0.5356,0.5347,0.5339,0.5333,0.5327,0.5321,0.5317,0.5312],"accuracy":[0.792,0.794,0.7965,0.7945,0.795,0.7955,0.7955,0.7955,0.7945,0.794,0.794,0.7945,0.794,0.7935,0.7935,0.7935,0.7935,0.794,0.793,0.793]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K1000-C0.9", {"clients":1000,"fraction":0.9,"perRound":900,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"IAErASYC9QHrAYkB4AHBADcCzgHwAE4CeQFHAWQA4AE3AcIBOwL9AE8CRwEyAtYAewHNAE8BaQFcAXsAEwIUAVQBNgHLAGoAKwL+AS0C9ADUAS8CqACyAfIBGwI4ArMBCwE3AfgBtADUALEBcgDzAMoBHAL1AccB3gGoAeUAZQDsAYQAuwB5AZcBPQHBAIcAfAGiAYcAGQHDAboBAwKsANQAZQAzAXcAAgEMAR0BHwGVAOkAKgIMAQcCUQIoAb0BZwASAcIBiQF8ACcB8QGqAcsBrQAOAiIBVwGPANAA8QA0AtcBTQH8ADYBIwJ1AbcAEAHgAN8B2gHjAXAB3wGZAboAegBBASgBAgKRAGQAJwKtAWoAVgFKARwC7wApAVIBxAHPAb4AMQLPAFoBqgEiAiQC4wCeAAsCAQLAABsBcAFWAcEBEAIoATUCxQAKAUsCKAGfAXYAmgD6AXoAcgAFAcUAOAEaAi0BWwEgAaYBOgE0AYYBPwGEAXEAcwBPAb4BeQBQAiMB9gESAQwCKQLrAL8A0gD7AJ0A8gA9AYgA8gArAncBAAETAegAlgGrARcBCgH1ATwBFgJcAQUBsgHWAb8AAgInAogAbAEoAtkA9AF7ATsBkwAMAkcBwQAXAsQAjgHJAKgBUgJ/ASUC/gEeAYsAbgAzAoMBswFhAVcCHAImAuYB0QE+AacBAgHeAW4BZgBeAS8BKgIWAnsBOQI6ArwBegHKAJ8BEAI8AZoBHQJjAWgAZgGMALMA8ACVAfoAjQDMASoB2wHAANoAogH/AJ8AgwDcAJUA+gBxAQQCRgFDAXQBtAG0AOsBywGAAcsBKAI0AS0C5wB/AHoASQI+AekBIgJpAfIAngChAO4AAgFCAo8AHwFUAsQALAESAuAA9QAfAaMAvQAuAkACMALcAXYBoQBfAZ8BpQGfAHcB9QCTARECIAHVAO0AsQGRAYUAYQGlAWsBlgH6AAoCNQGYAR4CfADeAcsBxQH9ADkBkgAyAYABIgIOAu0AgAFQArQByQGRAMoB9QGzAR4CTgHBAKUBfQB3AI0AtQDuALMBUQLtAXQB7wEWAc4AVAFtAHYAgAGjANwAfgFfARMCsQCwAVEBDAKFAYABpQBwATABngFrAQMCEAKHANQAVAGvARcCnQCgADMBmQDaABQBbwAKATsBagAUAiwBkQBeAQMBegEiAo8AfwBRAsMABQL/AWgB5gBlANkAkADpATQCdwAyAngATwH4AP8AHQF4ADoB0wBNATwCzQCNAbIANAFDAWwBhwAXAiQClQD4AYQArQFFAe0BHwKvAJoAqQHZAB8CmgDXAWUAEwIKAvMB2ACZAIAB9wDYACQBcQHiARYBzwEnAbIAGQH+Ab8AJwEbAWYAQgJ7AOgAmAGVAT0BMgLBANYA3wHgAQ4B9QFoAA4BPgKkAIUB8QFiAbcADgFFAiYCwQDfAa0AJwICAdYBAQHAAbcBVQLcAbIB8wGCAYwBYwGNAGgBRgFIAfIBaABxANsBxQAUAtoAxwDkAcIBMgEcAjABOQJBAasA3QFUAnABjwFDAucBSAGkACQC3QBTAX8BxgAkApkAfAEjAqUApQC9AAEBPAHDATIBhwD4APUARQFKAnYAbgFHAqYBGAGBABgBnAFPAREBjQGtAEECcQHOAaYBygAWARIBiQHDAMoATALhAUsBlQD7APkADQLoAawA7gFfAfsBgADwAHABtQBzADYCSALvAWkBwwH6ADEBegDVATYC0wEhAmgBPQHfAHwAPAH7ARoCKALgAKkB8wF8ANMB/gCjALEBugFxAG8BAQEzAiACmwBAAb4BmwGyAF4BuABRAZUAqAHBAaMB1wCjAFkBPwHzAe4BoQBLAvgBTgLbAA0B7ACdAVQClwBKAcsBpwFhAd8B/gF9ABkCtADnAL8AIgItAnAAZQGDAfIAqQBZAc4AGwGJAI0AfACwAcABfwHGAAABDgE0AqwA8gE2Ar8AuAC4AL4AQAL7AQ4BjgAZAZMAnQF6AVcCOQKvAcYBUgIOAqMBHAFFARMC0gGrAAICowBlAdAB9gG/AZkBcAFqAYEBSQKcAbsBHwHcAS0CwQEmAeEASALvADECZADHAJ4AFAKaAPkA+AASAe4BwABTAqgBkABzAaIAPQJGAmkAcQDkAXYBkAHFAc0AtADyAAkBEAK9AcQB3wAdAt0AjQCzAakAXQEFAawBdQGqAWQBZgC7AK4ACQHIAdwBzgHYANEAiwFCAmwAvgCNACsBlAG5AM4BjgExAVkBPgHUABMCKQGzAQgBYgEoAaoAIAJDAmcA7QEqARcBVQLGAT4C0gFrAJ8BXwEvAYsA1gELAY4B5ADwAMkBNQHxASsCmwEOAoMA9ACNAKIBtAHIAUgCoQDoAXcAwQAIARUCFgFDAbUAZQAFAu4AVAJOAVMBJwLSAZIB7gEAAXQALwGVAIgAHQLJABMBUgIeASgBagHJAdEB4QGjAFYCYQFtAWcBOALMAf0AdwGCAZ8B2wFxAcAAUwKHALMApQCzAeMAdgF/AG0AEQGZAFICrwDoAFYB4AAZAaABbwB9AL0BogCvAEsCagA5AkACAAFFAncBKQHdAA4BtAHoAXEARgIbAusAKgGEAK0AhQDaAK8BMQLQAaQBXgF1AGQAagErAhMBmQEIAckAJAE=","selected":"v/vf3/9/f/33f3////+vvvn9+f/3v/z+/f////X///f/v+2////////+//d/9///7f93v/a//39/v//u7///+/f3v//9//8/bf//1f/nf/////V+6///////3vv/77ptv/+//vv//9/3///fv/e/+/3//v9//////f2/+///57nf////+3f9f9/97//+6///n//9fv/f/7/////v+++e//b++6fdv+8v/f7////f/////9/39+093f+9r///////fv//////7/97vPX5/////f6/+/+v////////tf////v7/3u///v9/9f997+////f+//v//////9f/9//v/f+//7P//////v2v6//z////7n79/n//vn/+vf//v/95///7//+u/+vff/f/////v/939/+6f/37//37/93/v//f/v////9/vv/+33f/v///9//fv/////3/72++///nr/7/39//v53/vV/t73/////+////93933/////P//33/f7///u///7//87vv//f+f/////97/////////3/fu1//b//v7+3+///7f87///3///7/z/x79++/3/v///9b79+//3/X+2/+//33//97//77//fn////f/9fv///f//f////9//ff//v3+/Xfvz//7vt/+vbv2//////P+v7/vt/+7/7/v////X+7/3f///////v3/f//+7/f/3//f9rv/////7/p////n/+//9//////3+z/3/r3v/8f/e//5/////9//7vb/1+/3///7//+7//z3f83779H+7/7//s//9////3/vv/393//3++/////f+1/+199v/7P/////3f7+5/u/////330//v3+///++/d///f/++////9/99//vf/7//f3//nf/F3j3///////7/////////53///3i//+39//37///v/+P/e/r//+v+////7+/2//9/+////91//9///vuf98f////v/7//fz/////e//9//f9P7/7/eP//////9fv7z7+7ev//3//9v///79/7/X///2///f//799r+d/9f/7/9/+v/+/3/////+3//+////7//3//ve/t/7+//9/3/b////+/9N///6//P1/U/n//5v/79////7/v//9/v9/v//37/3//7////+/3//37/H/v///5/v/t///+/X/9/u/2+q//1//////3f//3+799+b////3///7/6//+v//mfn33v19/3/+f2/9//v//+////v3v9/7e//95/+//9v///9/7//////9/+9//f/v/v9/3X+X//7+//+P//v//3/v/7////+v///+///9//7f3+///n///v7f3dv///X1v/3/9+3v//f/5/+v///31959//n///9/+//3//2f9f3/v/n7//z7//nf///t/////n//977/+f39//3+v//1//r//v33///+///X/3//3//3//87+v377///9////7/+/7/793c//+///3////////2//f//+/r///f373+v/2/3//1f//P9//u/5/////f//////37/7z7/+/n///7+3fX/v//u/r9//3/9f/////7//3////33/ofv//7/3/////7v/f///e72+/f2+f/77+v/x////3u/99///e8/9///3/+77////////97/3rtb7f973///7/vv//e///////////32/+7/+/3////3/f/v/6v////9ne/3f//77Pvvf/f////////V/a//d//u//////f3v//b/3n22n+2z/f33//f//3/v///9b//////899ft3///7///u///97/3/9/l+/r8v/////l+f/f/9//f7/f////Z7+3///3/m/P//f/v/fv99////977+/vv/v/8/9fe7///z/+/9f//3//+/r1//3/53////3/z9///+7/9/7//v/+/v6f///93/3/f+//////7//d99/////f////v/+/X//f3//////v+vd///3u///+7+6//ff/d+7/n/f79///f//v///u2/zv6/5/3//3/f////f9//u99+v///+/f///7/97d///z//z/9//v/+f//N//7vf/1///////+//7//v/9/9//2e9/e//f3///e/7z////vf3rf///89////zv37//+/7/v////v3/7///v/9/39///7f+f/7fv/////////v72//ff///+///f//5n/9/3///79/3t/3/tf7dv//33///3/9f+////XP+v//76////+//v1///3v9/v/7f3vf9/d/+//7L/73/r/2/v19//3397////3+/++/z///////+f//f+////////+/9///n/////vf/+/ff///3vvX3/9f3//v/6/v7+f/77f/jv1//fv/fu//f//z/3//7///3///5719/3Pv3757///ff/Pv+/X//v393t//2v/////n/Xf///+/7/d//79/vv//////v//////9/3d/////ff/+//r/7+//Xv//ub3+X/////9/////96z//v/7/93/7//+f/9/////6v7v+///7/+///fX1X/d/vm/////z+3/f/9/b/v//f/9/3/v+fv/d7/3f/9/v5////t/772/f7//71f////9///+++/f///3/////v79//////v/8//n7v+/b93//97/v/////f/9t/O9f/9//v//3//u+/9//9+/b////7///v7///9//Xfn//9/7f/b//f3/ffv2+339/7////3vf5+/9////R/f7//7///+/e3/e/8v/3//9///fvfv/P6//3//7//f/7///3///3/9/4+/7////3/9//fu/vff////3//X//v/93+/fn93///+3//78///973+6//f/f3+////93v/ef1//////37//++/7/v/17/v///v////+////v/f//77f/X//+/9///6v//X//sv/7du///7/r6+/883//++//r/s//nnf//r//9/9/35/m+1/3//v/3/+//t8/f///////f///VX/+//7/v6+v//////3///+////+////ff/33///b37+9/vv39f/f77///f/+/++//3/f3+98v///f/9/9vv7/9/7/////ff//3//7/bj/373/+/7//+7v///+9/f//e3393/////////Nv9///79/3////9/93//f5//u+/f/v763//v3d/+/r+//7fv9//X/7f+v//f3fv////++1vW3/3/3/727/b//c3//+/X/7//3/////97/r7//////3/////f3//f/////3//+v///Z7+/w==","trainLoss":[0.9416,0.6705,0.6034,0.5757,0.5611,0.5523,0.5474,0.5431,0.5409,0.5391,0.5372,0.5362,0.535,0.5332,0.5337,0.533,0.5326,0.5325,0.5318,0.5318],"loss":[0.7431,0.6315,0.5906,0.5705,0.5592,0.5521,0.5473,0.5439,0.5414,0.5395,0.5379,0.5367,0.5356,0.5348,0.534,0.5333,0.5326,0.5321,0.5316,0.5312],"accuracy":[0.7925,0.7945,0.7965,0.7955,0.795,0.796,0.796,0.7955,0.795,0.7945,0.794,0.7945,0.7945,0.794,0.794,0.7935,0.7935,0.794,0.794,0.7925]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K3-C0.5", {"clients":3,"fraction":0.5,"perRound":1,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"XwEjAkEC","selected":"BAICAQEBAQEBBAIEAgIEBAICAgQ=","trainLoss":[0.802,0.6261,0.5625,0.5232,0.4935,0.4775,0.4675,0.4607,0.4557,0.5031,0.5425,0.4731,0.5323,0.5182,0.4743,0.4546,0.5333,0.517,0.5097,0.4744],"loss":[0.6891,0.6124,0.5942,0.5868,0.5874,0.5899,0.5928,0.5954,0.5981,0.5768,0.5733,0.573,0.5725,0.5761,0.5729,0.5765,0.5731,0.5758,0.5793,0.5737],"accuracy":[0.7565,0.783,0.7815,0.7785,0.7765,0.7765,0.7735,0.7715,0.769,0.7815,0.781,0.779,0.7815,0.7775,0.781,0.7735,0.7815,0.7795,0.7775,0.779]});
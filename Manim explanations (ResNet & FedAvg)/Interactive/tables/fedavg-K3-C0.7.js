@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K3-C0.7", {"clients":3,"fraction":0.7,"perRound":2,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"XwEjAkEC","selected":"BgUFBgYGBgYFBQMDBQMFBgMDBgY=","trainLoss":[0.8345,0.5757,0.5229,0.5243,0.5105,0.5029,0.4982,0.495,0.476,0.469,0.5181,0.5075,0.4694,0.5065,0.4671,0.4899,0.5074,0.501,0.4899,0.4861],"loss":[0.6848,0.6164,0.5935,0.581,0.576,0.5738,0.5728,0.5724,0.5711,0.5719,0.5693,0.5706,0.5694,0.5704,0.5697,0.5701,0.5702,0.5722,0.5705,0.5708],"accuracy":[0.777,0.779,0.778,0.781,0.7825,0.7825,0.7825,0.781,0.778,0.7765,0.7795,0.781,0.7815,0.781,0.7795,0.781,0.781,0.7795,0.784,0.782]});
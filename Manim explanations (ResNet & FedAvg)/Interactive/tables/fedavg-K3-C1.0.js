@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K3-C1.0", {"clients":3,"fraction":1.0,"perRound":3,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"XwEjAkEC","selected":"BwcHBwcHBwcHBwcHBwcHBwcHBwc=","trainLoss":[0.8605,0.599,0.5443,0.5219,0.5103,0.5033,0.4988,0.4957,0.4934,0.4917,0.4903,0.4893,0.4883,0.4876,0.4869,0.4863,0.4858,0.4853,0.4849,0.4844],"loss":[0.6994,0.6178,0.5917,0.5806,0.5752,0.5724,0.5709,0.5701,0.5696,0.5694,0.5694,0.5694,0.5694,0.5694,0.5694,0.5694,0.5694,0.5694,0.5694,0.5694],"accuracy":[0.7775,0.7805,0.781,0.78,0.7825,0.7825,0.7825,0.7815,0.782,0.782,0.782,0.7805,0.781,0.7815,0.7815,0.781,0.7815,0.7815,0.7815,0.7815]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K4-C0.2", {"clients":4,"fraction":0.2,"perRound":1,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEdAksB1gA=","selected":"CAQEAgIBAQEBCAQIBAQIBAQEBAg=","trainLoss":[1.0683,0.7829,0.6515,0.6256,0.5812,0.5426,0.5043,0.4814,0.466,0.5655,0.5959,0.5398,0.5754,0.5538,0.5505,0.5539,0.5411,0.5334,0.5284,0.5874],"loss":[0.888,0.6929,0.6399,0.5924,0.5792,0.5716,0.5743,0.5798,0.5858,0.5786,0.5688,0.57,0.5689,0.5735,0.5707,0.5748,0.5807,0.5867,0.5924,0.5801],"accuracy":[0.75,0.774,0.775,0.7765,0.7735,0.772,0.767,0.7675,0.765,0.768,0.776,0.7765,0.781,0.7775,0.7765,0.776,0.77,0.767,0.765,0.773]});
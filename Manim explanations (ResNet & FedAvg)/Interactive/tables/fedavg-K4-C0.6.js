@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K4-C0.6", {"clients":4,"fraction":0.6,"perRound":2,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEdAksB1gA=","selected":"DAMJDAYMCgwKCQUFAwoJDAUKDAw=","trainLoss":[1.0156,0.7053,0.5994,0.6078,0.5934,0.5734,0.5678,0.5619,0.5541,0.5242,0.5398,0.5279,0.5325,0.549,0.5048,0.5544,0.5253,0.5493,0.548,0.5425],"loss":[0.8172,0.6466,0.6151,0.5955,0.5786,0.5752,0.5686,0.5677,0.5652,0.564,0.5625,0.5639,0.5608,0.5595,0.562,0.5603,0.5616,0.5586,0.5597,0.5622],"accuracy":[0.7725,0.7735,0.77,0.7755,0.776,0.7775,0.7805,0.781,0.7755,0.7775,0.7785,0.7755,0.7765,0.777,0.772,0.7795,0.78,0.781,0.781,0.782]});
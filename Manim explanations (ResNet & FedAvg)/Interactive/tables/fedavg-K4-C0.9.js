@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K4-C0.9", {"clients":4,"fraction":0.9,"perRound":3,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEdAksB1gA=","selected":"Dg0ODg0HCwsNDg4ODgcHCw4OBws=","trainLoss":[0.9594,0.685,0.6336,0.5982,0.5674,0.5615,0.5482,0.54,0.5403,0.5573,0.553,0.5504,0.5487,0.5414,0.5387,0.5283,0.5473,0.5455,0.5376,0.5251],"loss":[0.7485,0.6544,0.6077,0.5874,0.5779,0.5703,0.5663,0.5643,0.5625,0.5606,0.5602,0.5602,0.5604,0.5591,0.5585,0.5586,0.5587,0.5592,0.5582,0.5585],"accuracy":[0.777,0.7795,0.7805,0.7805,0.7755,0.7765,0.7735,0.774,0.7755,0.781,0.779,0.7785,0.777,0.775,0.7745,0.7755,0.777,0.7775,0.775,0.778]});
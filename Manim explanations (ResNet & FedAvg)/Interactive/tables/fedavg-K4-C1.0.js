@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K4-C1.0", {"clients":4,"fraction":1.0,"perRound":4,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEdAksB1gA=","selected":"Dw8PDw8PDw8PDw8PDw8PDw8PDw8=","trainLoss":[0.9556,0.6835,0.6142,0.5845,0.5685,0.5588,0.5525,0.548,0.5448,0.5424,0.5404,0.5389,0.5377,0.5366,0.5357,0.5349,0.5342,0.5336,0.533,0.5325],"loss":[0.7521,0.6425,0.6033,0.5847,0.5746,0.5687,0.5651,0.5627,0.5611,0.5601,0.5593,0.5588,0.5584,0.5581,0.5579,0.5577,0.5575,0.5574,0.5573,0.5572],"accuracy":[0.7715,0.775,0.7775,0.7785,0.7785,0.7775,0.7775,0.7785,0.778,0.777,0.778,0.7795,0.7795,0.7795,0.779,0.78,0.779,0.78,0.7785,0.7795]});
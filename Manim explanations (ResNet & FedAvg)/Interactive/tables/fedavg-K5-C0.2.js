@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K5-C0.2", {"clients":5,"fraction":0.2,"perRound":1,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"wAEjAQMCdQEnAQ==","selected":"EAgEAgIBAQEBEAgQBAgQCAgEBBA=","trainLoss":[0.9789,0.693,0.5289,0.5866,0.5408,0.5774,0.5498,0.5353,0.5265,0.5376,0.5449,0.5225,0.4316,0.5271,0.519,0.5189,0.5028,0.4243,0.4093,0.5233],"loss":[0.784,0.6429,0.5795,0.5715,0.5742,0.557,0.5524,0.5519,0.5528,0.5483,0.5402,0.5411,0.5384,0.5358,0.5379,0.5361,0.5383,0.5374,0.5412,0.5416],"accuracy":[0.7735,0.7885,0.782,0.7845,0.7775,0.788,0.782,0.781,0.7835,0.7795,0.785,0.782,0.7815,0.7835,0.7815,0.7825,0.784,0.7835,0.7795,0.7815]});
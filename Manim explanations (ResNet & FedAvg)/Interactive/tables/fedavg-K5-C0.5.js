@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K5-C0.5", {"clients":5,"fraction":0.5,"perRound":2,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"wAEjAQMCdQEnAQ==","selected":"GBIRGAwMFBgSCQkJAwYRFAoGGBQ=","trainLoss":[0.9592,0.6834,0.6241,0.5727,0.5094,0.4861,0.4732,0.5247,0.5421,0.5373,0.5289,0.524,0.5388,0.4696,0.5263,0.4553,0.5374,0.4595,0.5166,0.4495],"loss":[0.7592,0.653,0.5977,0.5749,0.556,0.5485,0.5457,0.5431,0.5419,0.5381,0.5371,0.5373,0.5379,0.5373,0.538,0.5388,0.5365,0.5383,0.5369,0.5387],"accuracy":[0.7865,0.778,0.7895,0.786,0.783,0.782,0.7805,0.776,0.78,0.7845,0.784,0.7855,0.787,0.785,0.785,0.7825,0.784,0.784,0.782,0.7825]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K5-C0.6", {"clients":5,"fraction":0.6,"perRound":3,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"wAEjAQMCdQEnAQ==","selected":"HBkOHBkNFRMTHBYOHA0OFQ4WCxM=","trainLoss":[0.8984,0.659,0.5571,0.522,0.5515,0.506,0.498,0.5425,0.5348,0.4835,0.4801,0.4841,0.4734,0.4837,0.4795,0.4799,0.4793,0.4746,0.5341,0.5298],"loss":[0.7155,0.62,0.5801,0.5619,0.5524,0.5461,0.5433,0.5415,0.5415,0.5392,0.5398,0.5389,0.539,0.5386,0.5386,0.5395,0.5393,0.5406,0.5384,0.5387],"accuracy":[0.782,0.7875,0.7845,0.783,0.784,0.785,0.784,0.784,0.783,0.783,0.784,0.784,0.7815,0.782,0.783,0.7835,0.784,0.7825,0.781,0.7825]});
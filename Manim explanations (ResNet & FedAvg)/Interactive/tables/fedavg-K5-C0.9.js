@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K5-C0.9", {"clients":5,"fraction":0.9,"perRound":4,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"wAEjAQMCdQEnAQ==","selected":"Hh0eFw8PHR4dHRceHhsPGx4bHh0=","trainLoss":[0.9122,0.6375,0.5605,0.54,0.5245,0.5143,0.5051,0.4978,0.4969,0.4937,0.497,0.4902,0.4878,0.5291,0.4936,0.5263,0.4852,0.5247,0.4838,0.4872],"loss":[0.7279,0.6159,0.5803,0.5624,0.5526,0.5471,0.5435,0.5416,0.5401,0.5394,0.5393,0.5387,0.5387,0.5375,0.5373,0.5369,0.537,0.5367,0.5368,0.5366],"accuracy":[0.784,0.787,0.786,0.7835,0.786,0.786,0.787,0.784,0.7855,0.7855,0.786,0.785,0.782,0.783,0.7825,0.7825,0.7845,0.7825,0.784,0.781]});
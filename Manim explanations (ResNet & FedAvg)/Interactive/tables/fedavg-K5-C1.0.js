@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K5-C1.0", {"clients":5,"fraction":1.0,"perRound":5,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"wAEjAQMCdQEnAQ==","selected":"Hx8fHx8fHx8fHx8fHx8fHx8fHx8=","trainLoss":[0.9172,0.6398,0.5724,0.5434,0.5278,0.5184,0.5122,0.508,0.5049,0.5026,0.5009,0.4995,0.4984,0.4975,0.4968,0.4962,0.4956,0.4951,0.4947,0.4943],"loss":[0.7244,0.6184,0.5805,0.5625,0.5528,0.5471,0.5437,0.5414,0.54,0.5391,0.5385,0.5381,0.5379,0.5377,0.5376,0.5375,0.5375,0.5375,0.5375,0.5375],"accuracy":[0.7915,0.7915,0.787,0.787,0.787,0.7855,0.786,0.786,0.786,0.7845,0.784,0.784,0.7835,0.784,0.7825,0.7825,0.782,0.782,0.782,0.782]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K6-C0.3", {"clients":6,"fraction":0.3,"perRound":1,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEyAWYBzgBJAtAB","selected":"IAgIAgIBAQECEAggCAggEAgICCA=","trainLoss":[0.9107,0.6535,0.5768,0.5998,0.5692,0.5496,0.5104,0.4884,0.5652,0.5455,0.5161,0.5491,0.4971,0.4707,0.5408,0.5302,0.4878,0.463,0.4467,0.552],"loss":[0.7162,0.6546,0.6271,0.6011,0.5903,0.5736,0.5708,0.5726,0.568,0.5493,0.5476,0.5442,0.5458,0.5509,0.5469,0.5405,0.5432,0.5488,0.5553,0.5453],"accuracy":[0.775,0.773,0.774,0.7815,0.7785,0.777,0.779,0.7775,0.78,0.7815,0.786,0.7835,0.784,0.7835,0.781,0.784,0.785,0.779,0.7795,0.784]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K6-C0.4", {"clients":6,"fraction":0.4,"perRound":2,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEyAWYBzgBJAtAB","selected":"GCIhGAwoJDAiERIRAyQhKAoGMCg=","trainLoss":[0.8862,0.6577,0.5825,0.5532,0.5642,0.5419,0.5482,0.5302,0.5405,0.517,0.5273,0.5042,0.5303,0.5498,0.5099,0.5186,0.5401,0.5543,0.5227,0.5136],"loss":[0.7072,0.6211,0.5886,0.5669,0.5541,0.5505,0.5471,0.5442,0.5465,0.5438,0.5432,0.5434,0.544,0.5374,0.542,0.5434,0.543,0.538,0.5363,0.5394],"accuracy":[0.7805,0.7755,0.778,0.783,0.786,0.783,0.7805,0.783,0.785,0.786,0.7865,0.784,0.784,0.7865,0.7835,0.7825,0.7835,0.789,0.7855,0.7835]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K6-C0.5", {"clients":6,"fraction":0.5,"perRound":3,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEyAWYBzgBJAtAB","selected":"ODEcLDINKQcjHA4aOBUWKRY0MiU=","trainLoss":[0.8953,0.6272,0.5777,0.5703,0.5492,0.5391,0.5247,0.5374,0.5274,0.5346,0.5422,0.5257,0.5191,0.5193,0.5308,0.5213,0.5317,0.5257,0.5255,0.5295],"loss":[0.7075,0.6114,0.5772,0.5614,0.5535,0.5476,0.5472,0.5454,0.5471,0.5395,0.5377,0.5371,0.5366,0.5352,0.5345,0.5349,0.5334,0.5327,0.5344,0.5336],"accuracy":[0.781,0.7785,0.785,0.785,0.7835,0.785,0.785,0.786,0.7855,0.7885,0.7875,0.7845,0.785,0.7855,0.787,0.7845,0.788,0.7875,0.7865,0.7875]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K6-C0.8", {"clients":6,"fraction":0.8,"perRound":4,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEyAWYBzgBJAtAB","selected":"Hjk8LR4XOR4eKy4ePDYeNTY1Njk=","trainLoss":[0.9234,0.6453,0.5881,0.5635,0.5527,0.5399,0.5264,0.536,0.5324,0.5331,0.5402,0.5298,0.5255,0.532,0.5275,0.5222,0.5308,0.5197,0.53,0.5107],"loss":[0.7318,0.6213,0.5814,0.5656,0.5546,0.5488,0.5456,0.5419,0.5396,0.5392,0.5374,0.5355,0.5343,0.534,0.5334,0.5332,0.533,0.5332,0.5329,0.5343],"accuracy":[0.7835,0.7795,0.782,0.7835,0.7855,0.7865,0.7835,0.7855,0.7865,0.785,0.7835,0.7855,0.7845,0.7835,0.784,0.787,0.7885,0.7875,0.7865,0.7865]});
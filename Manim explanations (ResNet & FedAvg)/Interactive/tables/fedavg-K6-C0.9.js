@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K6-C0.9", {"clients":6,"fraction":0.9,"perRound":5,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEyAWYBzgBJAtAB","selected":"Pj4+Hzc+Pj03Ozc+Lz0+Ozs+Lz4=","trainLoss":[0.9203,0.6531,0.5914,0.5598,0.5511,0.5456,0.5403,0.5289,0.5317,0.5234,0.5285,0.5312,0.531,0.5192,0.529,0.5178,0.5166,0.5279,0.5283,0.5267],"loss":[0.7259,0.6215,0.5835,0.566,0.5553,0.5486,0.5444,0.5416,0.54,0.5401,0.5388,0.5369,0.5366,0.5358,0.5347,0.536,0.5369,0.5349,0.5346,0.5335],"accuracy":[0.782,0.7825,0.783,0.7835,0.784,0.785,0.7835,0.785,0.785,0.786,0.785,0.7845,0.7845,0.7845,0.7865,0.7875,0.7875,0.786,0.786,0.7855]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K6-C1.0", {"clients":6,"fraction":1.0,"perRound":6,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"RQEyAWYBzgBJAtAB","selected":"Pz8/Pz8/Pz8/Pz8/Pz8/Pz8/Pz8=","trainLoss":[0.9222,0.6533,0.5899,0.5632,0.5493,0.5411,0.5359,0.5324,0.5299,0.528,0.5267,0.5256,0.5248,0.5241,0.5235,0.523,0.5226,0.5222,0.5219,0.5216],"loss":[0.7311,0.625,0.586,0.5671,0.5565,0.55,0.5458,0.5429,0.5408,0.5394,0.5382,0.5373,0.5366,0.536,0.5355,0.535,0.5346,0.5343,0.5339,0.5336],"accuracy":[0.7775,0.7815,0.781,0.782,0.783,0.7855,0.7855,0.7855,0.786,0.7865,0.7865,0.786,0.786,0.7855,0.785,0.7855,0.7855,0.785,0.787,0.7875]});
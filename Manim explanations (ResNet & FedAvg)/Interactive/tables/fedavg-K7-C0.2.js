@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K7-C0.2", {"clients":7,"fraction":0.2,"perRound":1,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"8gF3ANQA6AF+AfMBZQE=","selected":"IBAIAgQBAQECIBBACBBAIBAICEA=","trainLoss":[0.914,0.6226,0.597,0.4916,0.5891,0.5295,0.5002,0.4863,0.4556,0.5938,0.5186,0.506,0.5486,0.5,0.4908,0.585,0.4963,0.5458,0.5289,0.4944],"loss":[0.7323,0.6548,0.6174,0.6094,0.609,0.5881,0.5846,0.5849,0.5819,0.5814,0.5809,0.5786,0.579,0.5828,0.5826,0.5838,0.5868,0.5854,0.5892,0.5856],"accuracy":[0.768,0.767,0.7755,0.7835,0.775,0.782,0.78,0.778,0.7785,0.7745,0.778,0.7705,0.78,0.777,0.773,0.772,0.7715,0.776,0.778,0.773]});
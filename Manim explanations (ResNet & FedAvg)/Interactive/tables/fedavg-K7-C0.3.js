@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K7-C0.3", {"clients":7,"fraction":0.3,"perRound":2,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"8gF3ANQA6AF+AfMBZQE=","selected":"MAZBUBhQSFBEISIhBURBGBIMUFA=","trainLoss":[0.9169,0.6701,0.5992,0.5516,0.5491,0.5133,0.531,0.4978,0.523,0.5507,0.554,0.5326,0.5166,0.519,0.4817,0.533,0.4859,0.5494,0.4895,0.4802],"loss":[0.7438,0.6884,0.6227,0.6043,0.5949,0.5915,0.5874,0.5876,0.5863,0.5797,0.5823,0.5811,0.5786,0.5777,0.5768,0.5757,0.5777,0.5793,0.5793,0.582],"accuracy":[0.7705,0.767,0.7805,0.777,0.7835,0.78,0.78,0.78,0.7775,0.777,0.7725,0.7755,0.776,0.774,0.777,0.782,0.7795,0.782,0.781,0.7775]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K7-C0.5", {"clients":7,"fraction":0.5,"perRound":3,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"8gF3ANQA6AF+AfMBZQE=","selected":"WGFoaFIZE0VFOExUcCkmUSpMYkk=","trainLoss":[0.9142,0.651,0.5958,0.5692,0.5182,0.5268,0.4997,0.5141,0.5061,0.5497,0.5282,0.5098,0.526,0.5368,0.5532,0.4939,0.5427,0.5253,0.5213,0.504],"loss":[0.7451,0.6422,0.6117,0.5992,0.5917,0.5854,0.582,0.5788,0.5777,0.5775,0.5783,0.5784,0.5794,0.5781,0.58,0.577,0.579,0.5793,0.5802,0.5779],"accuracy":[0.7745,0.781,0.78,0.7785,0.776,0.7825,0.781,0.7815,0.7775,0.781,0.7815,0.7795,0.774,0.7765,0.7735,0.7745,0.7735,0.776,0.7735,0.779]});
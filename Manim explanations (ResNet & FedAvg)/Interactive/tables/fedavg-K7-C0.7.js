@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K7-C0.7", {"clients":7,"fraction":0.7,"perRound":4,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"8gF3ANQA6AF+AfMBZQE=","selected":"OnF4HToPcWw6Ux48XDo2OWxldGk=","trainLoss":[0.9224,0.647,0.5901,0.5536,0.5516,0.5322,0.5313,0.5495,0.5353,0.4965,0.5219,0.5423,0.5183,0.5291,0.5344,0.5253,0.5414,0.5277,0.5292,0.5221],"loss":[0.7467,0.6455,0.614,0.5981,0.593,0.5873,0.5828,0.5823,0.5833,0.5794,0.5806,0.5818,0.5818,0.5829,0.5833,0.5817,0.5816,0.5791,0.5795,0.5783],"accuracy":[0.7705,0.779,0.7785,0.784,0.7795,0.7825,0.778,0.7785,0.7755,0.776,0.7805,0.7785,0.779,0.7765,0.7725,0.7735,0.774,0.7735,0.772,0.7735]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K7-C0.8", {"clients":7,"fraction":0.8,"perRound":5,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"8gF3ANQA6AF+AfMBZQE=","selected":"Xnx6O2deXms7ejtuVz12T256bnw=","trainLoss":[0.9482,0.6744,0.595,0.5621,0.5508,0.5326,0.5247,0.53,0.5272,0.5269,0.5234,0.5359,0.5028,0.5302,0.5246,0.509,0.5314,0.5205,0.5298,0.5295],"loss":[0.7743,0.6587,0.6206,0.6018,0.5915,0.587,0.5849,0.5818,0.5807,0.5811,0.5805,0.5809,0.578,0.578,0.5784,0.5769,0.5779,0.5787,0.5796,0.58],"accuracy":[0.775,0.7785,0.778,0.78,0.78,0.7805,0.7815,0.7805,0.781,0.7785,0.7775,0.776,0.778,0.7785,0.7765,0.779,0.778,0.774,0.776,0.7745]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K7-C0.9", {"clients":7,"fraction":0.9,"perRound":6,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"8gF3ANQA6AF+AfMBZQE=","selected":"P357P19+fn5+fm99P359X30/X28=","trainLoss":[0.9216,0.6587,0.5861,0.5625,0.5354,0.5447,0.5389,0.5351,0.5325,0.5305,0.5283,0.5263,0.5263,0.5271,0.5238,0.5066,0.5223,0.5233,0.5044,0.521],"loss":[0.7482,0.6533,0.6154,0.6,0.5906,0.587,0.5851,0.5841,0.5835,0.5832,0.581,0.5798,0.5793,0.5797,0.5789,0.5777,0.5774,0.5774,0.5767,0.5763],"accuracy":[0.773,0.7815,0.7805,0.7825,0.7845,0.78,0.778,0.776,0.775,0.775,0.777,0.7785,0.7785,0.775,0.7765,0.779,0.7795,0.778,0.78,0.778]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K7-C1.0", {"clients":7,"fraction":1.0,"perRound":7,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"8gF3ANQA6AF+AfMBZQE=","selected":"f39/f39/f39/f39/f39/f39/f38=","trainLoss":[0.9249,0.6522,0.5875,0.5604,0.5462,0.5377,0.5323,0.5287,0.526,0.5241,0.5227,0.5215,0.5206,0.5199,0.5192,0.5187,0.5182,0.5178,0.5175,0.5171],"loss":[0.7503,0.6498,0.6149,0.599,0.5905,0.5857,0.5828,0.5809,0.5798,0.5789,0.5784,0.578,0.5777,0.5774,0.5772,0.577,0.5768,0.5766,0.5765,0.5763],"accuracy":[0.7755,0.7835,0.784,0.7835,0.783,0.7815,0.779,0.7785,0.779,0.778,0.778,0.7785,0.7785,0.7765,0.777,0.7765,0.7775,0.777,0.7765,0.7765]});
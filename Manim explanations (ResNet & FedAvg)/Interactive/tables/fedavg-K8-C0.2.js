@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K8-C0.2", {"clients":8,"fraction":0.2,"perRound":1,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"AgHfATsC5wGbAK8AKAKKAA==","selected":"QCAQBAQBAQECQCCAEBCAICAQEIA=","trainLoss":[0.9161,0.6296,0.6966,0.6101,0.5717,0.5255,0.4864,0.4635,0.5636,0.6014,0.4991,0.5597,0.6064,0.5753,0.5428,0.4721,0.453,0.576,0.5523,0.5322],"loss":[0.7045,0.6591,0.6346,0.5943,0.5828,0.5777,0.5829,0.5912,0.5736,0.5673,0.5673,0.5646,0.5644,0.568,0.567,0.57,0.5751,0.5773,0.5819,0.5801],"accuracy":[0.77,0.7735,0.7735,0.776,0.78,0.777,0.778,0.7745,0.7795,0.7755,0.775,0.771,0.777,0.7775,0.7765,0.7705,0.7715,0.77,0.77,0.7715]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K8-C0.3", {"clients":8,"fraction":0.3,"perRound":2,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"AgHfATsC5wGbAK8AKAKKAA==","selected":"oAaBoBigiKBEQSJBBQyBkBIMoJA=","trainLoss":[1.0936,0.7497,0.602,0.5835,0.6293,0.5441,0.5903,0.5238,0.5873,0.5577,0.5384,0.5488,0.5358,0.5662,0.5093,0.5763,0.5568,0.5666,0.5136,0.5642],"loss":[0.9332,0.6603,0.6296,0.6146,0.5917,0.5868,0.5784,0.5766,0.5678,0.5675,0.5624,0.5651,0.5623,0.5597,0.5601,0.5586,0.5566,0.555,0.555,0.5554],"accuracy":[0.762,0.778,0.776,0.774,0.7735,0.7735,0.774,0.7705,0.774,0.7765,0.7785,0.7775,0.7785,0.7795,0.775,0.7785,0.778,0.7785,0.778,0.7785]});
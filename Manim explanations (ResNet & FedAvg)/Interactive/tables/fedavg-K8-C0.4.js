@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K8-C0.4", {"clients":8,"fraction":0.4,"perRound":3,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"AgHfATsC5wGbAK8AKAKKAA==","selected":"sMFY0KIpIw2FOByksDFMoVRMRok=","trainLoss":[1.1126,0.784,0.6712,0.6258,0.5713,0.5618,0.5291,0.5606,0.5394,0.5703,0.5696,0.5395,0.5474,0.5158,0.5712,0.4974,0.5673,0.5642,0.5537,0.5516],"loss":[0.946,0.6901,0.6194,0.5972,0.5817,0.5742,0.5702,0.5649,0.563,0.561,0.5598,0.5597,0.5583,0.5598,0.5583,0.5597,0.5594,0.5596,0.559,0.5563],"accuracy":[0.768,0.778,0.779,0.78,0.777,0.776,0.775,0.777,0.777,0.78,0.7775,0.781,0.7785,0.778,0.7785,0.7755,0.7765,0.7785,0.7795,0.7815]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K8-C0.5", {"clients":8,"fraction":0.5,"perRound":4,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"AgHfATsC5wGbAK8AKAKKAA==","selected":"XKPwOTpN4ZxyMy48bHJWcdSNbNE=","trainLoss":[0.9266,0.6487,0.6373,0.5885,0.5827,0.5761,0.552,0.5763,0.5629,0.5336,0.5525,0.5615,0.5602,0.5561,0.5571,0.5451,0.5603,0.5516,0.5549,0.5509],"loss":[0.7171,0.6415,0.6068,0.5906,0.5777,0.5703,0.5687,0.5639,0.5619,0.5605,0.5584,0.557,0.5577,0.5576,0.5585,0.5602,0.5615,0.5581,0.5585,0.5601],"accuracy":[0.782,0.775,0.7735,0.7755,0.7765,0.7765,0.7795,0.778,0.7785,0.781,0.778,0.78,0.78,0.7815,0.7825,0.7825,0.781,0.781,0.78,0.78]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K8-C0.7", {"clients":8,"fraction":0.7,"perRound":5,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"AgHfATsC5wGbAK8AKAKKAA==","selected":"Pvi2O0+e3HNXdvJezun0nea2rtw=","trainLoss":[0.9374,0.6966,0.6146,0.5839,0.5789,0.5749,0.5808,0.5543,0.5543,0.5551,0.5552,0.5646,0.5595,0.552,0.5542,0.5558,0.5457,0.5433,0.5465,0.5659],"loss":[0.7358,0.6403,0.6022,0.5854,0.574,0.5676,0.5644,0.5623,0.5615,0.5612,0.5612,0.5598,0.559,0.5587,0.5597,0.5572,0.5574,0.5563,0.555,0.5553],"accuracy":[0.7775,0.779,0.7775,0.7785,0.778,0.7785,0.7785,0.7795,0.7805,0.782,0.781,0.7815,0.781,0.783,0.78,0.7805,0.782,0.782,0.782,0.783]});
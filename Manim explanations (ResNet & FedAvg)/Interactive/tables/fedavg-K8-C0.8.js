@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K8-C0.8", {"clients":8,"fraction":0.8,"perRound":6,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"AgHfATsC5wGbAK8AKAKKAA==","selected":"X/yvfZ9+3t727td77fa7r/n13s8=","trainLoss":[0.9255,0.6805,0.6019,0.5896,0.5726,0.574,0.5728,0.5692,0.5574,0.5575,0.5515,0.5546,0.5502,0.5513,0.5471,0.5394,0.5533,0.5432,0.5597,0.5485],"loss":[0.7255,0.6319,0.5982,0.5823,0.5728,0.5671,0.5637,0.5616,0.5608,0.5597,0.5593,0.5582,0.5581,0.5581,0.5556,0.5548,0.5553,0.5563,0.5556,0.5553],"accuracy":[0.7795,0.7795,0.78,0.779,0.7815,0.7785,0.781,0.781,0.781,0.782,0.7825,0.783,0.782,0.782,0.782,0.781,0.7805,0.781,0.7805,0.781]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K8-C0.9", {"clients":8,"fraction":0.9,"perRound":7,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"AgHfATsC5wGbAK8AKAKKAA==","selected":"v/77+/3f/vv3f9/+f/3v/u/3f/4=","trainLoss":[0.9511,0.6919,0.619,0.592,0.5799,0.5722,0.5694,0.5602,0.551,0.5548,0.5573,0.5587,0.5518,0.5533,0.547,0.556,0.5459,0.5428,0.549,0.5545],"loss":[0.7544,0.6385,0.6023,0.5849,0.5752,0.5687,0.5648,0.5624,0.5611,0.5599,0.5589,0.5581,0.5575,0.5575,0.5569,0.5564,0.5561,0.5562,0.5557,0.5554],"accuracy":[0.7775,0.7805,0.778,0.7755,0.7775,0.7765,0.7785,0.7795,0.781,0.7805,0.78,0.781,0.7815,0.7805,0.7805,0.7815,0.7815,0.782,0.7825,0.7815]});
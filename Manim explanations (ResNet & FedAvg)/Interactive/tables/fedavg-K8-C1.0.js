@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K8-C1.0", {"clients":8,"fraction":1.0,"perRound":8,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"AgHfATsC5wGbAK8AKAKKAA==","selected":"//////////////////////////8=","trainLoss":[0.9442,0.679,0.6156,0.5892,0.5754,0.5674,0.5623,0.5588,0.5563,0.5545,0.5532,0.5521,0.5512,0.5505,0.55,0.5494,0.549,0.5486,0.5483,0.548],"loss":[0.7418,0.6374,0.6003,0.5829,0.5735,0.568,0.5644,0.5621,0.5605,0.5593,0.5584,0.5577,0.5572,0.5567,0.5563,0.556,0.5556,0.5554,0.5551,0.5548],"accuracy":[0.78,0.778,0.7785,0.7785,0.778,0.7795,0.7785,0.779,0.7805,0.7805,0.7815,0.782,0.7815,0.7815,0.7815,0.7815,0.782,0.7815,0.7815,0.782]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C0.2", {"clients":9,"fraction":0.2,"perRound":1,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"gAAgABAABAAEAAEAAQABAAIAgAAgAAABEAAgAAABQAAgABAAIAAAAQ==","trainLoss":[0.8926,0.7105,0.5986,0.5954,0.5558,0.5062,0.46,0.435,0.573,0.5178,0.5572,0.5169,0.5076,0.5298,0.4984,0.5788,0.5269,0.4928,0.5122,0.4962],"loss":[0.7324,0.6585,0.6148,0.598,0.5923,0.5839,0.5847,0.5872,0.571,0.5649,0.5588,0.5561,0.5519,0.5517,0.5548,0.5533,0.5519,0.5509,0.5524,0.5543],"accuracy":[0.774,0.791,0.791,0.785,0.781,0.7835,0.779,0.7745,0.7845,0.7835,0.7865,0.7885,0.7865,0.787,0.789,0.786,0.7885,0.786,0.7845,0.7915]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C0.3", {"clients":9,"fraction":0.3,"perRound":2,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"YAAEAQEBYAAwACABEAFAAYgAQQBCAEEABQAIAQMAMAAkABgAQAEgAQ==","trainLoss":[1.0209,0.6972,0.5764,0.6114,0.5612,0.5342,0.5105,0.5316,0.5401,0.5246,0.5471,0.5057,0.4904,0.5261,0.4936,0.5172,0.5278,0.5197,0.5278,0.4964],"loss":[0.8232,0.667,0.6189,0.5953,0.5795,0.572,0.5674,0.5659,0.5581,0.5574,0.5578,0.5601,0.5585,0.5554,0.5553,0.5501,0.5494,0.5521,0.55,0.5512],"accuracy":[0.7745,0.781,0.782,0.7885,0.789,0.792,0.7915,0.788,0.785,0.7845,0.7865,0.786,0.7895,0.782,0.7845,0.7855,0.783,0.784,0.786,0.7905]});
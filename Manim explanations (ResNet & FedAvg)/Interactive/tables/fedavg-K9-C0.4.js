@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C0.4", {"clients":9,"fraction":0.4,"perRound":3,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"sACBAZABsABCAVEAIwANAAUBsAA4AEgB4ABRAIwAQQGUAJgAhAERAQ==","trainLoss":[0.9597,0.6535,0.5752,0.5542,0.5616,0.533,0.5278,0.5299,0.5018,0.5144,0.5259,0.5323,0.5307,0.5061,0.523,0.5081,0.5057,0.5087,0.5041,0.4789],"loss":[0.7759,0.6453,0.602,0.5834,0.5721,0.5662,0.5619,0.5595,0.5571,0.5529,0.5541,0.5545,0.5521,0.5514,0.5527,0.5512,0.5491,0.5509,0.5486,0.5478],"accuracy":[0.7845,0.785,0.785,0.7845,0.7865,0.7855,0.785,0.782,0.7855,0.7835,0.7845,0.7865,0.7835,0.7845,0.785,0.7835,0.7865,0.789,0.789,0.7905]});
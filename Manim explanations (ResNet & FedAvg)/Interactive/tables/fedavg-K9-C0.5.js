@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C0.5", {"clients":9,"fraction":0.5,"perRound":4,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"tABjAPAAWQByAB0AwQG4ALQAZgBcAGwA2ADiAKwA4QCoAYkBnACjAA==","trainLoss":[0.9749,0.708,0.6182,0.5768,0.5669,0.5373,0.5267,0.5284,0.5179,0.5486,0.5345,0.5404,0.5228,0.5301,0.5216,0.5117,0.5143,0.5005,0.5119,0.5021],"loss":[0.7914,0.6698,0.618,0.5907,0.5789,0.5703,0.5632,0.56,0.5565,0.555,0.5552,0.5564,0.5564,0.5546,0.5549,0.5527,0.5519,0.5521,0.5526,0.5505],"accuracy":[0.7815,0.7855,0.7815,0.785,0.7815,0.779,0.784,0.7845,0.7865,0.785,0.788,0.781,0.7835,0.7865,0.786,0.787,0.7875,0.7885,0.7865,0.786]});
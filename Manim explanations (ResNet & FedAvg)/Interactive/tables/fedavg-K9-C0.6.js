@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C0.6", {"clients":9,"fraction":0.6,"perRound":5,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"XAH4AGYBcwCLATwBtAFzAOUAZgHiAbQBngCbAGwBNQGuAFwBdAHYAQ==","trainLoss":[0.9229,0.6587,0.6026,0.5689,0.5413,0.5391,0.522,0.5301,0.5227,0.5321,0.5217,0.509,0.5206,0.5079,0.5299,0.497,0.5216,0.5208,0.5166,0.5136],"loss":[0.7414,0.6371,0.6023,0.5852,0.5725,0.5654,0.5597,0.5565,0.5546,0.5538,0.5533,0.5513,0.5509,0.5513,0.5508,0.5487,0.5497,0.5497,0.548,0.5484],"accuracy":[0.781,0.787,0.7865,0.786,0.786,0.7805,0.787,0.784,0.785,0.7825,0.7845,0.785,0.7835,0.783,0.7825,0.784,0.7835,0.7855,0.7865,0.786]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C0.7", {"clients":9,"fraction":0.7,"perRound":6,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"PwDsAXUBfQA9AfoA7AG8AW4B3gCtAXMB2QHuAFsBHwHxAekBPgGeAQ==","trainLoss":[0.9521,0.6696,0.5946,0.5712,0.5421,0.5486,0.5381,0.5235,0.5362,0.5308,0.512,0.5163,0.5111,0.5294,0.5143,0.508,0.504,0.5099,0.5151,0.5106],"loss":[0.7652,0.6421,0.6057,0.5863,0.5746,0.5669,0.5622,0.5588,0.5572,0.5559,0.5546,0.552,0.5517,0.5519,0.5516,0.5512,0.5492,0.5496,0.5493,0.5491],"accuracy":[0.784,0.7865,0.7895,0.786,0.7855,0.7835,0.783,0.7855,0.784,0.7825,0.786,0.7855,0.786,0.7825,0.7825,0.7835,0.786,0.7855,0.7855,0.7845]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C0.8", {"clients":9,"fraction":0.8,"perRound":7,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"XwH6AbsB6wG+Ae0BfgF3Ab0BvwC/APYBbwH6Ad0B9gHeAecBvQH6AQ==","trainLoss":[0.9331,0.6612,0.5836,0.5605,0.5439,0.5357,0.5381,0.5251,0.5143,0.517,0.5143,0.5206,0.5214,0.5192,0.5115,0.5161,0.5171,0.5099,0.5041,0.5156],"loss":[0.7516,0.6392,0.5991,0.5807,0.5703,0.5643,0.5605,0.5571,0.5551,0.554,0.5536,0.5514,0.5514,0.5511,0.5506,0.5491,0.5493,0.5487,0.5481,0.5481],"accuracy":[0.7765,0.785,0.784,0.783,0.7855,0.784,0.7835,0.786,0.783,0.7855,0.784,0.7845,0.7845,0.784,0.7845,0.7855,0.7835,0.7855,0.787,0.7835]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C0.9", {"clients":9,"fraction":0.9,"perRound":8,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"vwH+Af8A/gH/AL8B9wHfAX8B+wHfAX8BvwH+AfcB+wH3Ab8B+wH3AQ==","trainLoss":[0.9319,0.6628,0.5949,0.5669,0.5493,0.5321,0.5278,0.5248,0.5258,0.5192,0.5174,0.5196,0.5103,0.5204,0.5104,0.5118,0.5083,0.5066,0.5101,0.5067],"loss":[0.7501,0.6405,0.6022,0.5822,0.5721,0.5649,0.56,0.5575,0.5556,0.5543,0.5534,0.5526,0.5519,0.5513,0.5498,0.5497,0.5488,0.5486,0.5486,0.5477],"accuracy":[0.782,0.7865,0.782,0.784,0.7825,0.784,0.783,0.784,0.7845,0.7845,0.7845,0.783,0.784,0.7835,0.7855,0.784,0.786,0.786,0.785,0.786]});
@@ -0,0 +1 @@
+InteractiveTables.register("fedavg-K9-C1.0", {"clients":9,"fraction":1.0,"perRound":9,"rounds":20,"epochs":5,"learningRate":0.01,"sizes":"5QB/AdMAUAItAdkATQGyAcIB","selected":"/wH/Af8B/wH/Af8B/wH/Af8B/wH/Af8B/wH/Af8B/wH/Af8B/wH/AQ==","trainLoss":[0.9374,0.6633,0.5934,0.5631,0.5468,0.537,0.5305,0.526,0.5228,0.5203,0.5185,0.5169,0.5158,0.5147,0.5139,0.5132,0.5126,0.512,0.5115,0.5111],"loss":[0.7541,0.6432,0.6023,0.5826,0.5716,0.5649,0.5606,0.5577,0.5557,0.5542,0.5531,0.5522,0.5515,0.5509,0.5504,0.55,0.5496,0.5493,0.5489,0.5487],"accuracy":[0.78,0.7855,0.7835,0.786,0.784,0.7835,0.783,0.7835,0.784,0.7845,0.7855,0.7845,0.7845,0.784,0.784,0.7845,0.784,0.7835,0.784,0.7835]});
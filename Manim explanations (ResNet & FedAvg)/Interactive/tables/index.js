@@ -0,0 +1 @@
+InteractiveTables.register("index", {"fedavg":{"clients":[3,4,5,6,7,8,9,10,100,1000],"fractions":[0.2,0.3,0.4,0.5,0.6,0.7,0.8,0.9,1.0],"rounds":20,"epochs":5,"learningRate":0.01},"resnet":[{"name":"default","label":"Default 3×3","size":3},{"name":"negative","label":"Signed 3×3","size":3},{"name":"ramp","label":"Ramp 5×5","size":5},{"name":"edge","label":"Edge 8×8","size":8},{"name":"noise","label":"Noise 8×8","size":8}]});
@@ -0,0 +1 @@
+InteractiveTables.register("resnet", {"default":{"size":3,"layers":[[10.0,20.0,15.0,25.0,40.0,30.0,15.0,25.0,20.0],[13.0,21.0,17.0,25.0,37.0,29.0,17.0,25.0,21.0],[13.54,22.92,18.23,27.6,41.66,32.29,18.23,27.6,22.92],[13.54,22.92,18.23,27.6,41.66,32.29,18.23,27.6,22.92],[15.83,23.33,19.58,27.08,38.33,30.83,19.58,27.08,23.33],[13.54,22.92,18.23,27.6,41.66,32.29,18.23,27.6,22.92],[23.54,42.92,33.23,52.6,81.66,62.29,33.23,52.6,42.92],[23.54,42.92,33.23,52.6,81.66,62.29,33.23,52.6,42.92]]},"negative":{"size":3,"layers":[[-20.0,5.0,30.0,-10.0,0.0,10.0,-30.0,-5.0,20.0],[-11.0,9.0,29.0,-3.0,5.0,13.0,-19.0,1.0,21.0],[16.01,27.25,38.49,20.5,25.0,29.5,11.51,22.75,33.99],[16.01,27.25,38.49,20.5,25.0,29.5,11.51,22.75,33.99],[17.81,26.8,35.79,21.4,25.0,28.6,14.21,23.2,32.19],[16.01,27.25,38.49,20.5,25.0,29.5,11.51,22.75,33.99],[-3.99,32.25,68.49,10.5,25.0,39.5,-18.49,17.75,53.99],[-3.99,32.25,68.49,10.5,25.0,39.5,-18.49,17.75,53.99]]},"ramp":{"size":5,"layers":[[0.0,5.0,10.0,15.0,20.0,5.0,10.0,15.0,20.0,25.0,10.0,15.0,20.0,25.0,30.0,15.0,20.0,25.0,30.0,35.0,20.0,25.0,30.0,35.0,40.0],[5.0,9.0,13.0,17.0,21.0,9.0,13.0,17.0,21.0,25.0,13.0,17.0,21.0,25.0,29.0,17.0,21.0,25.0,29.0,33.0,21.0,25.0,29.0,33.0,37.0],[9.0,13.0,17.0,21.0,25.0,13.0,17.0,21.0,25.0,29.0,17.0,21.0,25.0,29.0,33.0,21.0,25.0,29.0,33.0,37.0,25.0,29.0,33.0,37.0,41.0],[9.0,13.0,17.0,21.0,25.0,13.0,17.0,21.0,25.0,29.0,17.0,21.0,25.0,29.0,33.0,21.0,25.0,29.0,33.0,37.0,25.0,29.0,33.0,37.0,41.0],[12.2,15.4,18.6,21.8,25.0,15.4,18.6,21.8,25.0,28.2,18.6,21.8,25.0,28.2,31.4,21.8,25.0,28.2,31.4,34.6,25.0,28.2,31.4,34.6,37.8],[9.0,13.0,17.0,21.0,25.0,13.0,17.0,21.0,25.0,29.0,17.0,21.0,25.0,29.0,33.0,21.0,25.0,29.0,33.0,37.0,25.0,29.0,33.0,37.0,41.0],[9.0,18.0,27.0,36.0,45.0,18.0,27.0,36.0,45.0,54.0,27.0,36.0,45.0,54.0,63.0,36.0,45.0,54.0,63.0,72.0,45.0,54.0,63.0,72.0,81.0],[9.0,18.0,27.0,36.0,45.0,18.0,27.0,36.0,45.0,54.0,27.0,36.0,45.0,54.0,63.0,36.0,45.0,54.0,63.0,72.0,45.0,54.0,63.0,72.0,81.0]]},"edge":{"size":8,"layers":[[0.0,0.0,0.0,0.0,40.0,40.0,40.0,40.0,0.0,0.0,0.0,0.0,40.0,40.0,40.0,40.0,0.0,0.0,0.0,0.0,40.0,40.0,40.0,40.0,0.0,0.0,0.0,0.0,40.0,40.0,40.0,40.0,0.0,0.0,0.0,0.0,40.0,40.0,40.0,40.0,0.0,0.0,0.0,0.0,40.0,40.0,40.0,40.0,0.0,0.0,0.0,0.0,40.0,40.0,40.0,40.0,0.0,0.0,0.0,0.0,40.0,40.0,40.0,40.0],[5.0,5.0,5.0,5.0,37.0,37.0,37.0,37.0,5.0,5.0,5.0,5.0,37.0,37.0,37.0,37.0,5.0,5.0,5.0,5.0,37.0,37.0,37.0,37.0,5.0,5.0,5.0,5.0,37.0,37.0,37.0,37.0,5.0,5.0,5.0,5.0,37.0,37.0,37.0,37.0,5.0,5.0,5.0,5.0,37.0,37.0,37.0,37.0,5.0,5.0,5.0,5.0,37.0,37.0,37.0,37.0,5.0,5.0,5.0,5.0,37.0,37.0,37.0,37.0],[17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0],[17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0],[18.6,18.6,18.6,18.6,31.4,31.4,31.4,31.4,18.6,18.6,18.6,18.6,31.4,31.4,31.4,31.4,18.6,18.6,18.6,18.6,31.4,31.4,31.4,31.4,18.6,18.6,18.6,18.6,31.4,31.4,31.4,31.4,18.6,18.6,18.6,18.6,31.4,31.4,31.4,31.4,18.6,18.6,18.6,18.6,31.4,31.4,31.4,31.4,18.6,18.6,18.6,18.6,31.4,31.4,31.4,31.4,18.6,18.6,18.6,18.6,31.4,31.4,31.4,31.4],[17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0,17.0,17.0,17.0,17.0,33.0,33.0,33.0,33.0],[17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0],[17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0,17.0,17.0,17.0,17.0,73.0,73.0,73.0,73.0]]},"noise":{"size":8,"layers":[[21.5,18.4,27.7,21.3,13.6,24.3,35.6,31.4,11.6,4.8,12.5,20.5,-7.9,17.4,5.0,11.2,13.5,16.2,24.9,32.5,18.5,36.4,12.0,24.2,30.8,21.1,11.1,8.9,14.5,22.6,7.9,17.5,18.1,26.5,22.6,24.3,12.2,18.4,29.4,37.9,4.9,38.2,36.2,29.4,23.2,16.2,37.5,43.5,41.6,35.8,24.3,5.5,19.9,27.9,4.5,24.7,25.2,28.4,5.8,12.1,14.8,6.0,40.9,14.0],[22.2,19.72,27.16,22.04,15.88,24.44,33.48,30.12,14.28,8.84,15.0,21.4,-1.32,18.92,9.0,13.96,15.8,17.96,24.92,31.0,19.8,34.12,14.6,24.36,29.64,21.88,13.88,12.12,16.6,23.08,11.32,19.0,19.48,26.2,23.08,24.44,14.76,19.72,28.52,35.32,8.92,35.56,33.96,28.52,23.56,17.96,35.0,39.8,38.28,33.64,24.44,9.4,20.92,27.32,8.6,24.76,25.16,27.72,9.64,14.68,16.84,9.8,37.72,16.2],[25.51,23.24,30.04,25.36,19.73,27.56,35.82,32.75,18.27,13.3,18.93,24.78,4.02,22.51,13.45,17.98,19.66,21.64,27.99,33.55,23.32,36.4,18.57,27.48,32.31,25.22,17.91,16.3,20.39,26.31,15.57,22.59,23.02,29.16,26.31,27.56,18.71,23.24,31.28,37.5,13.38,37.72,36.25,31.28,26.75,21.64,37.2,41.59,40.2,35.96,27.56,13.81,24.34,30.19,13.08,27.85,28.21,30.55,14.03,18.64,20.61,14.18,39.69,20.03],[25.51,23.24,30.04,25.36,19.73,27.56,35.82,32.75,18.27,13.3,18.93,24.78,4.02,22.51,13.45,17.98,19.66,21.64,27.99,33.55,23.32,36.4,18.57,27.48,32.31,25.22,17.91,16.3,20.39,26.31,15.57,22.59,23.02,29.16,26.31,27.56,18.71,23.24,31.28,37.5,13.38,37.72,36.25,31.28,26.75,21.64,37.2,41.59,40.2,35.96,27.56,13.81,24.34,30.19,13.08,27.85,28.21,30.55,14.03,18.64,20.61,14.18,39.69,20.03],[25.41,23.59,29.03,25.29,20.79,27.04,33.65,31.2,19.62,15.64,20.14,24.82,8.22,23.01,15.76,19.38,20.73,22.31,27.4,31.84,23.65,34.12,19.85,26.99,30.85,25.17,19.33,18.04,21.31,26.05,17.45,23.07,23.42,28.33,26.05,27.04,19.97,23.59,30.03,35.0,15.7,35.17,34.0,30.03,26.4,22.31,34.76,38.27,37.16,33.77,27.04,16.05,24.47,29.15,15.47,27.28,27.57,29.44,16.23,19.91,21.49,16.34,36.75,21.02],[25.51,23.24,30.04,25.36,19.73,27.56,35.82,32.75,18.27,13.3,18.93,24.78,4.02,22.51,13.45,17.98,19.66,21.64,27.99,33.55,23.32,36.4,18.57,27.48,32.31,25.22,17.91,16.3,20.39,26.31,15.57,22.59,23.02,29.16,26.31,27.56,18.71,23.24,31.28,37.5,13.38,37.72,36.25,31.28,26.75,21.64,37.2,41.59,40.2,35.96,27.56,13.81,24.34,30.19,13.08,27.85,28.21,30.55,14.03,18.64,20.61,14.18,39.69,20.03],[47.01,41.64,57.74,46.66,33.33,51.86,71.42,64.15,29.87,18.1,31.43,45.28,-3.88,39.91,18.45,29.18,33.16,37.84,52.89,66.05,41.82,72.8,30.57,51.68,63.11,46.32,29.01,25.2,34.89,48.91,23.47,40.09,41.12,55.66,48.91,51.86,30.91,41.64,60.68,75.4,18.28,75.92,72.45,60.68,49.95,37.84,74.7,85.09,81.8,71.76,51.86,19.31,44.24,58.09,17.58,52.55,53.41,58.95,19.83,30.74,35.41,20.18,80.59,34.03],[47.01,41.64,57.74,46.66,33.33,51.86,71.42,64.15,29.87,18.1,31.43,45.28,-3.88,39.91,18.45,29.18,33.16,37.84,52.89,66.05,41.82,72.8,30.57,51.68,63.11,46.32,29.01,25.2,34.89,48.91,23.47,40.09,41.12,55.66,48.91,51.86,30.91,41.64,60.68,75.4,18.28,75.92,72.45,60.68,49.95,37.84,74.7,85.09,81.8,71.76,51.86,19.31,44.24,58.09,17.58,52.55,53.41,58.95,19.83,30.74,35.41,20.18,80.59,34.03]]}});
@@ -0,0 +1 @@
+"""Benchmarks for the ResNet engine; run each with ``python -m benchmarks.<name>``."""
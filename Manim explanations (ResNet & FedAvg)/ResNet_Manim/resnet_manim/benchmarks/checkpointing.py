@@ -0,0 +1,78 @@
+# checkpointing.py
+"""Peak memory and step time of a training step with and without activation checkpointing.
+
+    python -m benchmarks.checkpointing --depths 16 64 256
+
+Peak memory is the tracemalloc high-water mark of one forward + backward
+pass, which NumPy array buffers report into. It covers everything the pass
+allocates beyond the model parameters. The step time is the median of
+``--repeats`` passes. The checkpointed gradients are checked to be
+bit-identical to the full-storage ones.
+"""
+
+import argparse
+import copy
+import time
+import tracemalloc
+
+import numpy as np
+
+from resnet_engine import CheckpointedResNet, ResNet, softmax_cross_entropy
+
+
+def train_step(forward, backward, x, labels):
+    _, dlogits = softmax_cross_entropy(forward(x), labels)
+    return backward(dlogits)
+
+
+def measure(forward, backward, x, labels, repeats):
+    tracemalloc.start()
+    train_step(forward, backward, x, labels)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        train_step(forward, backward, x, labels)
+        times.append(time.perf_counter() - start)
+    return peak, float(np.median(times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depths", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--width", type=int, default=16, help="channels per block")
+    parser.add_argument("--size", type=int, default=16, help="image height and width")
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((args.batch, args.size, args.size, 3)).astype(np.float32)
+    labels = rng.integers(10, size=args.batch)
+    activation = x[..., :1].size * args.width * 4 / 2**20
+
+    print(f"batch {args.batch}, {args.size}x{args.size}, width {args.width}, "
+          f"one activation = {activation:.2f} MiB")
+    print(f"{'depth':>5s} {'segment':>7s} {'full MiB':>9s} {'ckpt MiB':>9s} {'saving':>7s} "
+          f"{'full s':>7s} {'ckpt s':>7s} {'recompute':>9s}")
+    for depth in args.depths:
+        full = ResNet(width=args.width, num_blocks=depth)
+        checkpointed = CheckpointedResNet(copy.deepcopy(full))
+        full_peak, full_s = measure(
+            lambda v: full.forward(v, training=True), full.backward, x, labels, args.repeats
+        )
+        ckpt_peak, ckpt_s = measure(
+            checkpointed.forward, checkpointed.backward, x, labels, args.repeats
+        )
+        same = all(np.array_equal(a.grad_weight, b.grad_weight)
+                   for a, b in zip(full.convs(), checkpointed.model.convs()))
+        if not same:
+            raise AssertionError(f"checkpointed gradients differ at depth {depth}")
+        print(f"{depth:5d} {checkpointed.segment:7d} {full_peak / 2**20:9.1f} "
+              f"{ckpt_peak / 2**20:9.1f} {full_peak / ckpt_peak:6.1f}x "
+              f"{full_s:7.2f} {ckpt_s:7.2f} {ckpt_s / full_s - 1:+9.0%}")
+
+
+if __name__ == "__main__":
+    main()
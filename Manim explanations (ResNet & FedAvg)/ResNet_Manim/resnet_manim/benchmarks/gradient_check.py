@@ -0,0 +1,106 @@
+# gradient_check.py
+"""Finite-difference check of every backward pass used by the gradient-flow analyzer.
+
+    python -m benchmarks.gradient_check --blocks 3 --samples 5
+
+Builds a small float64 ``ResNet`` with and without skip connections and
+compares the analytic gradients of one training-mode pass with central
+differences (L(p + eps) - L(p - eps)) / (2 eps) of the loss. It samples
+``--samples`` entries of every parameter: the stem conv and BN, both convs
+and BNs of every block, and the head. It also samples entries of the input
+gradient dL/dx. It prints the worst relative error per layer and exits with
+status 1 if any error is above ``--tolerance``.
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from resnet_engine import ResNet, softmax_cross_entropy
+
+
+def parameters(model):
+    """(name, parameter, gradient) for every trainable array, input side first."""
+    layers = [("stem", model.stem), ("stem_bn", model.stem_bn)]
+    for i, block in enumerate(model.blocks):
+        layers += [(f"block{i}.conv1", block.conv1), (f"block{i}.bn1", block.bn1),
+                   (f"block{i}.conv2", block.conv2), (f"block{i}.bn2", block.bn2)]
+    layers.append(("head", model.head))
+    for name, layer in layers:
+        if hasattr(layer, "gamma"):
+            yield f"{name}.gamma", layer.gamma, layer.grad_gamma
+            yield f"{name}.beta", layer.beta, layer.grad_beta
+        else:
+            yield f"{name}.weight", layer.weight, layer.grad_weight
+            yield f"{name}.bias", layer.bias, layer.grad_bias
+
+
+def loss(model, x, labels):
+    return softmax_cross_entropy(model.forward(x, training=True), labels)[0]
+
+
+def relative_error(analytic, numeric, floor=1e-4):
+    """|a - n| / (|a| + |n|), compared absolutely for gradients below ``floor``.
+
+    A conv bias in front of batch norm has a true gradient of exactly zero,
+    so both sides are rounding noise and their ratio means nothing.
+    """
+    return abs(analytic - numeric) / max(abs(analytic) + abs(numeric), floor)
+
+
+def check(model, x, labels, samples, eps, rng):
+    """Worst relative error per parameter array and for dL/dx."""
+    _, dlogits = softmax_cross_entropy(model.forward(x, training=True), labels)
+    dx = model.backward(dlogits)
+    targets = [(name, p, g.copy()) for name, p, g in parameters(model)]
+    targets.append(("input", x, dx))
+
+    errors = {}
+    for name, array, grad in targets:
+        worst = 0.0
+        for flat in rng.choice(array.size, min(samples, array.size), replace=False):
+            index = np.unravel_index(flat, array.shape)
+            saved = array[index]
+            array[index] = saved + eps
+            up = loss(model, x, labels)
+            array[index] = saved - eps
+            down = loss(model, x, labels)
+            array[index] = saved
+            worst = max(worst, relative_error(grad[index], (up - down) / (2 * eps)))
+        errors[name] = worst
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=3)
+    parser.add_argument("--width", type=int, default=4, help="channels per block")
+    parser.add_argument("--size", type=int, default=6, help="image height and width")
+    parser.add_argument("--batch", type=int, default=4)
+    parser.add_argument("--samples", type=int, default=5, help="entries checked per array")
+    parser.add_argument("--eps", type=float, default=1e-6)
+    parser.add_argument("--tolerance", type=float, default=1e-5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    x = rng.standard_normal((args.batch, args.size, args.size, 3))
+    labels = rng.integers(10, size=args.batch)
+    failed = False
+    print(f"{'array':>20s} {'plain':>10s} {'residual':>10s}")
+    results = {}
+    for skip in (False, True):
+        model = ResNet(width=args.width, num_blocks=args.blocks, seed=args.seed,
+                       dtype=np.float64, skip=skip)
+        results[skip] = check(model, x.copy(), labels, args.samples, args.eps, rng)
+    for name in results[True]:
+        plain, residual = results[False][name], results[True][name]
+        failed |= max(plain, residual) > args.tolerance
+        print(f"{name:>20s} {plain:10.1e} {residual:10.1e}")
+    print("FAILED" if failed else f"all relative errors below {args.tolerance:g}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# inference.py
+"""Images/sec of the fused inference engine vs. the layer-by-layer forward.
+
+    python -m benchmarks.inference --batch 64 --width 16 --blocks 3
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from resnet_engine import InferenceEngine, ResNet
+
+
+def images_per_second(fn, x, repeats):
+    fn(x)  # warm up caches and BLAS threads
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn(x)
+    return repeats * x.shape[0] / (time.perf_counter() - start)
+
+
+def randomize_batchnorm(model, rng):
+    """Give BN non-trivial statistics so folding is actually exercised."""
+    layers = [model.stem_bn] + [bn for b in model.blocks for bn in (b.bn1, b.bn2)]
+    for bn in layers:
+        c = bn.gamma.size
+        bn.gamma[:] = rng.uniform(0.5, 1.5, c)
+        bn.beta[:] = rng.normal(0.0, 0.1, c)
+        bn.running_mean[:] = rng.normal(0.0, 0.1, c)
+        bn.running_var[:] = rng.uniform(0.5, 2.0, c)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--size", type=int, default=32, help="image height and width")
+    parser.add_argument("--width", type=int, default=16, help="channels per block")
+    parser.add_argument("--blocks", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    model = ResNet(width=args.width, num_blocks=args.blocks)
+    randomize_batchnorm(model, rng)
+    x = rng.standard_normal((args.batch, args.size, args.size, 3)).astype(np.float32)
+    engine = InferenceEngine(model, args.batch, x.shape[1:])
+
+    reference = model.forward(x)
+    error = np.abs(engine.forward(x) - reference).max() / np.abs(reference).max()
+    unfused = images_per_second(model.forward, x, args.repeats)
+    fused = images_per_second(engine.forward, x, args.repeats)
+
+    print(f"batch {args.batch}, {args.size}x{args.size}x3, width {args.width}, "
+          f"{args.blocks} blocks, buffers {engine.nbytes() / 2**20:.1f} MiB")
+    print(f"unfused: {unfused:10.1f} images/sec")
+    print(f"fused:   {fused:10.1f} images/sec  ({fused / unfused:.2f}x)")
+    print(f"max relative error vs unfused: {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# quantization.py
+"""float64 vs float32 vs int8 inference: accuracy, throughput and memory per block.
+
+    python -m benchmarks.quantization --batch 64 --width 16 --blocks 3
+
+The model is untrained, so the "labels" are the float32 engine's own top-1
+predictions on a held-out batch. The accuracy delta is therefore top-1
+disagreement with float32, which is the quantity PTQ has to keep small.
+The calibration batch is separate from the evaluation batch.
+"""
+
+import argparse
+
+import numpy as np
+
+from resnet_engine import InferenceEngine, QuantizedEngine, ResNet
+
+from .inference import randomize_batchnorm
+
+
+def block_seconds(engine, x, repeats):
+    """Median seconds of the stem and of each residual block."""
+    engine.forward(x)  # warm up
+    samples = []
+    for _ in range(repeats):
+        timings = []
+        engine.forward(x, timings)
+        samples.append(timings)
+    return np.median(np.array(samples), axis=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--calibration", type=int, default=64, help="calibration batch size")
+    parser.add_argument("--eval", type=int, default=1024, help="evaluation images")
+    parser.add_argument("--size", type=int, default=32, help="image height and width")
+    parser.add_argument("--width", type=int, default=16, help="channels per block")
+    parser.add_argument("--blocks", type=int, default=3)
+    parser.add_argument("--percentile", type=float, default=99.99,
+                        help="activation calibration percentile (100 = max)")
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    model = ResNet(width=args.width, num_blocks=args.blocks)
+    randomize_batchnorm(model, rng)
+    shape = (args.size, args.size, 3)
+    sample = rng.standard_normal((args.calibration,) + shape).astype(np.float32)
+    x_eval = rng.standard_normal((args.eval,) + shape).astype(np.float32)
+    x = x_eval[: args.batch]
+
+    engines = {
+        "float64": InferenceEngine(model, args.batch, shape, dtype=np.float64),
+        "float32": InferenceEngine(model, args.batch, shape),
+        "int8": QuantizedEngine(model, args.batch, shape, sample, percentile=args.percentile),
+    }
+    reference = engines["float32"].predict(x_eval)
+    labels = reference.argmax(axis=1)
+
+    print(f"batch {args.batch}, {args.size}x{args.size}x3, width {args.width}, "
+          f"{args.blocks} blocks, {args.eval} eval images")
+    print(f"{'':8s} {'top-1 delta':>12s} {'logit err':>10s} {'images/s':>10s} "
+          f"{'block ms':>9s} {'block MiB':>10s} {'total MiB':>10s}")
+    blocks = {}
+    for name, engine in engines.items():
+        logits = engine.predict(x_eval)
+        delta = np.mean(logits.argmax(axis=1) != labels)
+        error = np.abs(logits - reference).max() / np.abs(reference).max()
+        seconds = block_seconds(engine, x, args.repeats)
+        blocks[name] = (seconds[1:].mean(), engine.block_nbytes())
+        print(f"{name:8s} {delta:11.2%} {error:10.1e} {args.batch / seconds.sum():10.1f} "
+              f"{blocks[name][0] * 1e3:9.2f} {blocks[name][1] / 2**20:10.2f} "
+              f"{engine.nbytes() / 2**20:10.2f}")
+    (f32_s, f32_b), (i8_s, i8_b) = blocks["float32"], blocks["int8"]
+    print(f"int8 vs float32 per block: {f32_s / i8_s:.2f}x throughput, "
+          f"{f32_b / i8_b:.2f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
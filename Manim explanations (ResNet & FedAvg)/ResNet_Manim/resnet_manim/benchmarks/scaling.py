@@ -0,0 +1,70 @@
+# scaling.py
+"""Images/sec of the fused engine across thread counts and batch sizes.
+
+    OPENBLAS_NUM_THREADS=1 python -m benchmarks.scaling --threads 1 2 4 8
+
+Each cell runs ``InferenceEngine`` with a ``ParallelConv`` runner; thread
+count 1 is the plain single-threaded engine. Without threadpoolctl, pin
+BLAS to one thread through the environment for ``--mode tiles`` so the
+pool and BLAS do not oversubscribe the cores.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from resnet_engine import InferenceEngine, ParallelConv, ResNet
+
+
+def images_per_second(engine, x, min_seconds):
+    engine.forward(x)  # warm up caches and the pool
+    runs, start = 0, time.perf_counter()
+    while True:
+        engine.forward(x)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return runs * x.shape[0] / elapsed
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+",
+                        default=sorted({1, 2, 4, cores} - {0}))
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 8, 32, 128, 256])
+    parser.add_argument("--mode", choices=["tiles", "blas"], default="tiles")
+    parser.add_argument("--channel-tiles", type=int, default=1)
+    parser.add_argument("--size", type=int, default=32, help="image height and width")
+    parser.add_argument("--width", type=int, default=16, help="channels per block")
+    parser.add_argument("--blocks", type=int, default=3)
+    parser.add_argument("--seconds", type=float, default=1.0, help="minimum time per cell")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    model = ResNet(width=args.width, num_blocks=args.blocks)
+    print(f"{cores} cores, mode {args.mode}, {args.size}x{args.size}x3, "
+          f"width {args.width}, {args.blocks} blocks")
+    print("images/sec (speedup over 1 thread)")
+    print("batch " + " ".join(f"{f'{t} threads':>18s}" for t in args.threads))
+    for batch in args.batches:
+        x = rng.standard_normal((batch, args.size, args.size, 3)).astype(np.float32)
+        reference = InferenceEngine(model, batch, x.shape[1:]).forward(x).copy()
+        row, base = [], None
+        for threads in args.threads:
+            runner = ParallelConv(threads, channel_tiles=args.channel_tiles, mode=args.mode)
+            engine = InferenceEngine(model, batch, x.shape[1:], runner=runner)
+            error = np.abs(engine.forward(x) - reference).max()
+            if error > 1e-4 * np.abs(reference).max():
+                raise AssertionError(f"{threads} threads diverge from 1 thread by {error}")
+            rate = images_per_second(engine, x, args.seconds)
+            runner.close()
+            base = base or rate
+            row.append(f"{rate:10.1f} ({rate / base:4.2f}x)")
+        print(f"{batch:5d} " + " ".join(row))
+
+
+if __name__ == "__main__":
+    main()
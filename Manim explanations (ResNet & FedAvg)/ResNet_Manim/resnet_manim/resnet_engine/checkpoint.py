@@ -0,0 +1,95 @@
+# checkpoint.py
+"""Activation checkpointing for deep residual stacks.
+
+A training-mode forward pass through one block keeps about four
+activation-sized arrays for the backward pass: the conv inputs, the two BN
+normalised inputs and the hidden ReLU output. For L blocks that is O(L)
+memory. ``CheckpointedResNet`` splits the stack into segments of ``s``
+blocks. It keeps only the input of each segment, which is a block boundary
+where y = x + f(x) has just been computed, and drops every block's cache
+as soon as the next block has consumed its output. The backward pass then
+handles one segment at a time, last to first. It recomputes the segment's
+forward pass from the saved boundary, backpropagates through it, and frees
+it again. Peak memory is
+
+    L / s boundaries + s blocks of caches,
+
+which is minimised at s = sqrt(L), giving O(sqrt(L)). The price is a
+second forward pass through every block except the last segment. That is
+about one extra forward per training step, or roughly +1/3 of the step's
+compute when backward costs twice a forward.
+
+Recomputed BN layers use the same batch statistics as the first pass and
+do not update their running statistics a second time, so gradients are
+bit-identical to ``ResNet.backward``.
+"""
+
+import math
+
+import numpy as np
+
+from .layers import relu, relu_backward
+
+
+class CheckpointedResNet:
+    """Forward/backward for ``model`` that keeps one activation per segment."""
+
+    def __init__(self, model, segment=None):
+        self.model = model
+        depth = len(model.blocks)
+        self.segment = segment or max(1, math.ceil(math.sqrt(depth)))
+        self._boundaries = []
+
+    def segments(self):
+        depth = len(self.model.blocks)
+        return [(start, min(start + self.segment, depth))
+                for start in range(0, depth, self.segment)]
+
+    def forward(self, x):
+        """Training-mode logits; saves only the input of every segment."""
+        model = self.model
+        h = relu(model.stem_bn.forward(model.stem.forward(x, True), True))
+        model._stem_out = h
+        self._boundaries = []
+        segments = self.segments()
+        for start, stop in segments:
+            self._boundaries.append(h)
+            last = stop == segments[-1][1]
+            for block in model.blocks[start:stop]:
+                h = block.forward(h, training=True)
+                if not last:  # the last segment is backpropagated first, keep it
+                    block.clear_cache()
+        model._feature_shape = h.shape
+        return model.head.forward(h.mean(axis=(1, 2)), training=True)
+
+    def backward(self, dlogits, block_grads=None):
+        """Same result as ``ResNet.backward``, recomputing one segment at a time."""
+        model = self.model
+        n, h, w, c = model._feature_shape
+        dpooled = model.head.backward(dlogits)
+        dh = np.broadcast_to(dpooled[:, None, None, :] / (h * w), (n, h, w, c)).copy()
+        segments = list(zip(self.segments(), self._boundaries))
+        for j, ((start, stop), boundary) in reversed(list(enumerate(segments))):
+            if j < len(segments) - 1:
+                self._recompute(model.blocks[start:stop], boundary)
+            for i in reversed(range(start, stop)):
+                if block_grads is not None:
+                    block_grads[i] = dh
+                block = model.blocks[i]
+                dh = block.backward(dh)
+                block.clear_cache()
+        self._boundaries = []
+        dh = relu_backward(dh, model._stem_out)
+        return model.stem.backward(model.stem_bn.backward(dh))
+
+    @staticmethod
+    def _recompute(blocks, h):
+        bns = [bn for block in blocks for bn in (block.bn1, block.bn2)]
+        for bn in bns:
+            bn.track_running_stats = False
+        try:
+            for block in blocks:
+                h = block.forward(h, training=True)
+        finally:
+            for bn in bns:
+                bn.track_running_stats = True
@@ -0,0 +1,168 @@
+# inference.py
+"""Fused, allocation-free inference for a trained ``ResNet``.
+
+At inference time BN uses fixed running statistics, so
+
+    BN(conv(x)) = scale * (W x + b - mean) + beta,  scale = gamma / sqrt(var + eps)
+
+is just another convolution with weights ``W * scale`` and bias
+``(b - mean) * scale + beta``. ``InferenceEngine`` folds every BN into the
+conv before it, applies the ReLU in place on the GEMM output, adds the skip
+connection in place, and keeps the padded input, im2col and activation
+buffers between calls. A forward pass therefore allocates nothing per layer:
+each conv is one im2col copy into a reused buffer and one ``matmul`` with
+``out=``.
+
+Passing a ``ParallelConv`` as ``runner`` splits every conv into GEMM tiles
+that run on a thread pool (see ``parallel.py``).
+"""
+
+import time
+from contextlib import nullcontext
+
+import numpy as np
+
+from .layers import im2col
+
+
+def fold_batchnorm(conv, bn, dtype=None):
+    """GEMM weights ``(k*k*C_in, C_out)`` and bias of conv followed by BN."""
+    scale = bn.gamma / np.sqrt(bn.running_var + bn.eps)
+    weight = (conv.weight * scale).reshape(-1, conv.out_channels)
+    bias = (conv.bias - bn.running_mean) * scale + bn.beta
+    dtype = dtype or conv.weight.dtype
+    return np.ascontiguousarray(weight, dtype=dtype), bias.astype(dtype)
+
+
+class FusedConv:
+    """Conv + folded BN (+ ReLU) as one GEMM over a reused patch buffer."""
+
+    def __init__(self, conv, bn, relu, dtype=None):
+        self.k = conv.k
+        self.padding = conv.padding
+        self.in_channels = conv.in_channels
+        self.out_channels = conv.out_channels
+        self.weight, self.bias = fold_batchnorm(conv, bn, dtype)
+        self.relu = relu
+
+    def nbytes(self):
+        return self.weight.nbytes + self.bias.nbytes
+
+    def __call__(self, x, out, cols, padded):
+        patches = im2col(x, self.k, self.padding, out=cols, padded=padded)
+        np.matmul(patches, self.weight, out=out)
+        out += self.bias
+        if self.relu:
+            np.maximum(out, 0, out=out)
+        return out
+
+
+class InferenceEngine:
+    """Batched forward passes of ``model`` with all buffers preallocated.
+
+    Buffers are sized for ``batch_size`` images of ``input_shape`` (H, W, C);
+    smaller batches use leading slices of the same buffers. The logits
+    returned by ``forward`` live in an internal buffer that the next call
+    overwrites; ``predict`` copies them out for inputs of any size.
+    """
+
+    patch_dtype = None  # dtype of the padded and im2col buffers; None means ``dtype``
+
+    def __init__(self, model, batch_size, input_shape, dtype=None, runner=None):
+        self.dtype = np.dtype(dtype or model.dtype)
+        self.runner = runner
+        self.batch_size = batch_size
+        self.input_shape = tuple(input_shape)
+        self.stem = FusedConv(model.stem, model.stem_bn, relu=True, dtype=self.dtype)
+        self.blocks = [
+            (FusedConv(b.conv1, b.bn1, relu=True, dtype=self.dtype),
+             FusedConv(b.conv2, b.bn2, relu=False, dtype=self.dtype))
+            for b in model.blocks
+        ]
+        self.head_weight = model.head.weight.astype(self.dtype)
+        self.head_bias = model.head.bias.astype(self.dtype)
+
+        h, w, c = self.input_shape
+        width = self.stem.out_channels
+        rows = batch_size * h * w
+        patch_dtype = self.patch_dtype or self.dtype
+        self._padded = {}
+        self._cols = {}
+        for layer in self.layers():
+            cin, p = layer.in_channels, layer.padding
+            if cin not in self._padded:
+                self._padded[cin] = np.zeros(
+                    (batch_size, h + 2 * p, w + 2 * p, cin), dtype=patch_dtype
+                )
+                self._cols[cin] = np.empty((rows, layer.k * layer.k * cin), dtype=patch_dtype)
+        self._acts = [np.empty((rows, width), dtype=self.dtype) for _ in range(3)]
+        self._pooled = np.empty((batch_size, width), dtype=self.dtype)
+        self._logits = np.empty((batch_size, self.head_weight.shape[1]), dtype=self.dtype)
+
+    def layers(self):
+        return [self.stem] + [conv for pair in self.blocks for conv in pair]
+
+    def nbytes(self):
+        """Bytes held in reusable buffers."""
+        buffers = list(self._padded.values()) + list(self._cols.values()) + self._acts
+        return sum(b.nbytes for b in buffers) + self._pooled.nbytes + self._logits.nbytes
+
+    def block_nbytes(self):
+        """Bytes of weights and buffers one residual block works on at full batch."""
+        width = self.stem.out_channels
+        conv1, conv2 = self.blocks[0]
+        weights = sum(conv.nbytes() for conv in (conv1, conv2))
+        return (weights + self._padded[width].nbytes + self._cols[width].nbytes
+                + sum(a.nbytes for a in self._acts))
+
+    def _run(self, layer, x, out, n):
+        h, w, _ = self.input_shape
+        cin = layer.in_channels
+        cols, padded = self._cols[cin][: n * h * w], self._padded[cin][:n]
+        if self.runner is None:
+            layer(x, out, cols, padded)
+        else:
+            self.runner(layer, x, out, cols, padded)
+        return out.reshape(n, h, w, layer.out_channels)
+
+    def forward(self, x, timings=None):
+        """Logits for one batch; appends stem and per-block seconds to ``timings``."""
+        clock = time.perf_counter
+        n = x.shape[0]
+        if n > self.batch_size or x.shape[1:] != self.input_shape:
+            raise ValueError(
+                f"engine is sized for {self.batch_size} x {self.input_shape}, got {x.shape}"
+            )
+        h, w, _ = self.input_shape
+        rows = n * h * w
+        cur, tmp, nxt = (a[:rows] for a in self._acts)
+
+        x = x.astype(self.dtype, copy=False)
+        with self.runner.limits() if self.runner is not None else nullcontext():
+            start = clock()
+            act = self._run(self.stem, x, cur, n)
+            for conv1, conv2 in self.blocks:
+                if timings is not None:
+                    timings.append(clock() - start)
+                    start = clock()
+                hidden = self._run(conv1, act, tmp, n)
+                self._run(conv2, hidden, nxt, n)
+                nxt += cur  # y = x + f(x)
+                cur, nxt = nxt, cur
+                act = cur.reshape(n, h, w, -1)
+            if timings is not None:
+                timings.append(clock() - start)
+
+        pooled = self._pooled[:n]
+        np.mean(cur.reshape(n, h * w, -1), axis=1, out=pooled)
+        logits = self._logits[:n]
+        np.matmul(pooled, self.head_weight, out=logits)
+        logits += self.head_bias
+        return logits
+
+    def predict(self, x):
+        """Logits for any number of images, ``batch_size`` at a time."""
+        out = np.empty((x.shape[0], self.head_weight.shape[1]), dtype=self.dtype)
+        for start in range(0, x.shape[0], self.batch_size):
+            out[start:start + self.batch_size] = self.forward(x[start:start + self.batch_size])
+        return out
@@ -0,0 +1,166 @@
+# layers.py
+"""NumPy layers for the residual block shown in the scenes.
+
+Activations are channels-last (NHWC): a 3x3 convolution becomes one GEMM
+between the im2col patch matrix ``(N*H*W, 3*3*C_in)`` and the weights
+``(3*3*C_in, C_out)``, and the GEMM output is already NHWC again, so no
+transposes are needed between layers.
+
+Every layer also has a ``backward(dout)``: it writes the parameter gradients
+into ``grad_*`` arrays in place and returns the gradient of its input.
+Forward passes with ``training=True`` cache what ``backward`` needs. A
+conv caches its input, not the 9x larger patch matrix, and rebuilds the
+patches during the backward pass.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+
+def im2col(x, k, padding, out=None, padded=None):
+    """Patch matrix of an NHWC batch for a stride-1 ``k x k`` convolution.
+
+    ``padded`` (N, H + 2p, W + 2p, C) and ``out`` (N*H*W, k*k*C) may be
+    preallocated buffers; the padding border must already be zero.
+    """
+    n, h, w, c = x.shape
+    if padded is None:
+        padded = np.zeros((n, h + 2 * padding, w + 2 * padding, c), dtype=x.dtype)
+    padded[:, padding:padding + h, padding:padding + w, :] = x
+    ho = h + 2 * padding - k + 1
+    wo = w + 2 * padding - k + 1
+    sn, sh, sw, sc = padded.strides
+    windows = as_strided(
+        padded, shape=(n, ho, wo, k, k, c), strides=(sn, sh, sw, sh, sw, sc), writeable=False
+    )
+    if out is None:
+        out = np.empty((n * ho * wo, k * k * c), dtype=x.dtype)
+    np.copyto(out.reshape(n, ho, wo, k, k, c), windows)
+    return out
+
+
+def col2im(cols, shape, k, padding):
+    """Adjoint of ``im2col``: scatter-add ``(N*H*W, k*k*C)`` patches into an NHWC batch."""
+    n, h, w, c = shape
+    patches = cols.reshape(n, h, w, k, k, c)
+    padded = np.zeros((n, h + 2 * padding, w + 2 * padding, c), dtype=cols.dtype)
+    for i in range(k):
+        for j in range(k):
+            padded[:, i:i + h, j:j + w, :] += patches[:, :, :, i, j, :]
+    return padded[:, padding:padding + h, padding:padding + w, :]
+
+
+class Conv2d:
+    """``k x k`` stride-1 "same" convolution, weights stored as (k, k, C_in, C_out)."""
+
+    def __init__(self, in_channels, out_channels, k=3, rng=None, dtype=np.float32):
+        rng = rng or np.random.default_rng(0)
+        fan_in = k * k * in_channels
+        self.k = k
+        self.padding = k // 2
+        self.in_channels = in_channels
+        self.out_channels = out_channels
+        self.weight = (rng.standard_normal((k, k, in_channels, out_channels))
+                       * np.sqrt(2.0 / fan_in)).astype(dtype)
+        self.bias = np.zeros(out_channels, dtype=dtype)
+        self.grad_weight = np.zeros_like(self.weight)
+        self.grad_bias = np.zeros_like(self.bias)
+        self._x = None
+
+    def forward(self, x, training=False):
+        n, h, w, _ = x.shape
+        cols = im2col(x, self.k, self.padding)
+        out = cols @ self.weight.reshape(-1, self.out_channels)
+        out += self.bias
+        self._x = x if training else None
+        return out.reshape(n, h, w, self.out_channels)
+
+    def backward(self, dout):
+        x = self._x
+        cols = im2col(x, self.k, self.padding)
+        dout = dout.reshape(-1, self.out_channels)
+        np.matmul(cols.T, dout, out=self.grad_weight.reshape(-1, self.out_channels))
+        np.sum(dout, axis=0, out=self.grad_bias)
+        dcols = dout @ self.weight.reshape(-1, self.out_channels).T
+        return col2im(dcols, x.shape, self.k, self.padding)
+
+
+class BatchNorm2d:
+    """Batch normalisation over N, H, W for each channel.
+
+    Setting ``track_running_stats = False`` keeps a training-mode pass from
+    updating the running statistics, e.g. when it is a recomputation.
+    """
+
+    def __init__(self, channels, momentum=0.1, eps=1e-5, dtype=np.float32):
+        self.gamma = np.ones(channels, dtype=dtype)
+        self.beta = np.zeros(channels, dtype=dtype)
+        self.running_mean = np.zeros(channels, dtype=dtype)
+        self.running_var = np.ones(channels, dtype=dtype)
+        self.momentum = momentum
+        self.eps = eps
+        self.track_running_stats = True
+        self.grad_gamma = np.zeros_like(self.gamma)
+        self.grad_beta = np.zeros_like(self.beta)
+        self._cache = None
+
+    def forward(self, x, training=False):
+        if training:
+            mean = x.mean(axis=(0, 1, 2))
+            var = x.var(axis=(0, 1, 2))
+            if self.track_running_stats:
+                self.running_mean += self.momentum * (mean - self.running_mean)
+                self.running_var += self.momentum * (var - self.running_var)
+        else:
+            mean, var = self.running_mean, self.running_var
+        inv_std = 1 / np.sqrt(var + self.eps)
+        xhat = (x - mean) * inv_std
+        self._cache = (xhat, inv_std) if training else None
+        return xhat * self.gamma + self.beta
+
+    def backward(self, dout):
+        xhat, inv_std = self._cache
+        m = dout.size // dout.shape[-1]
+        np.sum(dout, axis=(0, 1, 2), out=self.grad_beta)
+        np.sum(dout * xhat, axis=(0, 1, 2), out=self.grad_gamma)
+        return (self.gamma * inv_std / m) * (m * dout - self.grad_beta - xhat * self.grad_gamma)
+
+
+def relu(x):
+    return np.maximum(x, 0)
+
+
+def relu_backward(dout, y):
+    """Gradient through a ReLU whose output was ``y``."""
+    return dout * (y > 0)
+
+
+def softmax_cross_entropy(logits, labels):
+    """Mean cross-entropy over the batch and its gradient w.r.t. ``logits``."""
+    shifted = logits - logits.max(axis=1, keepdims=True)
+    log_probs = shifted - np.log(np.exp(shifted).sum(axis=1, keepdims=True))
+    rows = np.arange(labels.size)
+    loss = -log_probs[rows, labels].mean()
+    grad = np.exp(log_probs)
+    grad[rows, labels] -= 1
+    return float(loss), grad / labels.size
+
+
+class Linear:
+    def __init__(self, in_features, out_features, rng=None, dtype=np.float32):
+        rng = rng or np.random.default_rng(0)
+        self.weight = (rng.standard_normal((in_features, out_features))
+                       * np.sqrt(1.0 / in_features)).astype(dtype)
+        self.bias = np.zeros(out_features, dtype=dtype)
+        self.grad_weight = np.zeros_like(self.weight)
+        self.grad_bias = np.zeros_like(self.bias)
+        self._x = None
+
+    def forward(self, x, training=False):
+        self._x = x if training else None
+        return x @ self.weight + self.bias
+
+    def backward(self, dout):
+        np.matmul(self._x.T, dout, out=self.grad_weight)
+        np.sum(dout, axis=0, out=self.grad_bias)
+        return dout @ self.weight.T
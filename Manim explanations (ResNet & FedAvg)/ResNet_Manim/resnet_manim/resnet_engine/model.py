@@ -0,0 +1,106 @@
+# model.py
+"""Residual blocks and a small ResNet built from them.
+
+``ResidualBlock`` is exactly the block drawn in ``WhatIsF`` and
+``ResidualConnection``:
+
+    x -> Conv -> BN -> ReLU -> Conv -> BN -> (+ x) -> y
+
+so y = x + f(x). ``ResNet`` puts a Conv-BN-ReLU stem in front of a stack of
+blocks and ends with global average pooling and a linear classifier.
+
+With ``skip=False`` the same layers form the plain network y = f(x), which
+is the "without skip connections" baseline in ``ResidualExplanation``.
+"""
+
+import numpy as np
+
+from .layers import BatchNorm2d, Conv2d, Linear, relu, relu_backward
+
+
+class ResidualBlock:
+    def __init__(self, channels, rng=None, dtype=np.float32, skip=True):
+        rng = rng or np.random.default_rng(0)
+        self.skip = skip
+        self.conv1 = Conv2d(channels, channels, rng=rng, dtype=dtype)
+        self.bn1 = BatchNorm2d(channels, dtype=dtype)
+        self.conv2 = Conv2d(channels, channels, rng=rng, dtype=dtype)
+        self.bn2 = BatchNorm2d(channels, dtype=dtype)
+        self._hidden = None
+
+    def convs(self):
+        return [self.conv1, self.conv2]
+
+    def clear_cache(self):
+        """Drop the activations saved by a training-mode forward pass."""
+        self.conv1._x = self.conv2._x = None
+        self.bn1._cache = self.bn2._cache = None
+        self._hidden = None
+
+    def residual(self, x, training=False):
+        """f(x): the five stacked layers."""
+        h = relu(self.bn1.forward(self.conv1.forward(x, training), training))
+        self._hidden = h if training else None
+        return self.bn2.forward(self.conv2.forward(h, training), training)
+
+    def forward(self, x, training=False):
+        fx = self.residual(x, training)
+        return x + fx if self.skip else fx
+
+    def backward(self, dy):
+        """dL/dx from dL/dy; the skip adds dy itself straight to dL/dx."""
+        dh = self.conv2.backward(self.bn2.backward(dy))
+        dx = self.conv1.backward(self.bn1.backward(relu_backward(dh, self._hidden)))
+        if self.skip:
+            dx += dy
+        return dx
+
+
+class ResNet:
+    """Stem, ``num_blocks`` residual blocks of ``width`` channels, and a head."""
+
+    def __init__(self, in_channels=3, width=16, num_blocks=3, num_classes=10, seed=0,
+                 dtype=np.float32, skip=True):
+        rng = np.random.default_rng(seed)
+        self.dtype = np.dtype(dtype)
+        self.stem = Conv2d(in_channels, width, rng=rng, dtype=dtype)
+        self.stem_bn = BatchNorm2d(width, dtype=dtype)
+        self.blocks = [
+            ResidualBlock(width, rng=rng, dtype=dtype, skip=skip) for _ in range(num_blocks)
+        ]
+        self.head = Linear(width, num_classes, rng=rng, dtype=dtype)
+        self._stem_out = None
+        self._feature_shape = None
+
+    def convs(self):
+        """Every conv from input to output: the stem, then conv1 and conv2 per block."""
+        return [self.stem] + [conv for block in self.blocks for conv in block.convs()]
+
+    def features(self, x, training=False):
+        h = relu(self.stem_bn.forward(self.stem.forward(x, training), training))
+        self._stem_out = h if training else None
+        for block in self.blocks:
+            h = block.forward(h, training)
+        return h
+
+    def forward(self, x, training=False):
+        """Class logits for an NHWC batch."""
+        h = self.features(x, training)
+        self._feature_shape = h.shape
+        return self.head.forward(h.mean(axis=(1, 2)), training)
+
+    def backward(self, dlogits, block_grads=None):
+        """Backpropagate ``dlogits`` through a ``training=True`` forward pass.
+
+        Parameter gradients land in each layer's ``grad_*`` arrays. If given,
+        ``block_grads[i]`` receives dL/d(output of block i).
+        """
+        n, h, w, c = self._feature_shape
+        dpooled = self.head.backward(dlogits)
+        dh = np.broadcast_to(dpooled[:, None, None, :] / (h * w), (n, h, w, c)).copy()
+        for i in reversed(range(len(self.blocks))):
+            if block_grads is not None:
+                block_grads[i] = dh
+            dh = self.blocks[i].backward(dh)
+        dh = relu_backward(dh, self._stem_out)
+        return self.stem.backward(self.stem_bn.backward(dh))
@@ -0,0 +1,147 @@
+# parallel.py
+"""Thread-parallel convolution as tiled GEMMs.
+
+A stride-1 conv over an NHWC batch is the GEMM
+
+    out (N*H*W, C_out) = patches (N*H*W, k*k*C_in) @ W (k*k*C_in, C_out)
+
+``ParallelConv`` cuts it into tiles: spatial tiles are bands of output rows
+(ranges of N*H), and channel tiles are column blocks of W. Each tile builds
+its own slice of the im2col matrix and runs its own ``matmul``; NumPy
+releases the GIL for both, so the tiles run truly in parallel on a thread
+pool.
+
+There are two ways to use the cores:
+
+* ``mode="tiles"`` - our thread pool runs the tiles and BLAS should run
+  single-threaded (set ``OPENBLAS_NUM_THREADS=1`` / ``OMP_NUM_THREADS=1``, or
+  install ``threadpoolctl`` and the limit is applied automatically)
+* ``mode="blas"`` - one GEMM per layer, left to a multithreaded BLAS with
+  ``threads`` threads (again applied through ``threadpoolctl`` if present)
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # optional: without it BLAS threads come from the environment
+    threadpool_limits = None
+
+
+def blas_threads(count):
+    """Context manager limiting BLAS to ``count`` threads, if threadpoolctl is installed."""
+    if threadpool_limits is None:
+        return nullcontext()
+    return threadpool_limits(limits=count, user_api="blas")
+
+
+def _windows(padded, k, h, w):
+    sn, sh, sw, sc = padded.strides
+    n, c = padded.shape[0], padded.shape[3]
+    return as_strided(
+        padded, shape=(n, h, w, k, k, c), strides=(sn, sh, sw, sh, sw, sc), writeable=False
+    )
+
+
+def im2col_rows(windows, start, stop, out):
+    """im2col for output rows ``start:stop`` of the flattened N*H index.
+
+    ``out`` holds ((stop - start) * W, k*k*C) patches; bands may straddle
+    image boundaries.
+    """
+    _, h, w, k, _, c = windows.shape
+    view = out.reshape(stop - start, w, k, k, c)
+    row = start
+    while row < stop:
+        image, y = divmod(row, h)
+        span = min(h - y, stop - row)
+        np.copyto(view[row - start:row - start + span], windows[image, y:y + span])
+        row += span
+
+
+class ParallelConv:
+    """Runs ``FusedConv`` layers as spatial x channel GEMM tiles on a thread pool."""
+
+    def __init__(self, threads=None, spatial_tiles=None, channel_tiles=1, mode="tiles"):
+        if mode not in ("tiles", "blas"):
+            raise ValueError(f"mode must be 'tiles' or 'blas', got {mode!r}")
+        self.threads = threads or os.cpu_count() or 1
+        self.spatial_tiles = spatial_tiles or self.threads
+        self.channel_tiles = channel_tiles
+        self.mode = mode
+        self.pool = ThreadPoolExecutor(self.threads) if mode == "tiles" and self.threads > 1 else None
+        self._scratch = {}
+        self._weights = {}
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+    def limits(self):
+        """BLAS thread limit to hold while this runner is in use."""
+        return blas_threads(1 if self.mode == "tiles" else self.threads)
+
+    def _channel_blocks(self, cout):
+        tiles = max(1, min(self.channel_tiles, cout))
+        bounds = np.linspace(0, cout, tiles + 1).astype(int)
+        return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+    def _weight_blocks(self, layer, blocks):
+        # Contiguous copies of W's column blocks, made once per layer.
+        cached = self._weights.get(id(layer))
+        if cached is None or cached[0] is not layer:
+            parts = [np.ascontiguousarray(layer.weight[:, c0:c1]) for c0, c1 in blocks]
+            cached = self._weights[id(layer)] = (layer, parts)
+        return cached[1]
+
+    def _scratch_for(self, key, shape, dtype):
+        buf = self._scratch.get(key)
+        if buf is None or buf.shape[0] < shape[0] or buf.shape[1:] != shape[1:] or buf.dtype != dtype:
+            buf = self._scratch[key] = np.empty(shape, dtype=dtype)
+        return buf[: shape[0]]
+
+    def __call__(self, layer, x, out, cols, padded):
+        if self.mode == "blas" or self.pool is None:
+            return layer(x, out, cols, padded)
+
+        # Padding is one vectorised copy up front: bands read halo rows that
+        # belong to their neighbours.
+        n, h, w, _ = x.shape
+        p = layer.padding
+        padded[:, p:p + h, p:p + w, :] = x
+        windows = _windows(padded, layer.k, h, w)
+        bands = np.linspace(0, n * h, min(self.spatial_tiles, n * h) + 1).astype(int).tolist()
+        blocks = self._channel_blocks(layer.out_channels)
+        weights = [layer.weight] if len(blocks) == 1 else self._weight_blocks(layer, blocks)
+        tasks = []
+        for t, (start, stop) in enumerate(zip(bands[:-1], bands[1:])):
+            if stop > start:
+                tasks.append(self.pool.submit(
+                    self._tile, layer, weights, windows, start, stop, w, out, cols, blocks, t
+                ))
+        for task in tasks:
+            task.result()
+        return out
+
+    def _tile(self, layer, weights, windows, start, stop, w, out, cols, blocks, t):
+        rows = slice(start * w, stop * w)
+        patches = cols[rows]
+        im2col_rows(windows, start, stop, patches)
+        result = out[rows]
+        if len(blocks) == 1:
+            np.matmul(patches, weights[0], out=result)
+        else:
+            for b, (c0, c1) in enumerate(blocks):
+                # Column slices of ``out`` are strided; each block writes into
+                # its own contiguous scratch tile, reused across calls.
+                scratch = self._scratch_for((t, b), (patches.shape[0], c1 - c0), out.dtype)
+                np.matmul(patches, weights[b], out=scratch)
+                result[:, c0:c1] = scratch
+        result += layer.bias
+        if layer.relu:
+            np.maximum(result, 0, out=result)
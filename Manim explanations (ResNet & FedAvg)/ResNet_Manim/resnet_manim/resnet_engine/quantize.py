@@ -0,0 +1,156 @@
+# quantize.py
+"""Int8 post-training quantization of the fused inference engine.
+
+Every conv input is quantized per tensor, ``q_x = round(x / s_x)``. Every
+conv weight is quantized per output channel, ``q_w[:, c] = round(W[:, c] / s_w[c])``.
+Both use the symmetric range [-127, 127], so
+
+    conv(x)[:, c] ~= s_x * s_w[c] * (q_x @ q_w)[:, c] + b[c]
+
+The scales ``s_x`` come from a calibration batch. The padded input and the
+im2col patch matrix are the buffers that dominate memory traffic, and both
+are stored as int8, a quarter of their float32 size. The integer GEMM runs
+in tiles of ``tile_rows`` patch rows. Each tile is widened into a small
+float32 scratch buffer that stays in cache, and BLAS multiplies it by the
+int-valued float32 weights. The products are exact integers while
+``k*k*C_in * 127**2 < 2**24`` (C_in <= 115 for 3x3 convs), so the result is
+the int32 GEMM without NumPy's slow integer matmul. Wider convs widen their
+tiles to float64 instead, which is exact up to 2**53.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from .inference import InferenceEngine
+from .layers import relu
+
+QMAX = 127
+EXACT_FLOAT32 = 2 ** 24  # integers up to here are exact in float32
+
+
+def quantize_per_channel(weight):
+    """int8 weights and per-output-channel scales for a ``(K, C_out)`` matrix."""
+    amax = np.abs(weight).max(axis=0)
+    scale = np.where(amax > 0, amax / QMAX, 1.0).astype(np.float32)
+    q = np.clip(np.rint(weight / scale), -QMAX, QMAX).astype(np.int8)
+    return q, scale
+
+
+def calibrate(model, sample, percentile=100.0):
+    """Input scale of every conv in ``model`` on the float ``sample`` batch.
+
+    Returns the scales in engine order: stem, then conv1 and conv2 of each
+    block. ``percentile`` below 100 clips outliers instead of using the max.
+    """
+    def scale(x):
+        a = np.abs(x)
+        amax = a.max() if percentile >= 100 else np.percentile(a, percentile)
+        return float(amax) / QMAX if amax > 0 else 1.0
+
+    x = sample.astype(model.dtype, copy=False)
+    scales = [scale(x)]
+    h = relu(model.stem_bn.forward(model.stem.forward(x)))
+    for block in model.blocks:
+        scales.append(scale(h))
+        hidden = relu(block.bn1.forward(block.conv1.forward(h)))
+        scales.append(scale(hidden))
+        h = h + block.bn2.forward(block.conv2.forward(hidden))
+    return scales
+
+
+class QuantizedConv:
+    """A ``FusedConv`` with int8 weights and an int8 input of fixed scale."""
+
+    def __init__(self, fused, input_scale, tile_rows=4096):
+        self.k = fused.k
+        self.padding = fused.padding
+        self.in_channels = fused.in_channels
+        self.out_channels = fused.out_channels
+        self.relu = fused.relu
+        self.bias = fused.bias.astype(np.float32)
+        self.qweight, self.weight_scale = quantize_per_channel(fused.weight)
+        self.input_scale = np.float32(input_scale)
+        self.output_scale = (self.input_scale * self.weight_scale).astype(np.float32)
+        self.tile_rows = tile_rows
+        # the largest possible |q_x @ q_w| must be an exact float in the GEMM dtype
+        exact = self.k * self.k * self.in_channels * QMAX ** 2 < EXACT_FLOAT32
+        self.accumulate_dtype = np.dtype(np.float32 if exact else np.float64)
+        self._gemm_weight = self.qweight.astype(self.accumulate_dtype)
+
+    def __call__(self, x, out, cols, padded, staging, scratch):
+        n, h, w, c = x.shape
+        p, k = self.padding, self.k
+        np.multiply(x, 1 / self.input_scale, out=staging)
+        np.rint(staging, out=staging)
+        np.clip(staging, -QMAX, QMAX, out=staging)
+        np.copyto(padded[:, p:p + h, p:p + w, :], staging, casting="unsafe")
+
+        sn, sh, sw, sc = padded.strides
+        windows = as_strided(
+            padded, shape=(n, h, w, k, k, c), strides=(sn, sh, sw, sh, sw, sc), writeable=False
+        )
+        np.copyto(cols.reshape(n, h, w, k, k, c), windows)
+
+        for start in range(0, cols.shape[0], self.tile_rows):
+            tile = cols[start:start + self.tile_rows]
+            wide = scratch[: tile.shape[0], : tile.shape[1]]
+            np.copyto(wide, tile)
+            np.matmul(wide, self._gemm_weight, out=out[start:start + tile.shape[0]])
+        out *= self.output_scale
+        out += self.bias
+        if self.relu:
+            np.maximum(out, 0, out=out)
+        return out
+
+    def nbytes(self):
+        return self.qweight.nbytes + self.weight_scale.nbytes + self.bias.nbytes
+
+
+class QuantizedEngine(InferenceEngine):
+    """``InferenceEngine`` with every conv quantized to int8.
+
+    ``sample`` is the calibration batch. The residual adds, pooling and the
+    linear head stay in float32.
+    """
+
+    patch_dtype = np.int8
+
+    def __init__(self, model, batch_size, input_shape, sample, percentile=100.0, tile_rows=4096):
+        super().__init__(model, batch_size, input_shape, dtype=np.float32)
+        scales = iter(calibrate(model, sample, percentile))
+        self.stem = QuantizedConv(self.stem, next(scales), tile_rows)
+        self.blocks = [
+            (QuantizedConv(conv1, next(scales), tile_rows),
+             QuantizedConv(conv2, next(scales), tile_rows))
+            for conv1, conv2 in self.blocks
+        ]
+        h, w, _ = self.input_shape
+        layers = self.layers()
+        self._staging = np.empty(
+            batch_size * h * w * max(l.in_channels for l in layers), dtype=np.float32
+        )
+        # one tile buffer per GEMM dtype, sized for the widest layer using it
+        self._scratch = {}
+        for dtype in {l.accumulate_dtype for l in layers}:
+            width = max(l.k * l.k * l.in_channels for l in layers if l.accumulate_dtype == dtype)
+            self._scratch[dtype] = np.empty((tile_rows, width), dtype=dtype)
+
+    def _run(self, layer, x, out, n):
+        h, w, _ = self.input_shape
+        cin = layer.in_channels
+        staging = self._staging[: n * h * w * cin].reshape(n, h, w, cin)
+        layer(x, out, self._cols[cin][: n * h * w], self._padded[cin][:n], staging,
+              self._scratch[layer.accumulate_dtype])
+        return out.reshape(n, h, w, layer.out_channels)
+
+    def nbytes(self):
+        return super().nbytes() + self._staging.nbytes + self._scratch_nbytes()
+
+    def _scratch_nbytes(self):
+        return sum(buffer.nbytes for buffer in self._scratch.values())
+
+    def block_nbytes(self):
+        width = self.stem.out_channels
+        h, w, _ = self.input_shape
+        return (super().block_nbytes() + self._scratch_nbytes()
+                + self.batch_size * h * w * width * self._staging.itemsize)
@@ -1,9 +1,19 @@
 # resnet_explainer.py
 
 
+import json
+import os
+import sys
+
 import numpy as np
 from manim import *
 
+try:
+    from render_tools.bulk import CellGrid
+except ImportError:  # rendered from this folder; render_tools sits at the repository root
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+    from render_tools.bulk import CellGrid
+
 
 class IntroductionScene(Scene):
     def construct(self):
@@ -402,29 +412,21 @@ class CNNExample(Scene):
         grid_size = 3
         cell_size = 0.5
 
-        # Helper function to create a grid with values
+        # Helper function to create a grid with values. All cells are one
+        # CellGrid mobject, so a larger grid costs no more per frame.
         def create_grid(values, position, color=BLUE, show_values=True):
-            grid_group = VGroup()
-            for i in range(grid_size):
-                for j in range(grid_size):
-                    square = Square(side_length=cell_size, color=color, stroke_width=2)
-                    square.move_to(
-                        position + np.array([j * cell_size, -i * cell_size, 0])
-                    )
-
-                    # Add value text if provided
-                    if values is not None and show_values:
-                        val = values[i][j]
-                        # Normalize for opacity (assuming values 0-100 range)
-                        opacity = min(abs(val) / 50.0, 1.0) if val != 0 else 0
-                        square.set_fill(color, opacity=opacity * 0.5)
-                        # Format value to 1 decimal place
-                        text = Text(f"{val:.1f}", font_size=12).move_to(
-                            square.get_center()
-                        )
-                        grid_group.add(VGroup(square, text))
-                    else:
-                        grid_group.add(square)
+            grid = CellGrid(grid_size, grid_size, cell_size, color=color)
+            grid_group = Group(grid)
+
+            # Add value text if provided
+            if values is not None and show_values:
+                # Normalize for opacity (assuming values 0-100 range)
+                grid.set_values(values, scale=50.0, max_opacity=0.5)
+                # Format value to 1 decimal place
+                grid_group.add(VGroup(*[
+                    Text(f"{val:.1f}", font_size=12).move_to(center)
+                    for val, center in zip(np.ravel(values), grid.cell_centers())
+                ]))
             # Center the grid around the provided position so arrows stay horizontal
             grid_group.move_to(position)
             return grid_group
@@ -635,3 +637,58 @@ class CNNExample(Scene):
 
         self.play(Write(example_text, run_time=1.0))
         self.wait(2.0)
+
+
+class GradientFlow(Scene):
+    def construct(self):
+        # Curves come from ``python -m resnet_engine.gradient_flow``
+        with open("assets/gradient_flow.json") as f:
+            data = json.load(f)
+        depth = max(run["depth"] for run in data["runs"])
+        runs = {run["skip"]: run for run in data["runs"] if run["depth"] == depth}
+
+        title = Text(f"Gradient flow through {depth} blocks", font_size=40).to_edge(UP)
+        self.play(Write(title, run_time=1.0))
+        self.wait(0.3)
+
+        # log10 ||dL/dy|| per block, input side on the left
+        curves = {skip: np.log10(run["activation"]) for skip, run in runs.items()}
+        y_min = np.floor(min(c.min() for c in curves.values()))
+        y_max = np.ceil(max(c.max() for c in curves.values()))
+        y_step = max(1, int(np.ceil((y_max - y_min) / 6)))
+        axes = Axes(
+            x_range=[0, depth, max(depth // 5, 1)],
+            y_range=[y_min, y_max, y_step],
+            x_length=10,
+            y_length=4.8,
+            axis_config={"include_numbers": True, "font_size": 20},
+        ).shift(DOWN * 0.4)
+        x_label = Text("block (input → output)", font_size=20).next_to(axes, DOWN, buff=0.2)
+        y_label = (
+            Text("log10 ||dL/dy||", font_size=20).rotate(PI / 2).next_to(axes, LEFT, buff=0.2)
+        )
+        self.play(Create(axes, run_time=1.0), FadeIn(x_label, y_label, run_time=0.6))
+        self.wait(0.3)
+
+        blocks = np.arange(depth)
+        styles = {False: (RED, "plain: y = f(x)"), True: (GREEN, "residual: y = x + f(x)")}
+        legend = VGroup()
+        for skip in (False, True):
+            color, name = styles[skip]
+            graph = axes.plot_line_graph(
+                blocks, curves[skip], line_color=color, add_vertex_dots=False, stroke_width=4
+            )
+            label = Text(name, font_size=20, color=color)
+            legend.add(label)
+            legend.arrange(DOWN, aligned_edge=LEFT, buff=0.15).to_corner(UR).shift(DOWN * 0.9)
+            self.play(Create(graph, run_time=2.0), FadeIn(label, run_time=0.5))
+            self.wait(0.5)
+
+        plain, residual = curves[False], curves[True]
+        note = Text(
+            f"Plain: gradients change by 10^{plain[0] - plain[-1]:.0f} across the stack.  "
+            f"Residual: 10^{residual[0] - residual[-1]:.1f}",
+            font_size=20,
+        ).to_edge(DOWN)
+        self.play(Write(note, run_time=1.0))
+        self.wait(2.0)
@@ -0,0 +1 @@
+"""Benchmarks for the render tools; run each with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,117 @@
+# render_farm.py
+"""Makespan of the render catalog: file order vs longest first vs split.
+
+Builds timelines about as long as the real scenes (``FederatedAveraging``
+is the long one) and plans them as ``render_tools.farm`` would. Each job
+then runs as a real subprocess that sleeps for its estimate / ``--speed``
+instead of rendering, so only the scheduling is measured. Three
+strategies are compared:
+
+* ``file order`` - whole scenes, dispatched in manifest order (each scene
+  at every quality before the next scene)
+* ``longest first`` - whole scenes, LPT
+* ``split + LPT`` - long scenes cut into ``manim -n`` segments, LPT
+
+``ratio`` is makespan / (total work / workers); 1.00 is a perfect packing.
+
+Finally ``FederatedAveraging`` is given a simulated peak RSS above
+``--budget``. The check passes if its retry holds two slots, its argv
+carries twice the budget, and it then succeeds.
+
+    python -m benchmarks.render_farm --workers 4 8 --qualities l h
+"""
+
+import argparse
+import json
+import os
+import tempfile
+
+from render_tools import Timeline, compile_timeline
+from render_tools.farm import CostModel, Farm, plan, simulated_launcher
+from render_tools.memory import EXIT_OVER_BUDGET, parse_bytes
+
+# scene: (animated steps, static waits) per file, roughly as in the scene modules
+CATALOG = {
+    "resnet_explainer.py": {
+        "IntroductionScene": (8, 4), "ImageExample": (10, 5), "WhatIsF": (22, 10),
+        "ResidualConnection": (24, 10), "ResidualExplanation": (30, 14),
+        "CNNExample": (60, 40), "GradientFlow": (14, 6),
+    },
+    "federated_averaging.py": {"FederatedAveraging": (140, 40)},
+}
+
+
+def write_manifests(directory):
+    paths = []
+    for file, scenes in CATALOG.items():
+        manifest = {"file": file, "scenes": {}}
+        for name, (plays, waits) in scenes.items():
+            timeline = Timeline(name)
+            for i in range(plays):
+                timeline.play("Write", run_time=0.5 + (i % 4) * 0.25)
+                if i % max(1, plays // waits) == 0:
+                    timeline.wait(1.5)
+            manifest["scenes"][name] = compile_timeline(timeline).to_dict()
+        path = os.path.join(directory, file.replace(".py", ".json"))
+        with open(path, "w") as f:
+            json.dump(manifest, f)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 8])
+    parser.add_argument("--qualities", nargs="+", default=["l", "h"])
+    parser.add_argument("--speed", type=float, default=300.0,
+                        help="simulated seconds of render per wall second")
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--budget", default="1.5G", help="per-slot budget for the retry check")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        manifests = write_manifests(directory)
+        model = CostModel()
+        print(f"{'workers':>8}{'strategy':>15}{'jobs':>6}{'makespan s':>12}"
+              f"{'work/cores s':>14}{'ratio':>8}{'utilization':>13}")
+        for workers in args.workers:
+            file_order = plan(manifests, args.qualities, workers, model, split=0, sort=False)
+            runs = [
+                ("file order", file_order, False),
+                ("longest first", plan(manifests, args.qualities, workers, model, split=0), True),
+                ("split + LPT", plan(manifests, args.qualities, workers, model), True),
+            ]
+            for name, jobs, longest_first in runs:
+                for job in jobs:
+                    job.attempts = []
+                farm = Farm(jobs, workers, launcher=simulated_launcher(args.speed, args.fail_rate),
+                            longest_first=longest_first).run()
+                report = farm.report()
+                print(f"{workers:>8}{name:>15}{len(jobs):>6}{report['makespan']:>12.2f}"
+                      f"{report['total_work'] / workers:>14.2f}"
+                      f"{report['makespan'] / (report['total_work'] / workers):>8.2f}"
+                      f"{report['utilization']:>13.0%}")
+
+        retry_check(manifests, args.budget, args.speed)
+
+
+def retry_check(manifests, budget, speed):
+    """An over-budget job must come back with two slots and twice the budget."""
+    budget = parse_bytes(budget)
+    jobs = [job for job in plan(manifests, ["l"], 4, CostModel(), split=0)
+            if job.scene == "FederatedAveraging"]
+    launcher = simulated_launcher(speed, budget=budget,
+                                  peak_rss={"FederatedAveraging": budget * 3 // 2})
+    farm = Farm(jobs, 4, retries=1, launcher=launcher).run()
+    budgets = [int(argv[argv.index("--budget") + 1]) for argv in launcher.argvs]
+    statuses = [status for status, _ in jobs[0].attempts]
+    ok = (budgets == [budget, 2 * budget] and statuses == [EXIT_OVER_BUDGET, 0]
+          and jobs[0].slots == 2 and not farm.failed)
+    print(f"retry check: budgets {[b / 2**30 for b in budgets]} GiB, exit statuses {statuses}: "
+          f"{'ok' if ok else 'FAILED'}")
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Ahead-of-time tooling for rendering the Manim scenes.
+
+``record`` needs Manim and is imported on its own:
+``from render_tools.record import record``.
+"""
+
+from .compiler import Schedule, compile_timeline, partition, step_costs
+from .timeline import Step, Timeline
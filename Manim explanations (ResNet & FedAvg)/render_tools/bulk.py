@@ -0,0 +1,222 @@
+# bulk.py
+"""Array-backed mobjects for grids and dot clouds.
+
+A grid of ``Square``s or a cloud of ``Dot``s is one mobject per element,
+and Manim walks every family member on every frame. A 32x32 activation
+map is over a thousand mobjects, and 1000 clients with nine data dots
+each is nine thousand. The classes here hold the elements' colors
+``(n, 3)`` and opacities ``(n,)`` in NumPy arrays and draw them as one
+RGBA image. The camera composites that image in a single call, however
+many elements it holds:
+
+* ``CellGrid`` - a rows x cols grid, one pixel per cell scaled up with
+  nearest-neighbour resampling, plus the cell borders as one path
+* ``DotCloud`` - anti-aliased disks at arbitrary points, rasterised at
+  the render resolution
+
+Per-element changes are array assignments followed by ``refresh()``:
+
+    grid.opacities[:] = np.minimum(np.abs(values) / 50, 1).ravel() * 0.5
+    grid.colors[values.ravel() < 0] = color_to_rgb(RED)
+    grid.refresh()
+
+``FadeIn``, ``FadeOut`` and ``Transform`` between bulk mobjects of the
+same shape interpolate the arrays, and ``StaggeredFade`` replaces a
+``LaggedStart`` of per-element ``FadeIn``s.
+"""
+
+import numpy as np
+from manim import (
+    RESAMPLING_ALGORITHMS, WHITE, Animation, ImageMobject, ManimColor, VMobject,
+    color_to_rgb, config, interpolate, smooth,
+)
+
+
+class BulkMobject(ImageMobject):
+    """Base class: ``count`` elements whose colors and opacities live in arrays.
+
+    Subclasses define ``_raster()``, which turns ``colors``, ``opacities``
+    and the overall ``alpha`` into an RGBA ``uint8`` image.
+    """
+
+    def __init__(self, count, raster_shape, color=WHITE, opacity=1.0, **kwargs):
+        self.count = count
+        self.colors = np.tile(color_to_rgb(color), (count, 1))
+        self.opacities = np.full(count, float(opacity))
+        self.alpha = 1.0
+        super().__init__(np.zeros(raster_shape + (4,), dtype=np.uint8),
+                         scale_to_resolution=False, **kwargs)
+
+    def refresh(self):
+        """Redraw the image from ``colors``, ``opacities`` and ``alpha``."""
+        self.pixel_array = self._raster()
+        return self
+
+    def _raster(self):
+        raise NotImplementedError
+
+    def set_color(self, color, alpha=None, family=True):
+        self.colors[:] = color_to_rgb(color)
+        if alpha is not None:
+            self.opacities[:] = alpha
+        if family:
+            for submob in self.submobjects:
+                submob.set_color(color)
+        self.color = ManimColor(color)
+        return self.refresh()
+
+    def set_opacity(self, alpha):
+        """Scale every element's opacity by ``alpha``; per-element values are kept."""
+        self.alpha = alpha
+        self.fill_opacity = alpha
+        self.stroke_opacity = alpha
+        return self.refresh()
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        self.colors = interpolate(mobject1.colors, mobject2.colors, alpha)
+        self.opacities = interpolate(mobject1.opacities, mobject2.opacities, alpha)
+        self.alpha = interpolate(mobject1.alpha, mobject2.alpha, alpha)
+        self.refresh()
+
+
+class CellGrid(BulkMobject):
+    """A rows x cols grid of ``cell_size`` squares; element i is cell (i // cols, i % cols)."""
+
+    def __init__(self, rows, cols, cell_size=0.5, color=WHITE, opacity=0.0,
+                 stroke_width=2, **kwargs):
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        super().__init__(rows * cols, (rows, cols), color, opacity,
+                         resampling_algorithm=RESAMPLING_ALGORITHMS["nearest"], **kwargs)
+        self.stretch_to_fit_width(cols * cell_size)
+        self.stretch_to_fit_height(rows * cell_size)
+        self.center()
+        self.refresh()
+        self.add(self._borders(color, stroke_width))
+
+    def _borders(self, color, stroke_width):
+        """All grid lines as the subpaths of one ``VMobject``: one stroke per frame."""
+        w, h = self.cols * self.cell_size, self.rows * self.cell_size
+        xs = np.linspace(-w / 2, w / 2, self.cols + 1)
+        ys = np.linspace(-h / 2, h / 2, self.rows + 1)
+        starts = np.concatenate([np.stack([xs, np.full_like(xs, -h / 2)], 1),
+                                 np.stack([np.full_like(ys, -w / 2), ys], 1)])
+        ends = np.concatenate([np.stack([xs, np.full_like(xs, h / 2)], 1),
+                               np.stack([np.full_like(ys, w / 2), ys], 1)])
+        # a straight cubic Bezier per line: anchors at the ends, handles at thirds
+        t = np.array([0, 1 / 3, 2 / 3, 1])[None, :, None]
+        points = np.zeros((len(starts), 4, 3))
+        points[:, :, :2] = starts[:, None] + t * (ends - starts)[:, None]
+        borders = VMobject(stroke_color=color, stroke_width=stroke_width, fill_opacity=0)
+        borders.set_points(points.reshape(-1, 3))
+        return borders.move_to(self.get_center())
+
+    def _raster(self):
+        rgba = np.empty((self.count, 4))
+        rgba[:, :3] = self.colors
+        rgba[:, 3] = self.opacities * self.alpha
+        return np.rint(np.clip(rgba, 0, 1) * 255).astype(np.uint8).reshape(self.rows, self.cols, 4)
+
+    def set_values(self, values, scale=50.0, max_opacity=0.5):
+        """Cell opacities proportional to |value| / scale, as in ``CNNExample``."""
+        values = np.asarray(values, dtype=float).ravel()
+        self.opacities[:] = np.minimum(np.abs(values) / scale, 1.0) * max_opacity
+        return self.refresh()
+
+    def cell_centers(self):
+        """(rows * cols, 3) scene coordinates of the cell centers, row-major from the top left."""
+        left, top = self.get_left()[0], self.get_top()[1]
+        width, height = self.width / self.cols, self.height / self.rows
+        i, j = np.divmod(np.arange(self.count), self.cols)
+        return np.stack([left + (j + 0.5) * width, top - (i + 0.5) * height,
+                         np.zeros(self.count)], axis=1)
+
+
+class DotCloud(BulkMobject):
+    """Disks of ``radius`` at ``points`` (n, 2 or 3), drawn as one image.
+
+    The image is rasterised at ``pixels_per_unit``, by default the current
+    render resolution. Each dot's pixel footprint and coverage are computed
+    once, so a redraw is two scatter operations over all dots.
+    """
+
+    def __init__(self, points, radius=0.08, color=WHITE, opacity=1.0,
+                 pixels_per_unit=None, **kwargs):
+        points = np.asarray(points, dtype=float)
+        if points.ndim != 2 or points.shape[1] not in (2, 3) or not len(points):
+            raise ValueError(f"points must be a non-empty (n, 2) or (n, 3) array, got {points.shape}")
+        ppu = pixels_per_unit or config.pixel_width / config.frame_width
+        self.radius = radius
+        lo = points[:, :2].min(axis=0) - radius
+        hi = points[:, :2].max(axis=0) + radius
+        width, height = np.maximum(np.ceil((hi - lo) * ppu).astype(int), 1)
+        self._footprint(points, lo[0], hi[1], radius * ppu, ppu, width, height)
+        super().__init__(len(points), (height, width), color, opacity, **kwargs)
+        self.stretch_to_fit_width(width / ppu)
+        self.stretch_to_fit_height(height / ppu)
+        self.move_to([lo[0] + width / ppu / 2, hi[1] - height / ppu / 2, 0])
+        self.refresh()
+
+    def _footprint(self, points, left, top, r, ppu, width, height):
+        """Flat pixel index, coverage and owning dot of every pixel any dot touches."""
+        cx = (points[:, 0] - left) * ppu
+        cy = (top - points[:, 1]) * ppu
+        k = int(np.ceil(r)) + 1
+        d = np.arange(-k, k + 1)
+        ix = np.floor(cx)[:, None, None].astype(int) + d[None, None, :]
+        iy = np.floor(cy)[:, None, None].astype(int) + d[None, :, None]
+        cover = np.clip(r + 0.5 - np.hypot(ix + 0.5 - cx[:, None, None],
+                                           iy + 0.5 - cy[:, None, None]), 0, 1)
+        ix, iy = np.broadcast_arrays(ix, iy)
+        keep = (cover > 0) & (ix >= 0) & (ix < width) & (iy >= 0) & (iy < height)
+        self._pixels = (iy * width + ix)[keep]
+        self._cover = cover[keep]
+        self._owner = np.broadcast_to(np.arange(len(points))[:, None, None], keep.shape)[keep]
+        self._shape = (height, width)
+
+    def _raster(self):
+        rgba = np.zeros((self._shape[0] * self._shape[1], 4))
+        rgba[self._pixels, :3] = self.colors[self._owner]
+        np.maximum.at(rgba[:, 3], self._pixels,
+                      self._cover * self.opacities[self._owner] * self.alpha)
+        return np.rint(np.clip(rgba, 0, 1) * 255).astype(np.uint8).reshape(self._shape + (4,))
+
+
+class StaggeredFade(Animation):
+    """Fade the elements of a ``BulkMobject`` in or out group by group.
+
+    Element i belongs to group ``groups[i]``. Groups start ``lag_ratio``
+    apart and each fades over one unit of time, which matches
+    ``LaggedStart(*[FadeIn(g) for g in groups], lag_ratio=lag_ratio)``.
+    Every frame is one vectorized opacity update.
+    """
+
+    def __init__(self, bulk, groups=None, lag_ratio=0.2, fade_in=True, run_time=None,
+                 rate_func=smooth, **kwargs):
+        groups = np.zeros(bulk.count, dtype=int) if groups is None else np.asarray(groups)
+        self.order, self.slot = np.unique(groups, return_inverse=True)
+        self.lag_ratio = lag_ratio
+        self.fade_in = fade_in
+        self.span = 1 + (len(self.order) - 1) * lag_ratio
+        self.group_rate = np.vectorize(rate_func, otypes=[float])
+        super().__init__(bulk, run_time=self.span if run_time is None else run_time,
+                         rate_func=rate_func, introducer=fade_in, remover=not fade_in, **kwargs)
+
+    def begin(self):
+        self.final_opacities = self.mobject.opacities.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = np.clip(alpha * self.span - np.arange(len(self.order)) * self.lag_ratio, 0, 1)
+        shown = self.group_rate(t)
+        if not self.fade_in:
+            shown = 1 - shown
+        self.mobject.opacities = self.final_opacities * shown[self.slot]
+        self.mobject.refresh()
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if not self.fade_in:  # removed from the scene; leave it ready to be shown again
+            self.mobject.opacities = self.final_opacities
+            self.mobject.refresh()
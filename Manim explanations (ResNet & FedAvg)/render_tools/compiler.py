@@ -0,0 +1,120 @@
+# compiler.py
+"""Ahead-of-time pass from a ``Timeline`` to a render ``Schedule``.
+
+Everything here is arithmetic on step run times, so it takes microseconds
+and needs neither Manim nor a renderer:
+
+* start time of every step and total duration
+* static spans: runs of consecutive static steps, whose frames can all
+  reuse one rendered image
+* segment boundaries: the steps cut into contiguous ranges of about equal
+  cost, each renderable on its own with ``manim -n first,last``
+* the text and TeX strings to typeset before the segments fan out
+
+The cost of a step is ``overhead + run_time`` for animated steps and
+``overhead + static_weight * run_time`` for static ones, in seconds of
+animated video. The cuts minimise the cost of the most expensive
+segment.
+"""
+
+from .timeline import Timeline
+
+
+def step_costs(timeline, overhead=0.1, static_weight=0.05):
+    return [overhead + step.run_time * (static_weight if step.static else 1.0)
+            for step in timeline.steps]
+
+
+def partition(costs, parts):
+    """Cut ``costs`` into at most ``parts`` contiguous (first, last) runs, minimising the largest sum."""
+    if not costs:
+        return []
+    parts = max(1, min(parts, len(costs)))
+
+    def cut(limit):
+        runs, first, load = [], 0, 0.0
+        for i, cost in enumerate(costs):
+            if load + cost > limit and i > first:
+                runs.append((first, i - 1))
+                first, load = i, 0.0
+            load += cost
+        runs.append((first, len(costs) - 1))
+        return runs
+
+    lo, hi = max(costs), sum(costs)
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        if len(cut(mid)) <= parts:
+            hi = mid
+        else:
+            lo = mid
+    return cut(hi)
+
+
+class Schedule:
+    """Duration, static spans, parallel segments and text set of one scene."""
+
+    def __init__(self, timeline, segments=1, overhead=0.1, static_weight=0.05):
+        self.name = timeline.name
+        self.timeline = timeline
+        self.starts = []
+        t = 0.0
+        for step in timeline.steps:
+            self.starts.append(t)
+            t += step.run_time
+        self.duration = t
+        self.costs = step_costs(timeline, overhead, static_weight)
+        self.cost = sum(self.costs)
+        self.segments = [self._span(first, last) for first, last in partition(self.costs, segments)]
+        self.static_spans = [self._span(first, last) for first, last in self._static_runs()]
+        self.static_seconds = sum(s.run_time for s in timeline.steps if s.static)
+        self.texts = list(timeline.texts)
+
+    def _span(self, first, last):
+        """(first, last, start, end, cost) of the steps first..last inclusive."""
+        end = self.starts[last] + self.timeline.steps[last].run_time
+        return first, last, self.starts[first], end, sum(self.costs[first:last + 1])
+
+    def _static_runs(self):
+        runs, first = [], None
+        for i, step in enumerate(self.timeline.steps):
+            if step.static and first is None:
+                first = i
+            elif not step.static and first is not None:
+                runs.append((first, i - 1))
+                first = None
+        if first is not None:
+            runs.append((first, len(self.timeline.steps) - 1))
+        return runs
+
+    def segment_commands(self, path, quality="l"):
+        """One ``manim`` argv per segment; each writes its own ``<scene>_partNN`` movie."""
+        return [
+            ["manim", f"-q{quality}", "-n", f"{first},{last}",
+             "-o", f"{self.name}_part{j:02d}", path, self.name]
+            for j, (first, last, _, _, _) in enumerate(self.segments)
+        ]
+
+    def to_dict(self):
+        span = ("first", "last", "start", "end", "cost")
+        return {
+            "name": self.name,
+            "duration": self.duration,
+            "steps": len(self.timeline.steps),
+            "cost": self.cost,
+            "static_seconds": self.static_seconds,
+            "segments": [dict(zip(span, s)) for s in self.segments],
+            "static_spans": [dict(zip(span, s)) for s in self.static_spans],
+            "texts": [list(t) for t in self.texts],
+            "timeline": self.timeline.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, d, segments=None, overhead=0.1, static_weight=0.05):
+        """Recompile a manifest entry, optionally with a different segment count."""
+        return cls(Timeline.from_dict(d["timeline"]), segments or len(d["segments"]),
+                   overhead, static_weight)
+
+
+def compile_timeline(timeline, segments=1, overhead=0.1, static_weight=0.05):
+    return Schedule(timeline, segments, overhead, static_weight)
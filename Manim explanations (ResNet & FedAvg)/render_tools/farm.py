@@ -0,0 +1,369 @@
+# farm.py
+"""Local render farm: every scene at every quality on a pool of workers.
+
+Scenes differ wildly in length. ``FederatedAveraging`` runs for minutes,
+``IntroductionScene`` for seconds, so running them in file order leaves
+cores idle while the last long scene finishes. The farm plans the
+catalog from the manifests written by ``render_tools.record``:
+
+1. **Cost model.** Each job's cost is its compiler cost units (seconds of
+   animated video, see ``compiler``) times a wall-seconds-per-unit rate.
+   The rate comes from the history of past runs of the same scene and
+   quality, else of the same quality, else from ``PRIOR_RATES``. Every
+   finished job is appended to the history, so estimates improve with
+   each run.
+2. **Splitting.** A scene estimated above ``total / (split * workers)`` is
+   cut into ``manim -n`` segments of about equal cost, so no single job
+   bounds the makespan.
+3. **Longest first.** Jobs are dispatched in decreasing estimated cost to
+   whichever worker frees up first (LPT list scheduling, within 4/3 of the
+   optimal makespan).
+4. **Retries.** A failed job is queued again, up to ``retries`` times. A job
+   that exceeded its memory budget (``EXIT_OVER_BUDGET``) is retried
+   holding twice as many worker slots and with its ``--budget`` scaled by
+   the slots it holds. Fewer workers then share the host, and the job may
+   use the memory they would have used.
+
+When every segment of a scene has rendered, its parts are joined with
+ffmpeg's concat demuxer. The report gives the makespan, worker utilization
+and the ratio to the lower bound max(total work / workers, longest job).
+
+    python -m render_tools.farm resnet_manifest.json fedavg_manifest.json \\
+        --qualities l h --workers 8 --budget 1.5G
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from .compiler import Schedule
+from .memory import EXIT_OVER_BUDGET, parse_bytes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MOVIE_DIRS = {"l": "480p15", "m": "720p30", "h": "1080p60", "p": "1440p60", "k": "2160p60"}
+# wall seconds per cost unit before any history exists (Cairo, one core)
+PRIOR_RATES = {"l": 1.5, "m": 4.0, "h": 12.0, "p": 20.0, "k": 45.0}
+
+
+class Job:
+    """One ``render_tools.worker`` run: a scene, or one segment of it, at one quality."""
+
+    def __init__(self, file, scene, quality, units, segment=None, part=None, parts=1):
+        self.file = file
+        self.scene = scene
+        self.quality = quality
+        self.units = units
+        self.segment = segment
+        self.part = part
+        self.parts = parts
+        self.estimate = 0.0
+        self.slots = 1
+        self.attempts = []  # (exit status, seconds)
+
+    @property
+    def name(self):
+        part = f" part {self.part + 1}/{self.parts}" if self.parts > 1 else ""
+        return f"{self.scene}[{self.quality}]{part}"
+
+    @property
+    def output(self):
+        return f"{self.scene}_part{self.part:02d}" if self.parts > 1 else None
+
+    @property
+    def key(self):
+        return os.path.basename(self.file), self.scene
+
+    def argv(self, budget=None):
+        argv = [sys.executable, "-m", "render_tools.worker", self.file, self.scene,
+                "--quality", self.quality]
+        if self.segment is not None:
+            argv += ["--segment", "{},{}".format(*self.segment), "-o", self.output]
+        if budget:
+            # ``budget`` is per worker slot; a job holding more slots may use their memory
+            argv += ["--budget", str(parse_bytes(budget) * self.slots)]
+        return argv
+
+
+class CostModel:
+    """Wall seconds per cost unit, learned from a JSON-lines history of finished jobs."""
+
+    def __init__(self, records=()):
+        self.scene_totals = {}
+        self.quality_totals = {}
+        for record in records:
+            self.add(record)
+
+    @classmethod
+    def load(cls, path):
+        if not path or not os.path.exists(path):
+            return cls()
+        with open(path) as f:
+            return cls(json.loads(line) for line in f if line.strip())
+
+    def add(self, record):
+        if record["units"] <= 0:
+            return
+        key = (record["file"], record["scene"], record["quality"])
+        for totals, k in ((self.scene_totals, key), (self.quality_totals, record["quality"])):
+            seconds, units = totals.get(k, (0.0, 0.0))
+            totals[k] = (seconds + record["seconds"], units + record["units"])
+
+    def rate(self, key, quality):
+        for totals, k in ((self.scene_totals, key + (quality,)), (self.quality_totals, quality)):
+            if k in totals:
+                seconds, units = totals[k]
+                return seconds / units
+        return PRIOR_RATES[quality]
+
+    def estimate(self, job):
+        return self.rate(job.key, job.quality) * job.units
+
+
+def plan(manifests, qualities, workers, model, split=2.0, sort=True):
+    """Jobs for every scene of every manifest at every quality, longest first.
+
+    With ``sort=False`` the jobs stay in manifest order: scene by scene,
+    each scene at every quality.
+    """
+    entries = []
+    for path in manifests:
+        with open(path) as f:
+            manifest = json.load(f)
+        file = os.path.join(os.path.dirname(os.path.abspath(path)), manifest["file"])
+        for entry in manifest["scenes"].values():
+            for quality in qualities:
+                if quality not in MOVIE_DIRS:
+                    raise ValueError(f"quality must be one of {sorted(MOVIE_DIRS)}, got {quality!r}")
+                job = Job(file, entry["name"], quality, entry["cost"])
+                job.estimate = model.estimate(job)
+                entries.append((entry, job))
+
+    total = sum(job.estimate for _, job in entries)
+    limit = total / (split * workers) if total and split else 0.0  # split=0: whole scenes
+    jobs = []
+    for entry, job in entries:
+        parts = min(entry["steps"], math.ceil(job.estimate / limit)) if limit else 1
+        if parts <= 1:
+            jobs.append(job)
+            continue
+        schedule = Schedule.from_dict(entry, segments=parts)
+        for part, (first, last, _, _, units) in enumerate(schedule.segments):
+            piece = Job(job.file, job.scene, job.quality, units, (first, last), part,
+                        len(schedule.segments))
+            piece.estimate = model.estimate(piece)
+            jobs.append(piece)
+    if sort:
+        jobs.sort(key=lambda j: j.estimate, reverse=True)
+    return jobs
+
+
+def predicted_makespan(jobs, workers):
+    """Makespan of LPT list scheduling if every estimate were exact."""
+    loads = [0.0] * workers
+    for job in sorted(jobs, key=lambda j: j.estimate, reverse=True):
+        heapq.heapreplace(loads, loads[0] + job.estimate)
+    return max(loads)
+
+
+def launch(job, budget=None, log_dir=None):
+    """Start ``job`` as a worker subprocess, its output going to a log file."""
+    log = subprocess.DEVNULL
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        stem = job.output or job.scene
+        log = open(os.path.join(log_dir, f"{stem}_{job.quality}.log"), "ab")
+    proc = subprocess.Popen(job.argv(budget), cwd=ROOT, stdout=log, stderr=subprocess.STDOUT)
+    if log is not subprocess.DEVNULL:
+        log.close()  # the child holds its own descriptor
+    return proc
+
+
+class Farm:
+    """Runs ``jobs`` on ``workers`` slots, longest estimate first, with retries."""
+
+    def __init__(self, jobs, workers, retries=2, launcher=launch, poll=0.02, longest_first=True):
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        self.queue = sorted(jobs, key=lambda j: j.estimate, reverse=True) if longest_first else list(jobs)
+        self.jobs = list(self.queue)
+        self.workers = workers
+        self.retries = retries
+        self.launcher = launcher
+        self.poll = poll
+        self.done = []
+        self.failed = []
+        self.busy_seconds = 0.0
+        self.makespan = 0.0
+
+    def run(self, on_finish=None):
+        free = self.workers
+        running = {}
+        start = time.perf_counter()
+        while self.queue or running:
+            # longest first; a job needing more slots than are free is passed
+            # over so the free ones can be backfilled
+            for job in list(self.queue):
+                if job.slots <= free:
+                    self.queue.remove(job)
+                    running[self.launcher(job)] = (job, time.perf_counter())
+                    free -= job.slots
+            finished = [(proc, status) for proc in running
+                        if (status := proc.poll()) is not None]
+            if not finished:
+                time.sleep(self.poll)
+                continue
+            for proc, status in finished:
+                job, t0 = running.pop(proc)
+                seconds = time.perf_counter() - t0
+                job.attempts.append((status, seconds))
+                self.busy_seconds += seconds * job.slots
+                free += job.slots
+                if status == 0:
+                    self.done.append(job)
+                    if on_finish is not None:
+                        on_finish(job, seconds)
+                elif len(job.attempts) <= self.retries:
+                    if status == EXIT_OVER_BUDGET:
+                        job.slots = min(self.workers, job.slots * 2)
+                    self._requeue(job)
+                else:
+                    self.failed.append(job)
+        self.makespan = time.perf_counter() - start
+        return self
+
+    def _requeue(self, job):
+        i = 0
+        while i < len(self.queue) and self.queue[i].estimate >= job.estimate:
+            i += 1
+        self.queue.insert(i, job)
+
+    def report(self):
+        work = [job.attempts[-1][1] for job in self.done]
+        total = sum(work)
+        bound = max(total / self.workers, max(work, default=0.0))
+        return {
+            "workers": self.workers,
+            "jobs": len(self.jobs),
+            "succeeded": len(self.done),
+            "failed": [job.name for job in self.failed],
+            "attempts": sum(len(job.attempts) for job in self.jobs),
+            "makespan": self.makespan,
+            "total_work": total,
+            "lower_bound": bound,
+            "efficiency": bound / self.makespan if self.makespan else 1.0,
+            "utilization": self.busy_seconds / (self.workers * self.makespan) if self.makespan else 1.0,
+            "predicted_makespan": predicted_makespan(self.jobs, self.workers),
+            "job_rows": [
+                {"job": job.name, "estimate": job.estimate, "attempts": job.attempts}
+                for job in self.jobs
+            ],
+        }
+
+
+def join_parts(jobs):
+    """Concatenate the segment movies of every scene whose parts all rendered."""
+    if shutil.which("ffmpeg") is None:
+        print("ffmpeg not found; segment movies were left unjoined")
+        return
+    scenes = {}
+    for job in jobs:
+        if job.parts > 1:
+            scenes.setdefault((job.file, job.scene, job.quality), []).append(job)
+    for (file, scene, quality), parts in scenes.items():
+        if len(parts) != parts[0].parts:
+            continue
+        module = os.path.splitext(os.path.basename(file))[0]
+        movies = os.path.join(os.path.dirname(file), "media", "videos", module, MOVIE_DIRS[quality])
+        listing = os.path.join(movies, f"{scene}_parts.txt")
+        with open(listing, "w") as f:
+            for job in sorted(parts, key=lambda j: j.part):
+                f.write(f"file '{job.output}.mp4'\n")
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", listing, "-c", "copy", os.path.join(movies, f"{scene}.mp4")],
+                       check=True)
+
+
+def simulated_launcher(speed=1.0, fail_rate=0.0, seed=0, budget=None, peak_rss=None):
+    """Launcher that sleeps for each job's estimate / ``speed`` instead of rendering.
+
+    ``peak_rss`` maps scene names to the RSS their render would reach. A job
+    whose ``--budget`` in ``job.argv(budget)`` is below it exits with
+    ``EXIT_OVER_BUDGET``, as the worker would. Every argv is kept in
+    ``launcher.argvs``.
+    """
+    rng = np.random.default_rng(seed)
+    peak_rss = peak_rss or {}
+
+    def launcher(job, *args, **kwargs):
+        argv = job.argv(budget)
+        launcher.argvs.append(argv)
+        status = 1 if rng.random() < fail_rate else 0
+        if "--budget" in argv:
+            if peak_rss.get(job.scene, 0) > int(argv[argv.index("--budget") + 1]):
+                status = EXIT_OVER_BUDGET
+        code = f"import sys, time; time.sleep({job.estimate / speed!r}); sys.exit({status})"
+        return subprocess.Popen([sys.executable, "-c", code])
+
+    launcher.argvs = []
+    return launcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every scene of the manifests on a worker pool.")
+    parser.add_argument("manifests", nargs="+", help="JSON written by render_tools.record")
+    parser.add_argument("--qualities", nargs="+", default=["l"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--split", type=float, default=2.0,
+                        help="split scenes above total / (split * workers); 0 never splits")
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--budget", help="soft RSS cap per worker slot, e.g. 1.5G")
+    parser.add_argument("--history", default=os.path.join(ROOT, "render_history.jsonl"))
+    parser.add_argument("--log-dir", default=os.path.join(ROOT, "render_logs"))
+    parser.add_argument("--report", help="write the run report as JSON")
+    parser.add_argument("--simulate", type=float, metavar="SPEED",
+                        help="sleep estimate / SPEED seconds per job instead of rendering")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="simulated failure probability")
+    args = parser.parse_args()
+
+    model = CostModel.load(args.history)
+    jobs = plan(args.manifests, args.qualities, args.workers, model, args.split)
+    print(f"{len(jobs)} jobs, estimated work {sum(j.estimate for j in jobs):.0f} s, "
+          f"predicted makespan {predicted_makespan(jobs, args.workers):.0f} s on {args.workers} workers")
+
+    if args.simulate:
+        farm = Farm(jobs, args.workers, args.retries,
+                    simulated_launcher(args.simulate, args.fail_rate, budget=args.budget))
+        farm.run()
+    else:
+        def record(job, seconds):
+            with open(args.history, "a") as f:
+                f.write(json.dumps({"file": job.key[0], "scene": job.scene, "quality": job.quality,
+                                    "segment": job.segment, "units": job.units,
+                                    "seconds": seconds}) + "\n")
+
+        farm = Farm(jobs, args.workers, args.retries,
+                    lambda job: launch(job, args.budget, args.log_dir))
+        farm.run(on_finish=record)
+        join_parts(farm.done)
+
+    report = farm.report()
+    print(f"makespan {report['makespan']:.1f} s, work {report['total_work']:.1f} s, "
+          f"lower bound {report['lower_bound']:.1f} s, efficiency {report['efficiency']:.0%}, "
+          f"utilization {report['utilization']:.0%}, {report['attempts']} attempts, "
+          f"{len(report['failed'])} failed")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=1)
+    sys.exit(1 if farm.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
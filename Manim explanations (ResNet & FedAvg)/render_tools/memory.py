@@ -0,0 +1,217 @@
+# memory.py
+"""Memory accounting and mobject lifetime cleanup for render workers.
+
+``MemoryMonitor`` wraps a scene's ``play`` (``wait`` goes through it) and
+records one row per step:
+
+* ``on_screen`` - family members of the scene's mobjects
+* ``live`` - mobjects on screen plus those that left it and are still
+  referenced
+* ``rss`` - resident set size in bytes
+* ``released`` - bytes spilled out of memory after the step
+
+``segment_summary`` reduces those rows to peaks per segment.
+
+Scenes keep Python references to every group they have faded out, since
+locals like ``intro_group`` live until ``construct`` returns. So after
+each step the monitor diffs the scene's family against the previous
+step's to find the mobjects that left the screen, and tracks them by weak
+reference until they are collected; nothing else in the heap is scanned.
+Every NumPy array of theirs that is at least ``min_bytes`` is written to a
+temporary ``.npy`` file and replaced by a read-write ``np.memmap`` of it:
+points, image pixel arrays, and bulk-mobject color and footprint arrays.
+The mobject itself is not touched, so its class, identity and copies stay
+ordinary. Its arrays are still arrays, so a scene that reuses a faded-out
+mobject, or measures its position, sees no difference; the kernel pages
+the data back in on first use. The file is unlinked as soon as it is
+mapped (on Windows, when the last view of it is gone), so no spill file
+outlives its arrays.
+
+``budget`` is a soft cap on RSS. When a step ends above it, the monitor
+releases every tracked off-screen mobject that still holds arrays in
+memory, collects garbage and measures again. It
+raises ``MemoryBudgetExceeded`` only if RSS is still over the budget, so
+the worker exits cleanly instead of being OOM-killed and the job can be
+retried with fewer workers per host. ``set_hard_limit`` adds a kernel
+limit on address space on top of that.
+"""
+
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import weakref
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+EXIT_OVER_BUDGET = 3  # exit status of a worker whose RSS stayed over its budget
+
+
+class MemoryBudgetExceeded(MemoryError):
+    pass
+
+
+def rss_bytes():
+    """Current resident set size; peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        if resource is None:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def set_hard_limit(nbytes):
+    """Cap this process's address space at ``nbytes`` (RLIMIT_AS).
+
+    Address space includes memory that is reserved but never touched, such as
+    thread stacks and allocator arenas, so set it well above the RSS budget.
+    """
+    if resource is None:
+        raise ValueError("hard memory limits need the resource module (POSIX only)")
+    resource.setrlimit(resource.RLIMIT_AS, (nbytes, nbytes))
+
+
+def parse_bytes(text):
+    """'512M', '2G', '1.5g' or a plain byte count."""
+    units = {"k": 2**10, "m": 2**20, "g": 2**30}
+    text = str(text).strip().lower().rstrip("b")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _spill(value, directory):
+    """Write ``value`` to a file in ``directory`` and return it memory-mapped."""
+    handle, path = tempfile.mkstemp(suffix=".npy", dir=directory)
+    with os.fdopen(handle, "wb") as f:
+        np.save(f, value)
+    mapped = np.load(path, mmap_mode="r+")
+    try:
+        # POSIX keeps the mapping valid; the kernel frees the file when it is unmapped
+        os.remove(path)
+    except OSError:
+        # Windows cannot delete a mapped file; delete it once the last view is gone
+        weakref.finalize(mapped.base, _remove, path)
+    return mapped
+
+
+def release(mob, directory, min_bytes=1 << 16):
+    """Spill the large arrays of ``mob`` to files in ``directory``; bytes freed."""
+    freed = 0
+    for name, value in list(mob.__dict__.items()):
+        if (isinstance(value, np.ndarray) and not isinstance(value, np.memmap)
+                and value.nbytes >= min_bytes):
+            mob.__dict__[name] = _spill(value, directory)
+            freed += value.nbytes
+    return freed
+
+
+def restore(mob, directory):
+    """Load the arrays of ``mob`` whose spill files in ``directory`` still exist back into memory."""
+    for name, value in list(mob.__dict__.items()):
+        if (isinstance(value, np.memmap) and value.filename is not None
+                and os.path.dirname(value.filename) == directory and os.path.exists(value.filename)):
+            mob.__dict__[name] = np.array(value)
+
+
+class MemoryMonitor:
+    """Per-step memory rows, off-screen release and an RSS budget for ``scene``."""
+
+    def __init__(self, scene, budget=None, release=True, min_bytes=1 << 16):
+        self.scene = scene
+        self.budget = budget
+        self.release = release
+        self.min_bytes = min_bytes
+        self.rows = []
+        self.released_bytes = 0
+        self.spill_dir = os.path.realpath(tempfile.mkdtemp(prefix="render_tools_spill_"))
+        self._on_screen = {}
+        # mobjects that left the screen and are still referenced, by id
+        self._off_screen = weakref.WeakValueDictionary()
+        self._spilled = weakref.WeakValueDictionary()
+        self._play = scene.play
+        scene.play = self._logged_play
+
+    def _logged_play(self, *args, **kwargs):
+        self._play(*args, **kwargs)
+        scene = self.scene
+        family = {id(m): m for m in scene.get_mobject_family_members()}
+        gone = [m for i, m in self._on_screen.items() if i not in family]
+        for i in family.keys() & self._off_screen.keys():
+            del self._off_screen[i]
+        for mob in gone:
+            self._off_screen[id(mob)] = mob
+        released = self._release(gone) if self.release else 0
+        self._on_screen = family
+        rss = rss_bytes()
+        if self.budget is not None and rss > self.budget:
+            released += self.release_off_screen()
+            gc.collect()
+            rss = rss_bytes()
+        self.released_bytes += released
+        self.rows.append({
+            "step": len(self.rows),
+            "rendered": not scene.renderer.skip_animations,
+            "on_screen": len(family),
+            "live": len(family) + len(self._off_screen),
+            "rss": rss,
+            "released": released,
+        })
+        if self.budget is not None and rss > self.budget:
+            raise MemoryBudgetExceeded(
+                f"RSS {rss / 2**20:.0f} MiB exceeds the {self.budget / 2**20:.0f} MiB budget "
+                f"after step {len(self.rows) - 1}"
+            )
+
+    def _release(self, mobjects):
+        freed = 0
+        for mob in mobjects:
+            nbytes = release(mob, self.spill_dir, self.min_bytes)
+            if nbytes:
+                self._spilled[id(mob)] = mob
+                freed += nbytes
+        return freed
+
+    def release_off_screen(self):
+        """Spill every mobject that left the screen and is still referenced."""
+        return self._release(list(self._off_screen.values()))
+
+    def segment_summary(self, segments):
+        """Peak RSS, peak mobject counts and released bytes over each (first, last) step range."""
+        summary = []
+        for first, last in segments:
+            rows = self.rows[first:last + 1]
+            if not rows:
+                continue
+            summary.append({
+                "first": first,
+                "last": last,
+                "peak_rss": max(r["rss"] for r in rows),
+                "peak_on_screen": max(r["on_screen"] for r in rows),
+                "peak_live": max(r["live"] for r in rows),
+                "released": sum(r["released"] for r in rows),
+            })
+        return summary
+
+    def close(self):
+        self.scene.play = self._play
+        for mob in list(self._spilled.values()):
+            restore(mob, self.spill_dir)
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
@@ -0,0 +1,144 @@
+# record.py
+"""Lower existing Manim scenes to ``Timeline``s.
+
+The scenes in ``resnet_explainer.py`` and ``federated_averaging.py`` build
+mobjects, do layout math and call ``self.play`` in one imperative
+``construct``. ``record`` runs that ``construct`` with animations skipped,
+the same path ``manim -s`` takes. Every mobject is built and every
+position is computed, but no frame is rasterised and no movie is written.
+``Scene.play`` is wrapped to log one step per call (``Scene.wait`` goes
+through ``play``). The constructors of Manim's text and TeX mobjects are
+wrapped to log every string they typeset.
+
+Building those mobjects also fills Manim's ``media/texts`` and
+``media/Tex`` caches, so a recording pass run from the scene's directory
+doubles as cache warm-up before segments are rendered in parallel.
+
+    python -m render_tools.record ResNet_Manim/resnet_manim/resnet_explainer.py \\
+        --segments 4 -o resnet_manifest.json
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+
+from manim import MarkupText, Scene, SingleStringMathTex, Text, Wait, tempconfig
+
+from .compiler import compile_timeline
+from .timeline import Step, Timeline
+
+# class, kind, name of the string argument
+TEXT_CLASSES = ((Text, "text", "text"), (MarkupText, "markup", "text"),
+                (SingleStringMathTex, "tex", "tex_string"))
+CAPTION_KWARGS = ("subcaption", "subcaption_duration", "subcaption_offset")
+
+
+def load_scenes(path):
+    """``Scene`` subclasses defined in the file at ``path``, in source order."""
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [obj for obj in vars(module).values()
+            if inspect.isclass(obj) and issubclass(obj, Scene) and obj.__module__ == name]
+
+
+@contextlib.contextmanager
+def _logging_texts(timeline):
+    """Log the string of every text or TeX mobject built inside the block."""
+    originals = [(cls, cls.__dict__.get("__init__")) for cls, _, _ in TEXT_CLASSES]
+
+    def wrap(init, kind, arg):
+        def __init__(self, *args, **kwargs):
+            timeline.add_text(kind, args[0] if args else kwargs[arg])
+            init(self, *args, **kwargs)
+        return __init__
+
+    for cls, kind, arg in TEXT_CLASSES:
+        cls.__init__ = wrap(cls.__init__, kind, arg)
+    try:
+        yield
+    finally:
+        for cls, init in originals:
+            if init is None:
+                del cls.__init__
+            else:
+                cls.__init__ = init
+
+
+def record(scene_class):
+    """The ``Timeline`` of ``scene_class``, built without rendering."""
+    timeline = Timeline(scene_class.__name__)
+    with tempconfig({"dry_run": True}), _logging_texts(timeline):
+        scene = scene_class(skip_animations=True)
+        play = scene.play
+
+        def logged_play(*args, **kwargs):
+            caption = {k: kwargs.pop(k) for k in CAPTION_KWARGS if k in kwargs}
+            animations = scene.compile_animations(*args, **kwargs)
+            run_time = max(a.run_time for a in animations)
+            if len(animations) == 1 and isinstance(animations[0], Wait):
+                frozen = animations[0].is_static_wait
+                static = not scene.should_update_mobjects() if frozen is None else frozen
+                kind, names = "wait", []
+            else:
+                kind, static, names = "play", False, [type(a).__name__ for a in animations]
+            play(*animations, **caption)
+            timeline.steps.append(Step(kind, run_time, names, static, len(scene.mobjects)))
+
+        scene.play = logged_play
+        scene.setup()
+        scene.construct()
+        scene.tear_down()
+    return timeline
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile Manim scenes to render schedules without rendering them."
+    )
+    parser.add_argument("file", help="scene module, e.g. FedAvg_Manim/federated_averaging.py")
+    parser.add_argument("scenes", nargs="*", help="scene names (default: all)")
+    parser.add_argument("--segments", type=int, default=4)
+    parser.add_argument("--quality", default="l")
+    parser.add_argument("-o", "--output", help="write the manifest as JSON")
+    args = parser.parse_args()
+
+    path = os.path.abspath(args.file)
+    output = os.path.abspath(args.output) if args.output else None
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(path))  # scenes load assets and write caches relative to it
+    try:
+        scenes = load_scenes(path)
+        unknown = set(args.scenes) - {cls.__name__ for cls in scenes}
+        if unknown:
+            raise SystemExit(f"no scene named {', '.join(sorted(unknown))} in {args.file}")
+        manifest = {"file": args.file, "scenes": {}}
+        for cls in scenes:
+            if args.scenes and cls.__name__ not in args.scenes:
+                continue
+            schedule = compile_timeline(record(cls), args.segments)
+            manifest["scenes"][schedule.name] = schedule.to_dict()
+            cuts = " ".join(f"{first}-{last}" for first, last, _, _, _ in schedule.segments)
+            print(f"{schedule.name:22s} {schedule.duration:7.1f} s  "
+                  f"{len(schedule.timeline.steps):4d} steps  "
+                  f"{schedule.static_seconds:6.1f} s static  "
+                  f"{len(schedule.texts):4d} texts  segments {cuts}")
+    finally:
+        os.chdir(cwd)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(manifest, f, indent=1)
+        print(f"wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
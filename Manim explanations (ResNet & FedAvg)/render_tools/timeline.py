@@ -0,0 +1,105 @@
+# timeline.py
+"""Declarative timelines of Manim scenes.
+
+A ``Timeline`` is the flat sequence of ``self.play`` and ``self.wait``
+calls a scene makes, one ``Step`` per call. Steps use Manim's own
+numbering, the numbers that ``manim -n first,last`` takes. Each step
+records:
+
+* ``kind`` - ``"play"`` or ``"wait"``
+* ``run_time`` - seconds of video it produces
+* ``animations`` - class names of its animations
+* ``static`` - True if every frame of the step is the same image
+* ``mobjects`` - mobjects on screen after the step, if known
+
+The timeline also lists every text and TeX string the scene typesets.
+
+A timeline can be written directly,
+
+    t = Timeline("Intro")
+    t.text("What is a function?")
+    t.play("Write", run_time=1.5)
+    t.wait(2)
+
+or lowered from an existing ``Scene`` by ``record.record``. Either way it
+is plain data, and ``compiler.compile_timeline`` turns it into a render
+schedule without drawing a frame.
+"""
+
+KINDS = ("play", "wait")
+TEXT_KINDS = ("text", "markup", "tex")
+
+
+class Step:
+    """One ``play`` or ``wait`` call."""
+
+    __slots__ = ("kind", "run_time", "animations", "static", "mobjects")
+
+    def __init__(self, kind, run_time, animations=(), static=False, mobjects=None):
+        if kind not in KINDS:
+            raise ValueError(f"step kind must be one of {KINDS}, got {kind!r}")
+        if run_time < 0:
+            raise ValueError(f"run_time must be non-negative, got {run_time}")
+        self.kind = kind
+        self.run_time = float(run_time)
+        self.animations = list(animations)
+        self.static = bool(static)
+        self.mobjects = mobjects
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(**d)
+
+
+class Timeline:
+    """Steps and typeset strings of one scene, in the order the scene makes them."""
+
+    def __init__(self, name, steps=(), texts=()):
+        self.name = name
+        self.steps = list(steps)
+        self.texts = []
+        self._seen = set()
+        for kind, source in texts:
+            self.add_text(kind, source)
+
+    def play(self, *animations, run_time=1.0, mobjects=None):
+        self.steps.append(Step("play", run_time, animations, False, mobjects))
+        return self
+
+    def wait(self, duration=1.0, static=True, mobjects=None):
+        self.steps.append(Step("wait", duration, (), static, mobjects))
+        return self
+
+    def add_text(self, kind, source):
+        """Log one typeset string; repeats of a (kind, source) pair are kept once."""
+        if kind not in TEXT_KINDS:
+            raise ValueError(f"text kind must be one of {TEXT_KINDS}, got {kind!r}")
+        key = (kind, source)
+        if key not in self._seen:
+            self._seen.add(key)
+            self.texts.append(key)
+        return self
+
+    def text(self, source):
+        return self.add_text("text", source)
+
+    def tex(self, source):
+        return self.add_text("tex", source)
+
+    @property
+    def duration(self):
+        return sum(step.run_time for step in self.steps)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "steps": [step.to_dict() for step in self.steps],
+            "texts": [list(t) for t in self.texts],
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d["name"], [Step.from_dict(s) for s in d["steps"]], d.get("texts", ()))
@@ -0,0 +1,105 @@
+# worker.py
+"""Render one scene, or one segment of it, under a memory budget.
+
+This is ``manim -q<quality> -n first,last -o <output> FILE SCENE`` run in
+process, so that a ``MemoryMonitor`` can wrap the scene:
+
+    python -m render_tools.worker FedAvg_Manim/federated_averaging.py FederatedAveraging \\
+        --segment 0,40 --quality h --budget 1.5G --report part00.json
+
+The report lists memory per step, plus a summary per segment when
+``--segments`` names the ranges of a whole-scene render. The exit status
+is 0 on success and ``EXIT_OVER_BUDGET`` when the budget was exceeded,
+which tells a scheduler to retry the job with fewer workers beside it.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from manim import QUALITIES, tempconfig
+
+from .memory import (
+    EXIT_OVER_BUDGET, MemoryBudgetExceeded, MemoryMonitor, parse_bytes, set_hard_limit,
+)
+from .record import load_scenes
+
+QUALITY_FLAGS = {q["flag"]: name for name, q in QUALITIES.items() if q["flag"]}
+
+
+def parse_range(text):
+    first, _, last = text.partition(",")
+    return int(first), int(last) if last else -1
+
+
+def render(path, scene_name, segment=None, quality="l", output=None, budget=None,
+           release=True, min_bytes=1 << 16):
+    """Render ``scene_name`` from ``path``; returns the monitor with its rows."""
+    if quality not in QUALITY_FLAGS:
+        raise ValueError(f"quality must be one of {sorted(QUALITY_FLAGS)}, got {quality!r}")
+    scenes = {cls.__name__: cls for cls in load_scenes(path)}
+    if scene_name not in scenes:
+        raise ValueError(f"no scene named {scene_name} in {path}")
+    options = {"quality": QUALITY_FLAGS[quality]}
+    if segment is not None:
+        options["from_animation_number"], options["upto_animation_number"] = segment
+    if output:
+        options["output_file"] = output
+    with tempconfig(options):
+        scene = scenes[scene_name]()
+        monitor = MemoryMonitor(scene, budget, release, min_bytes)
+        try:
+            scene.render()
+        except MemoryBudgetExceeded as e:
+            e.monitor = monitor
+            raise
+        finally:
+            monitor.close()
+    return monitor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a Manim scene segment under a memory budget.")
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument("--segment", type=parse_range, help="first,last step (manim -n)")
+    parser.add_argument("--segments", nargs="+", type=parse_range, default=(),
+                        help="step ranges to summarise in the report")
+    parser.add_argument("--quality", default="l")
+    parser.add_argument("-o", "--output", help="movie name (manim -o)")
+    parser.add_argument("--budget", type=parse_bytes, help="soft RSS cap, e.g. 1.5G")
+    parser.add_argument("--hard-limit", type=parse_bytes, help="address-space cap, e.g. 6G")
+    parser.add_argument("--no-release", action="store_true", help="keep off-screen mobjects in memory")
+    parser.add_argument("--report", help="write per-step memory rows as JSON")
+    args = parser.parse_args()
+
+    if args.hard_limit:
+        set_hard_limit(args.hard_limit)
+    path = os.path.abspath(args.file)
+    report = os.path.abspath(args.report) if args.report else None
+    os.chdir(os.path.dirname(path))
+    status = 0
+    monitor = None
+    try:
+        monitor = render(path, args.scene, args.segment, args.quality, args.output,
+                         args.budget, not args.no_release)
+    except MemoryBudgetExceeded as e:
+        print(f"{args.scene}: {e}", file=sys.stderr)
+        monitor = e.monitor
+        status = EXIT_OVER_BUDGET
+
+    if monitor is not None:
+        rows = monitor.rows
+        peak = max((r["rss"] for r in rows), default=0)
+        print(f"{args.scene}: {len(rows)} steps, peak RSS {peak / 2**20:.0f} MiB, "
+              f"released {monitor.released_bytes / 2**20:.1f} MiB")
+        if report:
+            with open(report, "w") as f:
+                json.dump({"scene": args.scene, "segment": args.segment, "rows": rows,
+                           "segments": monitor.segment_summary(args.segments)}, f, indent=1)
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()